@@ -16,6 +16,10 @@ import re
 import sqlite3
 import hashlib
 import json
+import threading
+import zlib
+import weakref
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import List, Optional
 
@@ -24,6 +28,16 @@ USER_DATA_DIR = os.path.join(os.path.expanduser("~"), "KFIT_Data")
 os.makedirs(USER_DATA_DIR, exist_ok=True)
 DB_PATH = os.path.join(USER_DATA_DIR, "kfit_local.db")
 
+# --- Precompiled Patterns ---
+# [성능] 정규화 헬퍼(백필/마이그레이션 행마다 호출)의 패턴을 모듈 로드 시 1회만 컴파일 (queries.py와 같은 방식)
+_RE_NON_DIGIT = re.compile(r"\D")
+_RE_WS = re.compile(r"\s+")
+_RE_NAME_STRIP = re.compile(r"[^0-9a-zA-Z가-힣\*]")
+_RE_NON_ALNUM = re.compile(r"[^0-9a-zA-Z]")
+_RE_ISO_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_RE_ISO_DATE_PREFIX = re.compile(r"^\d{4}-\d{2}-\d{2}")
+_RE_BRACKETS = re.compile(r"[\(\)\[\]\{\}]")
+
 
 def _get_columns(cur: sqlite3.Cursor, table_name: str) -> List[str]:
     """[Helper] 현재 테이블의 메타데이터(컬럼 정보) 조회"""
@@ -46,7 +60,7 @@ def _ensure_column(cur: sqlite3.Cursor, table: str, column: str, col_type: str)
 def _normalize_phone(phone: Optional[str]) -> str:
     """[전처리] 전화번호 정규화 (중복 제거를 위한 Unique Key 생성 전단계)"""
     if phone is None: return ""
-    return re.sub(r"\D", "", str(phone))
+    return _RE_NON_DIGIT.sub("", str(phone))
 
 
 def _make_match_key(name: Optional[str], phone: Optional[str]) -> str:
@@ -67,22 +81,22 @@ def _norm_text(x: object) -> str:
     if x is None:
         return ""
     s = str(x).strip()
-    s = re.sub(r"\s+", " ", s)
+    s = _RE_WS.sub(" ", s)
     return s.lower()
 
 def _norm_name(x: object) -> str:
     s = _norm_text(x)
-    s = re.sub(r"[^0-9a-zA-Z가-힣\*]", "", s)
+    s = _RE_NAME_STRIP.sub("", s)
     return s
 
 def _norm_birth(x: object) -> str:
-    s = re.sub(r"\D", "", str(x or ""))
+    s = _RE_NON_DIGIT.sub("", str(x or ""))
     return s[:8] if len(s) >= 8 else s
 
 def _norm_policy_no(x: object) -> str:
     s = str(x or "").strip()
-    s = re.sub(r"\s+", "", s)
-    s = re.sub(r"[^0-9a-zA-Z]", "", s)
+    s = _RE_WS.sub("", s)
+    s = _RE_NON_ALNUM.sub("", s)
     return s.upper()
 
 def _norm_date(x: object) -> str:
@@ -92,54 +106,68 @@ def _norm_date(x: object) -> str:
     if s == "" or s.lower() in ("nan", "none"):
         return ""
     # 이미 YYYY-MM-DD 형태면 그대로
-    if re.match(r"^\d{4}-\d{2}-\d{2}$", s):
+    if _RE_ISO_DATE.match(s):
         return s
     # 'YYYY-MM-DD ...' 형태면 앞 10자리
-    if len(s) >= 10 and re.match(r"^\d{4}-\d{2}-\d{2}", s):
+    if len(s) >= 10 and _RE_ISO_DATE_PREFIX.match(s):
         return s[:10]
     # 8자리 숫자면 YYYY-MM-DD로
-    d = re.sub(r"\D", "", s)
+    d = _RE_NON_DIGIT.sub("", s)
     if len(d) >= 8:
         return f"{d[0:4]}-{d[4:6]}-{d[6:8]}"
-    return re.sub(r"\s+", "", s).lower()
+    return _RE_WS.sub("", s).lower()
 
 def _norm_premium(x: object) -> int:
     try:
-        return int(re.sub(r"\D", "", str(x or "")) or 0)
+        return int(_RE_NON_DIGIT.sub("", str(x or "")) or 0)
     except Exception:
         return 0
 
-def _sha1(s: str) -> str:
-    return hashlib.sha1(s.encode("utf-8")).hexdigest()
+def _dedup_hash(s: str) -> bytes:
+    # queries._dedup_hash와 동일(BLAKE2b-128, 16바이트 BLOB). 구버전 SHA1(40자)은 재계산, hex(32자)는 init_db에서 BLOB 변환
+    return hashlib.blake2b(s.encode("utf-8"), digest_size=16).digest()
+
+def _dedup_hash_parts(*parts: str) -> bytes:
+    # _dedup_hash("|".join(parts))와 동일 (join 후 1회 해시: 조각별 update보다 빠름)
+    return _dedup_hash("|".join(parts))
+
+# init_db 계약 해시 마이그레이션 단계(PRAGMA user_version): 1 = BLAKE2b 재계산 + BLOB 저장 전환 완료
+_CONTRACT_HASH_SCHEMA_VERSION = 1
+
+def _hex_hash_to_blob(v: object) -> object:
+    # hex 32자(BLAKE2b-128) 문자열 → 16바이트. 그 외(NULL/SHA1 40자/이미 BLOB)는 그대로
+    if isinstance(v, str) and len(v) == 32:
+        try:
+            return bytes.fromhex(v)
+        except ValueError:
+            return v
+    return v
 
 def _contract_key_hash(customer_id: int, company: object, policy_no: object, product_name: object,
-                       start_date: object, premium: object, insured_birth: object = None, insured_name: object = None) -> str:
+                       start_date: object, premium: object, insured_birth: object = None, insured_name: object = None) -> bytes:
     cid = str(customer_id or "")
     comp = _norm_text(company)
     pol = _norm_policy_no(policy_no)
     if pol:
-        base = "|".join(["P", cid, comp, pol])
-    else:
-        discr = _norm_birth(insured_birth) or _norm_name(insured_name)
-        base = "|".join([
-            "N", cid, comp, _norm_text(product_name), _norm_date(start_date), str(_norm_premium(premium)), discr
-        ])
-    return _sha1(base)
+        return _dedup_hash_parts("P", cid, comp, pol)
+    discr = _norm_birth(insured_birth) or _norm_name(insured_name)
+    return _dedup_hash_parts(
+        "N", cid, comp, _norm_text(product_name), _norm_date(start_date), str(_norm_premium(premium)), discr
+    )
 
 def _contract_stable_hash(customer_id: int, company: object, product_name: object, start_date: object, premium: object,
-                          insured_birth: object = None, insured_name: object = None, insured_gender: object = None) -> str:
+                          insured_birth: object = None, insured_name: object = None, insured_gender: object = None) -> bytes:
     cid = str(customer_id or "")
     comp = _norm_text(company)
     discr = _norm_birth(insured_birth) or _norm_name(insured_name)
     gen = _norm_text(insured_gender)
-    base = "|".join(["S", cid, comp, _norm_text(product_name), _norm_date(start_date), str(_norm_premium(premium)), discr, gen])
-    return _sha1(base)
+    return _dedup_hash_parts("S", cid, comp, _norm_text(product_name), _norm_date(start_date), str(_norm_premium(premium)), discr, gen)
 
 def _contract_content_hash(customer_id: int, company: object, product_name: object, policy_no: object, premium: object,
                            status: object, start_date: object, end_date: object,
                            insured_name: object, insured_phone: object, insured_birth: object, insured_gender: object,
-                           coverage_summary: object) -> str:
-    base = "|".join([
+                           coverage_summary: object) -> bytes:
+    return _dedup_hash_parts(
         str(customer_id or ""),
         _norm_text(company),
         _norm_text(product_name),
@@ -153,8 +181,230 @@ def _contract_content_hash(customer_id: int, company: object, product_name: obje
         _norm_birth(insured_birth),
         _norm_text(insured_gender),
         _norm_text(coverage_summary),
-    ])
-    return _sha1(base)
+    )
+
+
+def _contract_row_hashes(r: tuple) -> tuple:
+    """contracts 백필용 14컬럼 행(id, customer_id, company, product_name, policy_no, premium, status,
+    start_date, end_date, insured_name, insured_phone, insured_birth, insured_gender, coverage_summary)
+    → (key_hash, stable_hash, content_hash)"""
+    (_rid, customer_id, company, product_name, policy_no, premium, status, start_date, end_date,
+     insured_name, insured_phone, insured_birth, insured_gender, coverage_summary) = r
+    return (
+        _contract_key_hash(customer_id, company, policy_no, product_name, start_date, premium, insured_birth, insured_name),
+        _contract_stable_hash(customer_id, company, product_name, start_date, premium, insured_birth, insured_name, insured_gender),
+        _contract_content_hash(customer_id, company, product_name, policy_no, premium, status, start_date, end_date,
+                               insured_name, insured_phone, insured_birth, insured_gender, coverage_summary),
+    )
+
+
+_UPLOAD_HOLDS_FTS_TEXT = (
+    "COALESCE({p}.row_payload_json,'') || char(10) || COALESCE({p}.normalized_json,'') || char(10) || "
+    "COALESCE({p}.corrected_json,'') || char(10) || COALESCE({p}.candidates_json,'')"
+)
+
+def _ensure_upload_holds_fts(c: sqlite3.Cursor) -> None:
+    """upload_holds 키워드 검색용 FTS5 테이블/트리거 생성(최초 생성 시 기존 행 색인)."""
+    try:
+        c.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='upload_holds_fts'")
+        created = c.fetchone() is None
+        c.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS upload_holds_fts "
+            "USING fts5(reason_msg, raw_text, tokenize='trigram')"
+        )
+        c.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_upload_holds_fts_ai AFTER INSERT ON upload_holds BEGIN
+                INSERT INTO upload_holds_fts(rowid, reason_msg, raw_text)
+                VALUES (new.id, COALESCE(new.reason_msg,''), {_UPLOAD_HOLDS_FTS_TEXT.format(p="new")});
+            END
+        """)
+        c.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_upload_holds_fts_au
+            AFTER UPDATE OF reason_msg, row_payload_json, normalized_json, corrected_json, candidates_json ON upload_holds
+            BEGIN
+                DELETE FROM upload_holds_fts WHERE rowid = old.id;
+                INSERT INTO upload_holds_fts(rowid, reason_msg, raw_text)
+                VALUES (new.id, COALESCE(new.reason_msg,''), {_UPLOAD_HOLDS_FTS_TEXT.format(p="new")});
+            END
+        """)
+        c.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_upload_holds_fts_ad AFTER DELETE ON upload_holds BEGIN
+                DELETE FROM upload_holds_fts WHERE rowid = old.id;
+            END
+        """)
+        if created:
+            c.execute(f"""
+                INSERT INTO upload_holds_fts(rowid, reason_msg, raw_text)
+                SELECT id, COALESCE(reason_msg,''), {_UPLOAD_HOLDS_FTS_TEXT.format(p="upload_holds")} FROM upload_holds
+            """)
+    except sqlite3.Error:
+        pass
+
+
+_CONTRACTS_PH_FTS_WHEN = "COALESCE({p}.policyholder_type,'') = 'CORP' AND COALESCE({p}.policyholder_norm,'') <> ''"
+
+def _ensure_contracts_ph_fts(c: sqlite3.Cursor) -> None:
+    """법인 계약자 검색용 FTS5 테이블/트리거 생성(최초 생성 시 기존 법인 계약 색인).
+
+    - rowid = contracts.id, 법인(CORP) 계약의 policyholder_norm만 색인
+    """
+    try:
+        c.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='contracts_ph_fts'")
+        created = c.fetchone() is None
+        c.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS contracts_ph_fts "
+            "USING fts5(policyholder_norm, tokenize='trigram')"
+        )
+        c.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_contracts_ph_fts_ai AFTER INSERT ON contracts
+            WHEN {_CONTRACTS_PH_FTS_WHEN.format(p="new")}
+            BEGIN
+                INSERT INTO contracts_ph_fts(rowid, policyholder_norm) VALUES (new.id, new.policyholder_norm);
+            END
+        """)
+        c.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_contracts_ph_fts_au
+            AFTER UPDATE OF policyholder_type, policyholder_norm ON contracts
+            BEGIN
+                DELETE FROM contracts_ph_fts WHERE rowid = old.id;
+                INSERT INTO contracts_ph_fts(rowid, policyholder_norm)
+                SELECT new.id, new.policyholder_norm WHERE {_CONTRACTS_PH_FTS_WHEN.format(p="new")};
+            END
+        """)
+        c.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_contracts_ph_fts_ad AFTER DELETE ON contracts BEGIN
+                DELETE FROM contracts_ph_fts WHERE rowid = old.id;
+            END
+        """)
+        if created:
+            c.execute(f"""
+                INSERT INTO contracts_ph_fts(rowid, policyholder_norm)
+                SELECT id, policyholder_norm FROM contracts WHERE {_CONTRACTS_PH_FTS_WHEN.format(p="contracts")}
+            """)
+    except sqlite3.Error:
+        pass
+
+
+_DASHBOARD_CACHE_SOURCES = (
+    ("tasks", "customer_id, type, status, due_date"),
+    ("contracts", "customer_id, company, product_name, policy_no, status, start_date, end_date"),
+    ("customers", "name"),
+)
+
+def _ensure_dashboard_cache(c: sqlite3.Cursor) -> None:
+    """대시보드 결과 캐시 테이블 + 원본(tasks/contracts/customers) 변경 시 캐시 비우는 트리거 생성."""
+    try:
+        c.execute("""
+            CREATE TABLE IF NOT EXISTS dashboard_cache (
+                scope TEXT PRIMARY KEY,
+                payload BLOB,
+                computed_at REAL
+            )
+        """)
+        for table, cols in _DASHBOARD_CACHE_SOURCES:
+            for ev, on in (("ai", "INSERT"), ("au", f"UPDATE OF {cols}"), ("ad", "DELETE")):
+                c.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS trg_{table}_dash_cache_{ev} AFTER {on} ON {table} BEGIN
+                        DELETE FROM dashboard_cache;
+                    END
+                """)
+    except sqlite3.Error:
+        pass
+
+
+def _status_delta(p: str, sign: str) -> str:
+    return (
+        f"row_count = row_count {sign} 1, "
+        f"open_count = open_count {sign} (COALESCE({p}.status,'')='OPEN'), "
+        f"resolved_count = resolved_count {sign} (COALESCE({p}.status,'')='RESOLVED'), "
+        f"skipped_count = skipped_count {sign} (COALESCE({p}.status,'')='SKIPPED')"
+    )
+
+
+def _ensure_upload_batches(c: sqlite3.Cursor) -> None:
+    """업로드 배치(file_hash)별 보류 건수 요약 테이블/트리거 생성(최초 생성 시 기존 행 집계).
+
+    - filename = 배치 내 MAX(filename), created_at = MIN(created_at) (기존 GROUP BY 집계와 동일)
+    - 트리거로 upload_holds INSERT/상태·파일명 변경/DELETE 시 해당 배치 1행만 증감
+    """
+    try:
+        c.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='upload_batches'")
+        created = c.fetchone() is None
+        c.execute("""
+            CREATE TABLE IF NOT EXISTS upload_batches (
+                file_hash TEXT PRIMARY KEY,
+                filename TEXT,
+                created_at DATETIME,
+                row_count INTEGER NOT NULL DEFAULT 0,
+                open_count INTEGER NOT NULL DEFAULT 0,
+                resolved_count INTEGER NOT NULL DEFAULT 0,
+                skipped_count INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        c.execute("CREATE INDEX IF NOT EXISTS idx_upload_batches_created ON upload_batches(created_at)")
+        c.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_upload_holds_batch_ai AFTER INSERT ON upload_holds BEGIN
+                INSERT OR IGNORE INTO upload_batches(file_hash, filename, created_at) VALUES (new.file_hash, new.filename, new.created_at);
+                UPDATE upload_batches
+                   SET {_status_delta("new", "+")},
+                       filename = CASE WHEN new.filename IS NOT NULL AND (filename IS NULL OR new.filename > filename)
+                                       THEN new.filename ELSE filename END,
+                       created_at = CASE WHEN new.created_at IS NOT NULL AND (created_at IS NULL OR new.created_at < created_at)
+                                         THEN new.created_at ELSE created_at END
+                 WHERE file_hash = new.file_hash;
+            END
+        """)
+        c.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_upload_holds_batch_au_status
+            AFTER UPDATE OF status ON upload_holds WHEN old.status IS NOT new.status
+            BEGIN
+                UPDATE upload_batches SET {_status_delta("old", "-")} WHERE file_hash = old.file_hash;
+                UPDATE upload_batches SET {_status_delta("new", "+")} WHERE file_hash = new.file_hash;
+            END
+        """)
+        # 파일명이 커지면(또는 같으면) 그대로 반영, 작아지는 드문 경우에만 배치 내 MAX를 다시 계산
+        c.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_upload_holds_batch_au_filename
+            AFTER UPDATE OF filename ON upload_holds WHEN old.filename IS NOT new.filename
+            BEGIN
+                UPDATE upload_batches
+                   SET filename = CASE WHEN new.filename IS NOT NULL AND (filename IS NULL OR new.filename >= filename)
+                                       THEN new.filename
+                                       ELSE (SELECT MAX(filename) FROM upload_holds WHERE file_hash = new.file_hash) END
+                 WHERE file_hash = new.file_hash;
+            END
+        """)
+        c.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_upload_holds_batch_au_created
+            AFTER UPDATE OF created_at ON upload_holds WHEN old.created_at IS NOT new.created_at
+            BEGIN
+                UPDATE upload_batches
+                   SET created_at = (SELECT MIN(created_at) FROM upload_holds WHERE file_hash = new.file_hash)
+                 WHERE file_hash = new.file_hash;
+            END
+        """)
+        c.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_upload_holds_batch_ad AFTER DELETE ON upload_holds BEGIN
+                UPDATE upload_batches
+                   SET {_status_delta("old", "-")},
+                       filename = (SELECT MAX(filename) FROM upload_holds WHERE file_hash = old.file_hash),
+                       created_at = (SELECT MIN(created_at) FROM upload_holds WHERE file_hash = old.file_hash)
+                 WHERE file_hash = old.file_hash;
+                DELETE FROM upload_batches WHERE file_hash = old.file_hash AND row_count <= 0;
+            END
+        """)
+        if created:
+            c.execute("""
+                INSERT INTO upload_batches(file_hash, filename, created_at, row_count, open_count, resolved_count, skipped_count)
+                SELECT file_hash, MAX(filename), MIN(created_at), COUNT(*),
+                       SUM(CASE WHEN status='OPEN' THEN 1 ELSE 0 END),
+                       SUM(CASE WHEN status='RESOLVED' THEN 1 ELSE 0 END),
+                       SUM(CASE WHEN status='SKIPPED' THEN 1 ELSE 0 END)
+                  FROM upload_holds
+                 GROUP BY file_hash
+            """)
+    except sqlite3.Error:
+        pass
 
 
 def init_db() -> None:
@@ -162,6 +412,11 @@ def init_db() -> None:
     [시스템 초기화 루틴]
     데이터베이스 연결을 수립하고 테이블 무결성을 검증하며 스키마를 최신화함.
     """
+    # DB 파일이 새로 만들어졌을 수 있으므로 다음 연결에서 WAL을 다시 설정
+    _KFIT_WAL_READY.discard(DB_PATH)
+    if not os.path.exists(DB_PATH):
+        # 파일이 지워진 뒤라면 풀에 남은 연결은 옛 파일을 가리킴 → 비움
+        close_connection_pool()
     conn = sqlite3.connect(DB_PATH)
     conn.execute("PRAGMA foreign_keys = ON") # 참조 무결성 강제
     c = conn.cursor()
@@ -209,6 +464,21 @@ def init_db() -> None:
                 "family_info", "saju_info", "match_key", "stable_hash", "last_contact", "next_plan", "custom_data", "memo"]:
         _ensure_column(c, "customers", col, "TEXT")
 
+    # [성능] 고객 후보 조회용 인덱스
+    # - match_key: 마스킹 계약 일괄 반영 / 보류 후보(2차)
+    # - phone_norm: 보류 후보(1차) / 연락처 기준 upsert
+    # - (공백 제거 이름, 생년월일): 보류 후보(3차) — 쿼리의 REPLACE(name, ' ', '')와 같은 식의 표현식 인덱스
+    for ddl in (
+        "CREATE INDEX IF NOT EXISTS idx_customers_match_key ON customers(match_key)",
+        "CREATE INDEX IF NOT EXISTS idx_customers_phone_norm ON customers(phone_norm)",
+        "CREATE INDEX IF NOT EXISTS idx_customers_name_birth ON customers(REPLACE(name, ' ', ''), birth_date)",
+    ):
+        try:
+            c.execute(ddl)
+        except Exception:
+            # 표현식 인덱스 미지원(구버전 SQLite) 등은 성능만 저하
+            pass
+
     # -----------------------------------------------------------
     # 2. Tasks 테이블: 영업 비서 스케줄러
     # -----------------------------------------------------------
@@ -244,6 +514,20 @@ def init_db() -> None:
         )
     """)
 
+    # [성능] 대시보드/상담 조회용 인덱스
+    # - tasks(status, due_date): 대시보드 미완료 할일(status='미완료' + 기한 범위)
+    # - consultations(customer_id, consult_date DESC): 고객별 상담이력(최신순)
+    # - consultations(consult_date): 이번 달 상담 건수(날짜 범위) / 최근 활동(최신순 LIMIT)
+    for ddl in (
+        "CREATE INDEX IF NOT EXISTS idx_tasks_status_due ON tasks(status, due_date)",
+        "CREATE INDEX IF NOT EXISTS idx_consult_customer_date ON consultations(customer_id, consult_date DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_consult_date ON consultations(consult_date)",
+    ):
+        try:
+            c.execute(ddl)
+        except Exception:
+            pass
+
     # -----------------------------------------------------------
     # 4. Contracts 테이블: 금융 계약 정보 (Financial Data)
     # [특허 포인트: 1:N 관계의 자동 정규화 저장소]
@@ -292,9 +576,12 @@ def init_db() -> None:
     for col in [
         "insured_name", "insured_phone", "insured_birth", "insured_gender",
         "policyholder_name", "policyholder_type", "policyholder_norm", "policyholder_phone", "primary_role",
-        "policy_no_norm", "stable_hash", "key_hash", "content_hash",
+        "policy_no_norm",
     ]:
         _ensure_column(c, "contracts", col, "TEXT")
+    # [성능] 계약 해시는 16바이트 BLOB으로 저장(신규 DB는 BLOB 선언, 기존 TEXT 선언 컬럼도 BLOB 값은 변환 없이 보관)
+    for col in ["stable_hash", "key_hash", "content_hash"]:
+        _ensure_column(c, "contracts", col, "BLOB")
 
 
     # -----------------------------------------------------------
@@ -309,6 +596,48 @@ def init_db() -> None:
         # SQLite 구버전/권한 문제 등에서 인덱스 생성 실패 시에도 기능은 동작 가능(성능만 저하)
         pass
 
+    # [성능] 대시보드 조회용 인덱스
+    # - contracts(status, end_date): 갱신 알림(status='정상' + 만기일 범위)
+    # - contracts(customer_id, start_date DESC, id DESC): 고객별 대표 계약(최근 개시일 1건)
+    for ddl in (
+        "CREATE INDEX IF NOT EXISTS idx_contracts_status_end ON contracts(status, end_date)",
+        "CREATE INDEX IF NOT EXISTS idx_contracts_customer ON contracts(customer_id, start_date DESC, id DESC)",
+    ):
+        try:
+            c.execute(ddl)
+        except Exception:
+            pass
+
+    # [성능] 법인 계약자 검색용 FTS5(trigram) 색인
+    # - policyholder_norm LIKE '%q%' 전수 검사 → 3글자 이상 검색어는 trigram 색인으로 후보 rowid만 조회
+    # - FTS5/trigram 미지원 환경에서는 생성 실패 → 검색이 LIKE로 자동 후퇴
+    _ensure_contracts_ph_fts(c)
+
+    # [성능] 계약 표시용 뷰: 표시 규칙(계약자≠피보험자면 계약자, 아니면 피보험자) CASE를 한 곳에서 정의
+    # - get_customer_contracts / search_corporate_contracts가 같은 뷰를 읽어 중복 CASE/REPLACE 제거
+    # - insured_name은 표시용 이름으로 치환, 원본은 insured_name_raw
+    try:
+        c.execute("""
+            CREATE VIEW IF NOT EXISTS v_contracts_display AS
+            SELECT
+                id, customer_id,
+                company, product_name, policy_no, policy_no_norm,
+                premium, status, start_date, end_date, coverage_summary,
+                insured_phone, insured_birth, insured_gender,
+                insured_name AS insured_name_raw,
+                policyholder_name, policyholder_type, policyholder_norm, policyholder_phone, primary_role,
+                CASE WHEN party_split THEN policyholder_name ELSE insured_name END AS insured_name,
+                CASE WHEN party_split THEN '계' ELSE '피' END AS display_party_label
+            FROM (
+                SELECT *,
+                       (policyholder_name <> '' AND insured_name <> ''
+                        AND REPLACE(policyholder_name,' ','') <> REPLACE(insured_name,' ','')) AS party_split
+                FROM contracts
+            )
+        """)
+    except Exception:
+        pass
+
     # -----------------------------------------------------------
     # [데이터(db포함) 오류] 기존 데이터 백필(호환성 유지)
     # - 기존 contracts 레코드에는 policyholder_*가 비어있을 수 있음
@@ -332,7 +661,7 @@ def init_db() -> None:
         n2 = n.replace(" ", "")
         for k in ["(주)", "㈜", "주식회사", "유한회사", "재단법인", "사단법인"]:
             n2 = n2.replace(k, "")
-        n2 = re.sub(r"[\(\)\[\]\{\}]", "", n2)
+        n2 = _RE_BRACKETS.sub("", n2)
         return n2
 
     try:
@@ -365,15 +694,15 @@ def init_db() -> None:
                       FROM contracts
                       WHERE (key_hash IS NULL OR key_hash = '') OR (content_hash IS NULL OR content_hash = '')""")
         rows = c.fetchall()
+        # [성능] 행별 execute 대신 해시를 먼저 모두 계산한 뒤 executemany 1회로 반영
+        params = []
         for r in rows:
-            (rid, customer_id, company, product_name, policy_no, premium, status, start_date, end_date,
-             insured_name, insured_phone, insured_birth, insured_gender, coverage_summary) = r
-            kh = _contract_key_hash(customer_id, company, policy_no, product_name, start_date, premium, insured_birth, insured_name)
-            pn = _norm_policy_no(policy_no)
-            sh = _contract_stable_hash(customer_id, company, product_name, start_date, premium, insured_birth, insured_name, insured_gender)
-            ch = _contract_content_hash(customer_id, company, product_name, policy_no, premium, status, start_date, end_date,
-                                        insured_name, insured_phone, insured_birth, insured_gender, coverage_summary)
-            c.execute("UPDATE contracts SET policy_no_norm = ?, stable_hash = ?, key_hash = ?, content_hash = ? WHERE id = ?", (pn, sh, kh, ch, rid))
+            kh, sh, ch = _contract_row_hashes(r)
+            params.append((_norm_policy_no(r[4]), sh, kh, ch, r[0]))
+        c.executemany(
+            "UPDATE contracts SET policy_no_norm = ?, stable_hash = ?, key_hash = ?, content_hash = ? WHERE id = ?",
+            params,
+        )
 
         # -----------------------------------------------------------
         # [추가] policy_no_norm / stable_hash 백필 (기존 key_hash 보유 데이터 포함)
@@ -384,11 +713,17 @@ def init_db() -> None:
                       FROM contracts
                       WHERE (policy_no_norm IS NULL OR policy_no_norm = '')
                          OR (stable_hash IS NULL OR stable_hash = '')""")
-        for rr in c.fetchall():
-            rid2, customer_id2, company2, product_name2, policy_no2, premium2, start_date2, insured_name2, insured_birth2, insured_gender2 = rr
-            pn2 = _norm_policy_no(policy_no2)
-            sh2 = _contract_stable_hash(customer_id2, company2, product_name2, start_date2, premium2, insured_birth2, insured_name2, insured_gender2)
-            c.execute("UPDATE contracts SET policy_no_norm = ?, stable_hash = ? WHERE id = ?", (pn2, sh2, rid2))
+        c.executemany(
+            "UPDATE contracts SET policy_no_norm = ?, stable_hash = ? WHERE id = ?",
+            [
+                (_norm_policy_no(policy_no2),
+                 _contract_stable_hash(customer_id2, company2, product_name2, start_date2, premium2,
+                                       insured_birth2, insured_name2, insured_gender2),
+                 rid2)
+                for (rid2, customer_id2, company2, product_name2, policy_no2, premium2, start_date2,
+                     insured_name2, insured_birth2, insured_gender2) in c.fetchall()
+            ],
+        )
 
         # key_hash가 있는 데이터만 대상으로 중복 제거 (NULL/빈값은 제외)
         c.execute("""
@@ -403,15 +738,70 @@ def init_db() -> None:
 
         # UNIQUE INDEX (중복 원천 봉쇄)
         c.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_contracts_key_hash ON contracts(key_hash)")
-        c.execute("CREATE INDEX IF NOT EXISTS idx_contracts_policy_no_norm ON contracts(customer_id, policy_no_norm)")
-        c.execute("CREATE INDEX IF NOT EXISTS idx_contracts_stable_hash ON contracts(customer_id, stable_hash)")
+        # [성능] add_contract 2·3차 매칭용 커버링 인덱스
+        # - SELECT(id, content_hash, key_hash, policy_no_norm)를 인덱스만으로 처리(본 테이블 페이지 조회 생략)
+        # - 선두 컬럼이 같은 기존 단순 인덱스는 커버링 인덱스로 대체되므로 정리
+        c.execute("""CREATE INDEX IF NOT EXISTS idx_contracts_cust_polnorm_cov
+                     ON contracts(customer_id, policy_no_norm, content_hash, key_hash)""")
+        c.execute("""CREATE INDEX IF NOT EXISTS idx_contracts_cust_stable_cov
+                     ON contracts(customer_id, stable_hash, content_hash, key_hash, policy_no_norm)""")
+        c.execute("DROP INDEX IF EXISTS idx_contracts_policy_no_norm")
+        c.execute("DROP INDEX IF EXISTS idx_contracts_stable_hash")
+
+        # -----------------------------------------------------------
+        # [성능] 계약 해시 알고리즘 전환(SHA1 40자 → BLAKE2b-128) 1회 마이그레이션
+        # - PRAGMA user_version으로 1회만 실행(매 rerun마다 init_db가 불려도 전체 스캔 반복 없음)
+        # - 저장된 정규화 컬럼으로 재계산(업로드 시점 해시 입력과 동일)
+        # - key_hash가 다른 행과 충돌하면(기존에 key 유지로 업데이트된 행) key_hash만 구버전 값 유지
+        #   → 해당 행은 policy_no_norm/stable_hash 2차 매칭으로 계속 찾을 수 있고, 다음 실행에서 다시 시도하지 않음
+        # -----------------------------------------------------------
+        if c.execute("PRAGMA user_version").fetchone()[0] < _CONTRACT_HASH_SCHEMA_VERSION:
+            c.execute("""SELECT id, customer_id, company, product_name, policy_no, premium, status, start_date, end_date,
+                                 insured_name, insured_phone, insured_birth, insured_gender, coverage_summary
+                          FROM contracts
+                          WHERE length(key_hash) = 40 OR length(stable_hash) = 40 OR length(content_hash) = 40""")
+            rows = c.fetchall()
+            params = [(*_contract_row_hashes(r), r[0]) for r in rows]
+            try:
+                c.executemany("UPDATE contracts SET key_hash = ?, stable_hash = ?, content_hash = ? WHERE id = ?", params)
+            except sqlite3.IntegrityError:
+                # key_hash 충돌 행이 있으면 행 단위로 재적용(이미 반영된 행은 같은 값으로 다시 쓰여 결과 동일)
+                for kh, sh, ch, rid in params:
+                    try:
+                        c.execute("UPDATE contracts SET key_hash = ?, stable_hash = ?, content_hash = ? WHERE id = ?", (kh, sh, ch, rid))
+                    except sqlite3.IntegrityError:
+                        c.execute("UPDATE contracts SET stable_hash = ?, content_hash = ? WHERE id = ?", (sh, ch, rid))
+
+            # -----------------------------------------------------------
+            # [성능] 계약 해시 저장 형식 전환(hex TEXT 32자 → BLOB 16바이트) 1회 마이그레이션 (위 재계산과 같은 user_version 단계)
+            # - 동등 비교 전용 값이므로 원시 바이트로 저장: 행/인덱스 키 크기 절반 → 페이지당 항목 증가, 탐색 페이지 감소
+            # - 재계산 없이 bytes.fromhex로 값만 변환(key 유지로 갱신된 행의 기존 key도 그대로 보존)
+            # - 변환 후 REINDEX로 인덱스를 조밀하게 재구성
+            # -----------------------------------------------------------
+            c.execute("""SELECT id, key_hash, stable_hash, content_hash FROM contracts
+                          WHERE (typeof(key_hash) = 'text' AND length(key_hash) = 32)
+                             OR (typeof(stable_hash) = 'text' AND length(stable_hash) = 32)
+                             OR (typeof(content_hash) = 'text' AND length(content_hash) = 32)""")
+            params = [(_hex_hash_to_blob(kh), _hex_hash_to_blob(sh), _hex_hash_to_blob(ch), rid)
+                      for rid, kh, sh, ch in c.fetchall()]
+            if params:
+                try:
+                    c.executemany("UPDATE contracts SET key_hash = ?, stable_hash = ?, content_hash = ? WHERE id = ?", params)
+                except sqlite3.IntegrityError:
+                    for kh, sh, ch, rid in params:
+                        try:
+                            c.execute("UPDATE contracts SET key_hash = ?, stable_hash = ?, content_hash = ? WHERE id = ?", (kh, sh, ch, rid))
+                        except sqlite3.IntegrityError:
+                            c.execute("UPDATE contracts SET stable_hash = ?, content_hash = ? WHERE id = ?", (sh, ch, rid))
+                c.execute("REINDEX contracts")
+            c.execute(f"PRAGMA user_version = {_CONTRACT_HASH_SCHEMA_VERSION}")
     except Exception:
         # 구버전/환경차로 인한 예외는 앱 동작을 막지 않음
         pass
 
     # -----------------------------------------------------------
     # 5. Upload History: 업로드 파일 해시 기록 (실수 재업로드 방지)
-    # 동일 파일(sha256)이 동일 액션(full_upload / contracts_only)으로 다시 들어오면
+    # 동일 파일(file_hash: CRC32+크기, 과거 이력은 sha256)이 동일 액션(full_upload / contracts_only)으로 다시 들어오면
     # 앱에서 스킵/경고 처리할 수 있도록 DB에 기록합니다.
     # -----------------------------------------------------------
     c.execute("""
@@ -481,8 +871,27 @@ def init_db() -> None:
             UNIQUE(file_hash, row_no)
         )
     """)
-    c.execute("CREATE INDEX IF NOT EXISTS idx_upload_holds_status ON upload_holds(status)")
-    c.execute("CREATE INDEX IF NOT EXISTS idx_upload_holds_filehash ON upload_holds(file_hash)")
+    # [성능] 목록(상태 필터 + 최신순) 정렬을 인덱스 순서로 처리
+    # - (file_hash, row_no) 조회/배치 집계는 UNIQUE 제약의 자동 인덱스가 담당 → 중복 인덱스 제거
+    # - 상태 단일 인덱스는 (status, created_at, id)의 앞부분이므로 대체
+    # [성능] raw_json(원본 행 전체)은 검색/목록에 쓰이지 않으므로 zlib 압축 BLOB(raw_zlib)로 보관
+    # - 신규/갱신 행은 raw_json=NULL + raw_zlib, 기존 행은 raw_json 그대로(읽을 때 둘 다 지원)
+    _ensure_column(c, "upload_holds", "raw_zlib", "BLOB")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_upload_holds_status_created ON upload_holds(status, created_at, id)")
+    c.execute("DROP INDEX IF EXISTS idx_upload_holds_status")
+    c.execute("DROP INDEX IF EXISTS idx_upload_holds_filehash")
+
+    # [성능] 보류 키워드 검색용 FTS5(trigram) 색인
+    # - 기존 JSON 컬럼 LIKE '%kw%' 5회 전수 검사 → 3글자 이상 키워드는 trigram 색인으로 부분 문자열 검색
+    # - rowid = upload_holds.id, 트리거로 검색 대상 컬럼 변경 시에만 재색인
+    # - FTS5/trigram 미지원(SQLite 3.34 미만 등) 환경에서는 생성 실패 → 목록 조회가 LIKE로 자동 후퇴
+    _ensure_upload_holds_fts(c)
+
+    # [성능] 업로드 배치 목록용 요약 테이블(트리거 유지) → 목록 조회가 전체 보류 GROUP BY 없이 LIMIT건만 읽음
+    _ensure_upload_batches(c)
+
+    # [성능] 대시보드 위젯 결과 캐시(60초) — 원본 테이블 변경 시 트리거로 즉시 무효화
+    _ensure_dashboard_cache(c)
 
     c.execute("""
         CREATE TABLE IF NOT EXISTS hold_decisions (
@@ -562,37 +971,279 @@ if __name__ == "__main__":
 #
 # ⚠️ UI 영향 없음: DB 연결 설정만 보강(화면/레이아웃 변경 없음)
 # ----------------------------------------------------------------------
-def _kfit_apply_sqlite_pragmas(conn: sqlite3.Connection) -> None:
-    """SQLite 연결에 대해 안정성/경합 완화 PRAGMA를 적용한다."""
-    try:
-        conn.execute("PRAGMA foreign_keys = ON")
-    except Exception:
-        pass
+# [성능] 연결마다 적용하는 PRAGMA (연결 단위 설정이라 매번 필요)
+# - 페이지 캐시 64MB(음수=KiB) + 256MB mmap: 대량 업로드 시 페이지 복사/재읽기 감소
+_KFIT_CONN_PRAGMAS = (
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA busy_timeout = 30000",  # 30s
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -65536",
+    "PRAGMA mmap_size = 268435456",
+)
+_KFIT_CONN_PRAGMA_SCRIPT = ";\n".join(_KFIT_CONN_PRAGMAS) + ";"
+
+# journal_mode=WAL은 DB 파일에 영구 저장되므로 경로당 1회만 설정
+# - init_db()가 호출될 때(설정 > 데이터 전체 초기화로 파일을 새로 만드는 경우 포함) 비워서 다시 설정
+_KFIT_WAL_READY: set = set()
+
+def _kfit_ensure_wal(conn: sqlite3.Connection, path: str) -> None:
+    if path in _KFIT_WAL_READY or path == ":memory:" or path.startswith("file::memory:"):
+        return
     try:
-        conn.execute("PRAGMA journal_mode = WAL")
+        mode = conn.execute("PRAGMA journal_mode = WAL").fetchone()
+        if mode and str(mode[0]).lower() == "wal":
+            _KFIT_WAL_READY.add(path)
     except Exception:
         # 일부 환경/권한에서 WAL 설정이 실패할 수 있으나, 동작 자체는 가능해야 한다.
         pass
+
+def _kfit_apply_sqlite_pragmas(conn: sqlite3.Connection, path: str = "") -> None:
+    """SQLite 연결에 대해 안정성/경합 완화 PRAGMA를 적용한다."""
     try:
-        conn.execute("PRAGMA synchronous = NORMAL")
+        # [성능] 연결 단위 PRAGMA를 한 번의 호출로 적용
+        conn.executescript(_KFIT_CONN_PRAGMA_SCRIPT)
     except Exception:
-        pass
+        # 일부 PRAGMA가 실패하는 환경에서는 하나씩 적용(나머지는 계속 적용되도록)
+        for sql in _KFIT_CONN_PRAGMAS:
+            try:
+                conn.execute(sql)
+            except Exception:
+                pass
+    _kfit_ensure_wal(conn, path or DB_PATH)
     try:
-        conn.execute("PRAGMA busy_timeout = 30000")  # 30s
+        # SQL에서도 압축 컬럼을 읽을 수 있도록: json_extract(zlib_decompress(raw_zlib), '$.name')
+        conn.create_function("zlib_decompress", 1, _kfit_zlib_decompress, deterministic=True)
     except Exception:
         pass
+
+
+def _kfit_zlib_decompress(blob):
+    if blob is None:
+        return None
     try:
-        conn.execute("PRAGMA temp_store = MEMORY")
+        return zlib.decompress(blob).decode("utf-8")
     except Exception:
-        pass
+        return None
 
 # ✅ 재정의(override): 상단의 get_connection()을 대체하여 전 모듈에서 동일 효과를 얻는다.
 # - Python은 함수 호출 시점에 globals의 이름을 조회하므로, 아래 재정의는 import 이후에도 유효.
+# ---------------------------------------------------------
+# [성능] 연결 풀
+# - 조회/저장 함수마다 connect → PRAGMA 적용 → close 하던 비용 제거: close()하면 풀로 반납, 다음 호출이 재사용
+# - sqlite3.Connection 하위 클래스라 pd.read_sql 등 기존 호출부가 그대로 동작
+# - 반납 시 미완료 트랜잭션은 rollback, 남은 커서는 닫음(기존 close()와 같은 결과: 끝까지 안 읽은
+#   SELECT가 읽기 스냅샷을 붙잡지 않음), row_factory 등 연결 설정은 기본값으로 복원
+# - DB 파일을 지우거나 새로 만들 때는 close_connection_pool()로 풀을 비운다(Windows는 열린 파일 삭제 불가)
+# ---------------------------------------------------------
+_KFIT_POOL_MAX = 4
+_KFIT_POOL: list = []
+_KFIT_POOL_LOCK = threading.Lock()
+_KFIT_POOL_GEN = 0
+
+
+class _KfitPooledConnection(sqlite3.Connection):
+    """close() 시 실제로 닫지 않고 풀로 반납하는 연결."""
+
+    _kfit_gen = -1
+    _kfit_path = ""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._kfit_cursors = weakref.WeakSet()
+        self._kfit_after_commit = []
+
+    def cursor(self, *args, **kwargs):
+        cur = super().cursor(*args, **kwargs)
+        self._kfit_cursors.add(cur)
+        return cur
+
+    def commit(self) -> None:
+        super().commit()
+        hooks, self._kfit_after_commit = self._kfit_after_commit, []
+        for fn in hooks:
+            try:
+                fn()
+            except Exception:
+                pass
+
+    def rollback(self) -> None:
+        self._kfit_after_commit = []
+        super().rollback()
+
+    def close(self) -> None:
+        _kfit_pool_release(self)
+
+    def _kfit_close(self) -> None:
+        super().close()
+
+
+def _kfit_pool_release(conn: _KfitPooledConnection) -> None:
+    conn._kfit_after_commit = []
+    try:
+        for cur in list(conn._kfit_cursors):
+            cur.close()
+        if conn.in_transaction:
+            conn.rollback()
+        conn.row_factory = None
+        conn.text_factory = str
+    except sqlite3.ProgrammingError:
+        return  # 이미 닫힌 연결
+    with _KFIT_POOL_LOCK:
+        if any(c is conn for c in _KFIT_POOL):
+            return
+        if conn._kfit_gen == _KFIT_POOL_GEN and conn._kfit_path == DB_PATH and len(_KFIT_POOL) < _KFIT_POOL_MAX:
+            _KFIT_POOL.append(conn)
+            return
+    conn._kfit_close()
+
+
+def close_connection_pool() -> None:
+    """풀에 반납된 연결을 모두 닫고, 사용 중인 연결도 반납 시 닫히도록 세대를 올린다."""
+    global _KFIT_POOL_GEN
+    with _KFIT_POOL_LOCK:
+        _KFIT_POOL_GEN += 1
+        idle = list(_KFIT_POOL)
+        _KFIT_POOL.clear()
+    for conn in idle:
+        try:
+            conn._kfit_close()
+        except Exception:
+            pass
+
+
 def get_connection() -> sqlite3.Connection:
     """Hardened connection factory (CTO Patch Pack)."""
-    conn = sqlite3.connect(DB_PATH, check_same_thread=False, timeout=30.0)
-    _kfit_apply_sqlite_pragmas(conn)
+    with _KFIT_POOL_LOCK:
+        while _KFIT_POOL:
+            conn = _KFIT_POOL.pop()
+            if conn._kfit_gen == _KFIT_POOL_GEN and conn._kfit_path == DB_PATH:
+                return conn
+            try:
+                conn._kfit_close()
+            except Exception:
+                pass
+        gen = _KFIT_POOL_GEN
+    # [성능] cached_statements: 모듈 상수 SQL의 prepared statement 재사용 폭 확대(기본 128)
+    conn = sqlite3.connect(
+        DB_PATH, check_same_thread=False, timeout=30.0, cached_statements=256, factory=_KfitPooledConnection
+    )
+    conn._kfit_gen = gen
+    conn._kfit_path = DB_PATH
+    _kfit_apply_sqlite_pragmas(conn, DB_PATH)
     return conn
+
+
+# ---------------------------------------------------------
+# [성능] 스레드 로컬 공유 연결 (db())
+# - 한 사용자 동작(예: 보류 결정 반영)이 여러 헬퍼를 거쳐도 연결 1개/커밋 1회로 처리
+# - 가장 바깥 with만 실제 연결을 열고 닫는다. 안쪽 with에는 래퍼를 넘겨, 기존 헬퍼의
+#   conn.commit()/rollback() 코드를 그대로 두어도 바깥 트랜잭션에 합류한다.
+#   * 바깥 트랜잭션이 열려 있으면 안쪽 구간을 SAVEPOINT로 감쌈: commit은 무시(바깥 커밋에 합류),
+#     rollback은 ROLLBACK TO로 안쪽 변경만 되돌림, 예외로 빠져나가도 안쪽 변경만 되돌린 뒤 전파
+#   * 바깥 트랜잭션이 없으면(되돌릴 바깥 변경 없음) commit/rollback을 실제 연결에 그대로 전달
+# - 주의: pandas.read_sql은 래퍼를 sqlite3 연결로 인식하지 못하므로 db() 구간에서는 cursor를 사용
+# ---------------------------------------------------------
+_KFIT_TLS = threading.local()
+
+
+class _KfitNestedConnection:
+    """중첩 db() 구간용 연결 래퍼(savepoint가 있으면 그 구간만 되돌림, 없으면 실제 연결에 위임)."""
+
+    __slots__ = ("_conn", "_savepoint", "_hook_mark")
+
+    def __init__(self, conn: sqlite3.Connection, savepoint: Optional[str] = None):
+        self._conn = conn
+        self._savepoint = savepoint
+        # savepoint 이후 등록된 커밋 후 작업(run_after_commit)은 ROLLBACK TO 시 함께 버림
+        self._hook_mark = len(getattr(conn, "_kfit_after_commit", ()))
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def commit(self) -> None:
+        if self._savepoint is None:
+            self._conn.commit()
+
+    def rollback(self) -> None:
+        if self._savepoint is None:
+            self._conn.rollback()
+        else:
+            self._conn.execute(f"ROLLBACK TO SAVEPOINT {self._savepoint}")
+            hooks = getattr(self._conn, "_kfit_after_commit", None)
+            if hooks is not None:
+                del hooks[self._hook_mark:]
+
+    def close(self) -> None:
+        pass
+
+
+@contextmanager
+def db():
+    """스레드 로컬 공유 연결 컨텍스트.
+
+    - 바깥 호출: 새 연결을 열고, 예외 시 rollback, 종료 시 close (커밋은 호출부가 명시적으로)
+    - 안쪽 호출: 같은 연결을 래퍼로 전달(바깥 트랜잭션 중이면 SAVEPOINT 구간, close 무시)
+    """
+    conn = getattr(_KFIT_TLS, "conn", None)
+    if conn is not None:
+        depth = getattr(_KFIT_TLS, "depth", 0) + 1
+        savepoint = f"kfit_db_{depth}" if conn.in_transaction else None
+        if savepoint:
+            conn.execute(f"SAVEPOINT {savepoint}")
+        _KFIT_TLS.depth = depth
+        nested = _KfitNestedConnection(conn, savepoint)
+        try:
+            yield nested
+        except BaseException:
+            try:
+                nested.rollback()
+            except sqlite3.Error:
+                pass
+            raise
+        finally:
+            _KFIT_TLS.depth = depth - 1
+            if savepoint:
+                try:
+                    conn.execute(f"RELEASE SAVEPOINT {savepoint}")
+                except sqlite3.Error:
+                    pass  # 안쪽에서 트랜잭션이 이미 끝난 경우
+        return
+
+    conn = get_connection()
+    _KFIT_TLS.conn = conn
+    _KFIT_TLS.depth = 0
+    try:
+        yield conn
+    except Exception:
+        try:
+            conn.rollback()
+        except Exception:
+            pass
+        raise
+    finally:
+        _KFIT_TLS.conn = None
+        conn.close()
+
+
+def run_after_commit(conn, fn) -> None:
+    """conn의 현재 트랜잭션이 커밋된 뒤에 fn()을 실행하도록 등록 (롤백/반납 시 버림)
+    - 커밋 전 상태를 프로세스 캐시 등에 반영하면 롤백 후에도 남으므로, 커밋 성공 이후로 미룬다
+    - 중첩 db() 래퍼면 바깥 연결의 커밋을 기다림, 트랜잭션 밖이면 즉시 실행
+    - 풀 연결이 아니면(커밋 시점을 알 수 없음) 실행하지 않음
+    """
+    conn = getattr(conn, "_conn", conn)
+    if not isinstance(conn, _KfitPooledConnection):
+        return
+    if conn.in_transaction:
+        conn._kfit_after_commit.append(fn)
+    else:
+        fn()
+
+
+def has_active_db() -> bool:
+    """현재 스레드에 열린 db() 구간이 있는지(호출부 트랜잭션 합류 여부 판단용)."""
+    return getattr(_KFIT_TLS, "conn", None) is not None
 # [체크리스트]
 # - UI 유지/존치: ✅ 유지됨 (DB 스키마/연결만 보강)
 # - 신규 테이블: ✅ upload_holds / hold_decisions / approval_proofs / audit_logs
@@ -3,9 +3,9 @@ import pandas as pd
 import os
 import time
 import json
-import hashlib
 import io
 import urllib.parse
+import uuid
 from datetime import datetime, timedelta
 import html
 import streamlit.components.v1 as components  # 팝업 제어용
@@ -17,6 +17,276 @@ import queries  # DB CRUD
 import smart_import  # 안전형 스마트 업로드 엔진
 import re
 import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+# ---------------------------------------------------------
+# [성능] 업로드 부가 작업(보류 동기화/업로드 이력)용 백그라운드 실행기
+# - 각 작업은 queries 내부에서 자체 커넥션(get_connection)을 열고 닫으므로 스레드 간 공유 없음
+# - 호출부는 future.result(timeout=...)로 완료/오류를 반드시 회수
+# ---------------------------------------------------------
+_KFIT_BG_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="kfit-bg")
+
+
+# ---------------------------------------------------------
+# [성능] 업로드 이력 조회 캐시
+# - 업로드 버튼 클릭마다 DB 왕복하지 않도록 짧은 TTL로 캐시
+# - 이력 기록은 반드시 _kfit_upsert_upload_history를 통해 수행(기록 직후 캐시 무효화)
+# ---------------------------------------------------------
+@st.cache_data(ttl=60, show_spinner=False)
+def _kfit_cached_get_upload_history(file_hash, action):
+    return queries.get_upload_history(file_hash, action)
+
+
+def _kfit_upsert_upload_history(file_hash, action, filename, filesize, summary):
+    try:
+        return queries.upsert_upload_history(file_hash, action, filename, filesize, summary)
+    finally:
+        _kfit_cached_get_upload_history.clear()
+
+
+# ---------------------------------------------------------
+# [성능] 실패 목록 CSV 바이트 캐시
+# - rerun마다 실패 표 전체를 CSV로 재직렬화하지 않도록 (file_hash, 행수, 분석버전) 기준 1회 생성
+# - _fail_df는 밑줄 인자라 해시 대상에서 제외(키는 앞의 인자들로만 구성)
+# ---------------------------------------------------------
+@st.cache_data(max_entries=8, show_spinner=False)
+def _kfit_fail_csv_bytes(file_hash, n_rows, analysis_version, _fail_df):
+    return _fail_df.to_csv(index=False).encode("utf-8-sig")
+
+
+def _kfit_analysis_version(analysis, rows_all):
+    """분석 결과 식별자 (디스크 보관 시 파일 mtime, 세션 보관 시 rows 객체 id)"""
+    try:
+        path = (analysis or {}).get("rows_path")
+        if path:
+            return f"{path}:{os.path.getmtime(path)}"
+    except Exception:
+        pass
+    return f"mem:{id(rows_all)}"
+
+
+# ---------------------------------------------------------
+# [성능] 스마트 업로드 분석 rows 로더
+# - session_state에는 summary + rows_path만 보관, rows는 디스크 파일에서 1회 로드 후 재사용
+# - mtime을 키에 포함해 동일 파일 재분석 시 자동 갱신
+# - cache_resource: 호출마다 복사(pickle)하지 않음 → rows는 읽기 전용으로만 사용할 것
+# ---------------------------------------------------------
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _kfit_load_analysis_rows(path, mtime):
+    return smart_import.load_analysis_rows(path)
+
+
+def _kfit_analysis_rows(analysis):
+    """분석 결과에서 rows 획득 (디스크 보관/세션 보관 모두 호환)"""
+    if not analysis:
+        return []
+    if "rows" in analysis:
+        return analysis.get("rows") or []
+    path = analysis.get("rows_path")
+    try:
+        return _kfit_load_analysis_rows(path, os.path.getmtime(path))
+    except Exception as e:
+        # 파일이 없으면(오래된 파일 정리 등) 0건으로 결과/반영을 진행하지 않고 재분석 안내 후 중단
+        st.session_state.pop("smart_upload_analysis", None)
+        st.warning(f"분석 결과 파일을 불러올 수 없습니다. 파일을 다시 분석해 주세요. ({e})")
+        st.stop()
+
+
+def _kfit_session_key():
+    """세션별 분석 캐시 파일 구분 키 (세션 최초 접근 시 1회 생성)"""
+    return st.session_state.setdefault("_kfit_session_key", uuid.uuid4().hex)
+
+
+def _kfit_reset_smart_upload_state():
+    """분석/결정/실패수정 상태 초기화 (+ 분석 캐시 파일 정리)"""
+    prev = st.session_state.pop("smart_upload_analysis", None)
+    if isinstance(prev, dict):
+        smart_import.discard_analysis_rows(prev.get("rows_path"))
+    st.session_state.pop("smart_upload_decisions", None)
+    st.session_state.pop("smart_upload_fail_edits", None)
+
+
+# ---------------------------------------------------------
+# [성능] 스마트 업로드 결과 패널(fragment)
+# - 필터/보류/실패 패널 조작 시 해당 패널만 부분 rerun (파일 미리보기/분석 지표/display_df 재계산 방지)
+# - st.fragment 미지원 버전은 일반 함수로 동작
+# ---------------------------------------------------------
+_kfit_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda f: f)
+
+
+@_kfit_fragment
+def _kfit_render_status_filter(display_df):
+    with st.expander("📋 상세 리스트(필터)", expanded=True):
+        row_statuses = sorted(x for x in display_df["행상태"].dropna().unique().tolist() if x)
+        status_filter = st.multiselect(
+            "행상태 필터",
+            options=row_statuses,
+            default=row_statuses,
+        )
+        if status_filter:
+            st.dataframe(display_df[display_df["행상태"].isin(status_filter)], use_container_width=True)
+        else:
+            st.dataframe(display_df, use_container_width=True)
+
+
+@_kfit_fragment
+def _kfit_render_hold_panel(hold_rows, file_hash):
+    if hold_rows:
+        with st.expander(f"🟡 보류 {len(hold_rows)}건 - 수동 처리 선택(필수)", expanded=False):
+            st.caption("보류는 자동 반영되지 않습니다. 기존 고객 선택 / 신규 생성 / 건너뛰기 중 선택하세요.")
+            dec = st.session_state.setdefault("smart_upload_decisions", {})
+
+            # [성능] 행마다 selectbox 위젯을 만들지 않고, 단일 data_editor(SelectboxColumn)로 처리 선택
+            # - 위젯 수가 보류 건수와 무관하게 1개로 고정되어 rerun 비용이 줄고, 건수 제한(100건)도 불필요
+            opt_skip = "이번 행 건너뛰기"
+            opt_new = "신규 고객 생성(중복 가능)"
+            opt_existing = "기존 고객 사용"
+
+            hold_records = []
+            cand_ids_by_seq = {}
+            can_create_by_seq = {}
+            for r in hold_rows:
+                seq = int(r.get("seq", 0))
+                fin = r.get("financial") or {}
+                cand = r.get("customer_candidates") or []
+                cand_ids_by_seq[seq] = {int(c.get("id")) for c in cand}
+                can_create_by_seq[seq] = bool(str(r.get("phone", "")).strip())
+
+                prev_choice = dec.get(seq, {})
+                sel_label, sel_cid = opt_skip, None
+                if prev_choice.get("mode") == "create_new" and can_create_by_seq[seq]:
+                    sel_label = opt_new
+                elif prev_choice.get("mode") == "use_existing" and prev_choice.get("customer_id") in cand_ids_by_seq[seq]:
+                    sel_label, sel_cid = opt_existing, int(prev_choice.get("customer_id"))
+
+                hold_records.append({
+                    "seq": seq,
+                    "name": str(r.get("name", "") or ""),
+                    "phone": str(r.get("phone", "") or ""),
+                    "birth_date": str(r.get("birth_date", "") or ""),
+                    "customer_reason": str(r.get("customer_reason", "") or ""),
+                    "contract_reason": str(r.get("contract_reason", "") or ""),
+                    "contract": f"{fin.get('company','')} | {fin.get('product_name','')} | 증권:{fin.get('policy_no','')}",
+                    "candidates": " / ".join(
+                        f"#{c.get('id')} {c.get('name')} {c.get('phone')} 생일:{c.get('birth_date','')}" for c in cand
+                    ),
+                    "decision": sel_label,
+                    "customer_id": sel_cid,
+                })
+            hold_df = pd.DataFrame(hold_records)
+
+            with st.container(height=260, border=True):
+                edited_hold = st.data_editor(
+                    hold_df,
+                    use_container_width=True,
+                    hide_index=True,
+                    key=f"hold_editor_{file_hash}",
+                    column_config={
+                        "seq": st.column_config.NumberColumn("행", disabled=True, width="small"),
+                        "name": st.column_config.TextColumn("이름", disabled=True),
+                        "phone": st.column_config.TextColumn("연락처", disabled=True),
+                        "birth_date": st.column_config.TextColumn("생일", disabled=True),
+                        "customer_reason": st.column_config.TextColumn("고객 사유", disabled=True, width="large"),
+                        "contract_reason": st.column_config.TextColumn("계약 사유", disabled=True, width="large"),
+                        "contract": st.column_config.TextColumn("계약", disabled=True, width="large"),
+                        "candidates": st.column_config.TextColumn("후보 고객", disabled=True, width="large"),
+                        "decision": st.column_config.SelectboxColumn(
+                            "처리 선택", options=[opt_skip, opt_new, opt_existing], required=True, width="medium"
+                        ),
+                        "customer_id": st.column_config.NumberColumn("선택 고객ID", step=1, format="%d", width="small"),
+                    },
+                    disabled=["seq", "name", "phone", "birth_date", "customer_reason", "contract_reason", "contract", "candidates"],
+                )
+
+            # 편집 결과 → decisions(seq 기준) 변환
+            invalid_seqs = []
+            no_phone_seqs = []
+            for rec in edited_hold.to_dict("records"):
+                seq = int(rec.get("seq") or 0)
+                label = rec.get("decision")
+                raw_cid = rec.get("customer_id")
+                if label == opt_existing:
+                    cid2 = int(raw_cid) if pd.notna(raw_cid) else None
+                    if cid2 is not None and cid2 in cand_ids_by_seq.get(seq, set()):
+                        dec[seq] = {"mode": "use_existing", "customer_id": cid2}
+                    else:
+                        dec[seq] = {"mode": "skip"}
+                        invalid_seqs.append(seq)
+                elif label == opt_new:
+                    if can_create_by_seq.get(seq):
+                        dec[seq] = {"mode": "create_new"}
+                    else:
+                        # 연락처 없이는 고객을 만들 수 없음 → 건너뛰기(아래 경고로 알림)
+                        dec[seq] = {"mode": "skip"}
+                        no_phone_seqs.append(seq)
+                else:
+                    dec[seq] = {"mode": "skip"}
+
+            if invalid_seqs:
+                st.warning(
+                    "기존 고객 사용은 '후보 고객' 목록의 ID만 선택할 수 있습니다. "
+                    f"해당 행은 건너뛰기로 처리됩니다: {', '.join(str(x) for x in invalid_seqs[:20])}"
+                )
+            if no_phone_seqs:
+                st.warning(
+                    "연락처가 없는 행은 신규 고객으로 생성할 수 없습니다. "
+                    f"해당 행은 건너뛰기로 처리됩니다: {', '.join(str(x) for x in no_phone_seqs[:20])}"
+                )
+
+
+@_kfit_fragment
+def _kfit_render_fail_panel(fail_rows, file_hash, analysis_version):
+    if fail_rows:
+        with st.expander(f"🔴 실패 {len(fail_rows)}건 - 수정/재시도", expanded=False):
+            st.caption("실패건은 자동 반영되지 않습니다. 아래에서 값을 수정한 뒤, 옵션으로 '실패 수정분을 보류로 간주' 후 반영을 시도할 수 있습니다.")
+            fail_df = []
+            for r in fail_rows:
+                fin = r.get("financial") or {}
+                fail_df.append({
+                    "seq": int(r.get("seq", 0)),
+                    "name": str(r.get("name", "") or ""),
+                    "phone": str(r.get("phone", "") or ""),
+                    "birth_date": str(r.get("birth_date", "") or ""),
+                    "company": str(fin.get("company", "") or ""),
+                    "product_name": str(fin.get("product_name", "") or ""),
+                    "policy_no": str(fin.get("policy_no", "") or ""),
+                    "customer_reason": str(r.get("customer_reason", "") or ""),
+                    "contract_reason": str(r.get("contract_reason", "") or ""),
+                })
+            fail_df = pd.DataFrame(fail_df)
+
+            # 다운로드(수정용) 제공
+            csv_bytes = _kfit_fail_csv_bytes(
+                file_hash, len(fail_df), analysis_version, fail_df
+            )
+            st.download_button(
+                "⬇️ 실패 목록 CSV 다운로드",
+                data=csv_bytes,
+                file_name=f"upload_fail_{file_hash[:10]}.csv",
+                mime="text/csv",
+                use_container_width=True
+            )
+
+            with st.container(height=240, border=True):
+                edited_fail = st.data_editor(
+                    fail_df,
+                    use_container_width=True,
+                    hide_index=True,
+                    key=f"fail_editor_{file_hash}",
+                    column_config={
+                        "seq": st.column_config.NumberColumn("행", disabled=True, width="small"),
+                        "customer_reason": st.column_config.TextColumn("고객 사유", disabled=True, width="large"),
+                        "contract_reason": st.column_config.TextColumn("계약 사유", disabled=True, width="large"),
+                    },
+                    disabled=["seq", "customer_reason", "contract_reason"],
+                )
+
+            # 세션에 저장(반영 버튼에서 사용)
+            try:
+                st.session_state["smart_upload_fail_edits"] = edited_fail.to_dict("records")
+            except Exception:
+                st.session_state["smart_upload_fail_edits"] = []
+
 
 # ---------------------------------------------------------
 # Query Params Helpers (Streamlit 버전 호환)
@@ -62,6 +332,7 @@ def main():
     utils.apply_custom_css()
     utils.sidebar_logo()
     database.init_db()
+    queries.resume_gcal_sync()  # 재시작 전 큐에 있던 캘린더 동기화('QUEUED') 재개
 
     # ---------------------------------------------------------
     # ✅ 딥링크(클릭 이동) 처리
@@ -437,7 +708,7 @@ def main():
                 ui_header("🗂️ 히스토리")
 
                 # ✅ [안전화] 히스토리 삭제(실수 방지: '정말 삭제' 체크)
-                log_df = queries.get_customer_logs(cid)
+                log_df = queries.get_customer_logs(cid, as_df=True)
 
                 if not log_df.empty:
                     if "id" in log_df.columns:
@@ -531,8 +802,8 @@ def main():
                 # '다음 일정' 리스트 영역 (높이 200px 고정)
                 with st.container(height=255):
                     open_tasks = queries.get_open_tasks(cid)
-                    if not open_tasks.empty:
-                        for _, tr in open_tasks.iterrows():
+                    if open_tasks:
+                        for tr in open_tasks:
                             tid = int(tr.get("id") or 0)
                             title = str(tr.get('type'))
                             due_str = f"{utils.fmt_mmdd_hhmm(tr.get('due_date'))} ({utils.fmt_dday(tr.get('due_date'))})"
@@ -1076,15 +1347,35 @@ def main():
             else:
                 statuses = [status_opt]
 
+            # [성능] keyset 페이지 이동: 페이지 시작 커서를 스택으로 보관(필터가 바뀌면 첫 페이지로)
+            page_size = 200
+            filter_sig = (status_opt, tuple(reason_codes), upload_id_filter, keyword.strip())
+            if st.session_state.get("hold_mgr_filter_sig") != filter_sig:
+                st.session_state["hold_mgr_filter_sig"] = filter_sig
+                st.session_state["hold_mgr_cursors"] = []
+            cursors = st.session_state.setdefault("hold_mgr_cursors", [])
+            after = cursors[-1] if cursors else (None, None)
+
             holds = queries.list_upload_holds(
                 statuses=statuses,
                 keyword=(keyword.strip() or None),
                 upload_id=upload_id_filter,
                 reason_codes=(reason_codes or None),
-                limit=200,
+                limit=page_size,
+                after_created_at=after[0],
+                after_id=after[1],
             )
+            next_cursor = queries.upload_hold_page_cursor(holds, page_size)
 
-            st.markdown(f"**검색 결과:** {len(holds)}건")
+            st.markdown(f"**검색 결과:** {len(holds)}건" + (f" (페이지 {len(cursors) + 1})" if cursors or next_cursor else ""))
+            if cursors or next_cursor:
+                pcol1, pcol2, _ = st.columns([1, 1, 6])
+                if pcol1.button("◀ 이전", disabled=not cursors, key="hold_mgr_prev"):
+                    cursors.pop()
+                    st.rerun()
+                if pcol2.button("다음 ▶", disabled=next_cursor is None, key="hold_mgr_next"):
+                    cursors.append(next_cursor)
+                    st.rerun()
             st.caption("후보 추천 기준: (1) 연락처 정확일치 → (2) 이름+생년월일 → (3) match_key. 최종 매핑은 대표님이 직접 선택합니다.")
 
             if not holds:
@@ -1200,19 +1491,17 @@ def main():
         up = st.file_uploader("📎 엑셀/CSV 업로드", type=["xlsx", "csv"])
 
         if up is not None:
-            file_bytes = up.getvalue()
-            file_hash = hashlib.sha256(file_bytes).hexdigest()
+            # [성능] up.getvalue()로 전체 bytes를 복사하지 않고 UploadedFile(BytesIO)을 직접 해시/로드
+            file_hash = smart_import.file_fingerprint(up)
 
             # 파일이 바뀌면 분석/결정/실패수정 상태 초기화
             if st.session_state.get("smart_upload_file_hash") != file_hash:
                 st.session_state["smart_upload_file_hash"] = file_hash
-                st.session_state.pop("smart_upload_analysis", None)
-                st.session_state.pop("smart_upload_decisions", None)
-                st.session_state.pop("smart_upload_fail_edits", None)
+                _kfit_reset_smart_upload_state()
 
             # 미리보기
             try:
-                df_preview = smart_import.read_upload_file(file_bytes, up.name)
+                df_preview = smart_import.read_upload_file(up, up.name)
                 with st.expander("📄 업로드 데이터 미리보기 (상위 10행)", expanded=False):
                     st.dataframe(df_preview.head(10), use_container_width=True)
             except Exception as e:
@@ -1249,18 +1538,36 @@ def main():
 
                         # [데이터(db포함) 오류] 보류(hold) 항목을 DB에 영속 저장
                         # - 업로드 중 즉시 해결 못한 건을 업로드 이후에도 "고객데이터관리 > 업로드보류(관리)"에서 처리할 수 있도록 함
+                        # - [성능] 분석 rows 디스크 저장과 동시에 백그라운드로 실행 후 결과 회수
+                        hold_future = _KFIT_BG_EXECUTOR.submit(
+                            queries.sync_upload_holds, file_hash=file_hash, filename=up.name, rows=analysis.get("rows", [])
+                        )
+
+                        # [성능] rows는 디스크에 보관하고 세션에는 summary + 경로만 유지 (저장 실패 시 기존처럼 세션 보관)
+                        try:
+                            rows_path = smart_import.save_analysis_rows(
+                                file_hash, analysis.get("rows", []), session_key=_kfit_session_key()
+                            )
+                            st.session_state["smart_upload_analysis"] = {
+                                "summary": analysis.get("summary", {}),
+                                "rows_path": rows_path,
+                            }
+                        except Exception:
+                            st.session_state["smart_upload_analysis"] = analysis
+                        st.session_state.setdefault("smart_upload_decisions", {})
+
                         try:
-                            queries.sync_upload_holds(file_hash=file_hash, filename=up.name, analyzed_rows=analysis.get("rows", []))
+                            hold_future.result(timeout=60)
+                        except FutureTimeoutError:
+                            # 대기만 끝난 것(백그라운드 저장은 계속 진행) → 실패로 안내하지 않음
+                            st.info("보류항목 DB저장이 아직 진행 중입니다. 완료되면 '업로드보류(관리)'에서 확인할 수 있습니다.")
                         except Exception as e:
                             # 업로드 분석은 계속 진행; hold_store 저장만 실패한 것으로 간주
                             st.warning(f"보류항목 DB저장 실패(분석은 계속): {e}")
 
-                        st.session_state["smart_upload_analysis"] = analysis
-                        st.session_state.setdefault("smart_upload_decisions", {})
-
                         progA.progress(100)
                         statusA.success("✅ 분석 완료! 아래에서 결과를 확인하고 반영 버튼을 눌러주세요.")
-                        st.rerun()
+                        # [성능] st.rerun() 생략: 분석 결과 UI는 이 핸들러 아래에서 session_state를 읽어 같은 실행에서 렌더링됨
                     except Exception as e:
                         statusA.error("❌ 분석 실패")
                         st.error(f"분석 중 오류가 발생했습니다: {e}")
@@ -1277,7 +1584,7 @@ def main():
                     st.warning("먼저 파일이 정상적으로 로드되어야 합니다.")
                 else:
                     action = "masked_contracts"
-                    prev = queries.get_upload_history(file_hash, action)
+                    prev = _kfit_cached_get_upload_history(file_hash, action)
                     if prev and not force:
                         st.warning("⚠️ 동일 파일(계약만 추가)이 이미 처리되었습니다. 강제 처리 체크 후 다시 시도하세요.")
                     else:
@@ -1309,7 +1616,7 @@ def main():
 
                             progC.progress(90)
                             try:
-                                queries.upsert_upload_history(file_hash, action, up.name, up.size, stats)
+                                _kfit_upsert_upload_history(file_hash, action, up.name, up.size, stats)
                             except Exception:
                                 pass
 
@@ -1331,7 +1638,7 @@ def main():
                             statusC.error("❌ 오류 발생")
                             st.error(f"계약만 추가 중 오류가 발생했습니다: {e}")
                             try:
-                                queries.upsert_upload_history(file_hash, action, up.name, up.size, {"ok": False, "msg": str(e)})
+                                _kfit_upsert_upload_history(file_hash, action, up.name, up.size, {"ok": False, "msg": str(e)})
                             except Exception:
                                 pass
 
@@ -1358,132 +1665,27 @@ def main():
                 n4.metric("계약 보류", summary.get("계약_보류", 0))
                 n5.metric("계약 실패", summary.get("계약_실패", 0))
 
-                display_df = smart_import.build_display_df(analysis.get("rows", []))
-                with st.expander("📋 상세 리스트(필터)", expanded=True):
-                    status_filter = st.multiselect(
-                        "행상태 필터",
-                        options=sorted([x for x in display_df["행상태"].dropna().unique().tolist() if x]),
-                        default=sorted([x for x in display_df["행상태"].dropna().unique().tolist() if x]),
-                    )
-                    if status_filter:
-                        st.dataframe(display_df[display_df["행상태"].isin(status_filter)], use_container_width=True)
-                    else:
-                        st.dataframe(display_df, use_container_width=True)
+                rows_all = _kfit_analysis_rows(analysis)
+
+                # [성능] 행상태별 분리를 rows_all 1회 순회로 처리(보류/실패 목록 공용)
+                rows_by_status = {}
+                for r in rows_all:
+                    rows_by_status.setdefault(r.get("row_status"), []).append(r)
 
-                rows_all = analysis.get("rows", [])
+                display_df = smart_import.build_display_df(rows_all)
+                _kfit_render_status_filter(display_df)
 
                 # -------------------------
                 # ✅ 보류(수동 선택) UI (컨테이너로 묶어서 스크롤 처리)
                 # -------------------------
-                hold_rows = [r for r in rows_all if r.get("row_status") == "보류"]
-                if hold_rows:
-                    with st.expander(f"🟡 보류 {len(hold_rows)}건 - 수동 처리 선택(필수)", expanded=False):
-                        st.caption("보류는 자동 반영되지 않습니다. 기존 고객 선택 / 신규 생성 / 건너뛰기 중 선택하세요.")
-                        dec = st.session_state.setdefault("smart_upload_decisions", {})
-
-                        max_show = 100
-                        with st.container(height=260, border=True):
-                            for r in hold_rows[:max_show]:
-                                seq = int(r.get("seq", 0))
-                                fin = r.get("financial") or {}
-
-                                st.markdown(
-                                    f"**[{seq}행] {r.get('name','')} / {r.get('phone','')} / 생일:{r.get('birth_date','')}**\n\n"
-                                    f"- 고객 보류 사유: {r.get('customer_reason','')}\n"
-                                    f"- 계약 보류 사유: {r.get('contract_reason','')}\n"
-                                    f"- 계약: {fin.get('company','')} | {fin.get('product_name','')} | 증권:{fin.get('policy_no','')}\n"
-                                )
-
-                                cand = r.get("customer_candidates") or []
-                                options = [("skip", None, "이번 행 건너뛰기")]
-                                if str(r.get("phone", "")).strip():
-                                    options.append(("create_new", None, "신규 고객 생성(중복 가능)"))
-
-                                for c in cand:
-                                    label = f"기존 고객 사용: #{c.get('id')} | {c.get('name')} | {c.get('phone')} | 생일:{c.get('birth_date','')}"
-                                    options.append(("use_existing", int(c.get("id")), label))
-
-                                labels = [o[2] for o in options]
-                                default_idx = 0
-                                prev_choice = dec.get(seq, {})
-                                if prev_choice.get("mode") == "create_new" and "신규 고객 생성(중복 가능)" in labels:
-                                    default_idx = labels.index("신규 고객 생성(중복 가능)")
-                                elif prev_choice.get("mode") == "use_existing":
-                                    for j, o in enumerate(options):
-                                        if o[0] == "use_existing" and o[1] == prev_choice.get("customer_id"):
-                                            default_idx = j
-                                            break
-
-                                sel = st.selectbox("처리 선택", labels, index=default_idx, key=f"hold_dec_{file_hash}_{seq}")
-
-                                for o in options:
-                                    if o[2] == sel:
-                                        mode, cid2, _ = o
-                                        if mode == "use_existing":
-                                            dec[seq] = {"mode": "use_existing", "customer_id": cid2}
-                                        elif mode == "create_new":
-                                            dec[seq] = {"mode": "create_new"}
-                                        else:
-                                            dec[seq] = {"mode": "skip"}
-                                        break
-
-                                st.markdown("<hr style='margin:6px 0;border:0;border-top:1px solid #eee;'>", unsafe_allow_html=True)
-
-                        if len(hold_rows) > max_show:
-                            st.info(f"보류가 많아 {max_show}건까지만 표시했습니다. (총 {len(hold_rows)}건)")
+                hold_rows = rows_by_status.get("보류", [])
+                _kfit_render_hold_panel(hold_rows, file_hash)
 
                 # -------------------------
                 # ✅ 실패 목록 UI (컨테이너 + 수정 가능 Data Editor)
                 # -------------------------
-                fail_rows = [r for r in rows_all if r.get("row_status") == "실패"]
-                if fail_rows:
-                    with st.expander(f"🔴 실패 {len(fail_rows)}건 - 수정/재시도", expanded=False):
-                        st.caption("실패건은 자동 반영되지 않습니다. 아래에서 값을 수정한 뒤, 옵션으로 '실패 수정분을 보류로 간주' 후 반영을 시도할 수 있습니다.")
-                        fail_df = []
-                        for r in fail_rows:
-                            fin = r.get("financial") or {}
-                            fail_df.append({
-                                "seq": int(r.get("seq", 0)),
-                                "name": str(r.get("name", "") or ""),
-                                "phone": str(r.get("phone", "") or ""),
-                                "birth_date": str(r.get("birth_date", "") or ""),
-                                "company": str(fin.get("company", "") or ""),
-                                "product_name": str(fin.get("product_name", "") or ""),
-                                "policy_no": str(fin.get("policy_no", "") or ""),
-                                "customer_reason": str(r.get("customer_reason", "") or ""),
-                                "contract_reason": str(r.get("contract_reason", "") or ""),
-                            })
-                        fail_df = pd.DataFrame(fail_df)
-
-                        # 다운로드(수정용) 제공
-                        csv_bytes = fail_df.to_csv(index=False).encode("utf-8-sig")
-                        st.download_button(
-                            "⬇️ 실패 목록 CSV 다운로드",
-                            data=csv_bytes,
-                            file_name=f"upload_fail_{file_hash[:10]}.csv",
-                            mime="text/csv",
-                            use_container_width=True
-                        )
-
-                        with st.container(height=240, border=True):
-                            edited_fail = st.data_editor(
-                                fail_df,
-                                use_container_width=True,
-                                hide_index=True,
-                                key=f"fail_editor_{file_hash}",
-                                column_config={
-                                    "seq": st.column_config.NumberColumn("행", disabled=True, width="small"),
-                                    "customer_reason": st.column_config.TextColumn("고객 사유", disabled=True, width="large"),
-                                    "contract_reason": st.column_config.TextColumn("계약 사유", disabled=True, width="large"),
-                                },
-                                disabled=["seq", "customer_reason", "contract_reason"],
-                            )
-
-                        # 세션에 저장(반영 버튼에서 사용)
-                        try:
-                            st.session_state["smart_upload_fail_edits"] = edited_fail.to_dict("records")
-                        except Exception:
-                            st.session_state["smart_upload_fail_edits"] = []
+                fail_rows = rows_by_status.get("실패", [])
+                _kfit_render_fail_panel(fail_rows, file_hash, _kfit_analysis_version(analysis, rows_all))
 
                 # -------------------------
                 # 반영 옵션 + 반영 실행 (✅ 프로그레스 추가)
@@ -1519,7 +1721,7 @@ def main():
 
                 if a1.button("✅ 선택한 내용 반영(저장)", type="primary", use_container_width=True):
                     action = "full_upload_v2"
-                    prev = queries.get_upload_history(file_hash, action)
+                    prev = _kfit_cached_get_upload_history(file_hash, action)
                     if prev and not force:
                         st.warning("⚠️ 동일 파일(전체 통합)이 이미 반영되었습니다. 강제 처리 체크 후 다시 시도하세요.")
                     else:
@@ -1587,13 +1789,10 @@ def main():
                                 # 1) 준비 단계
                                 _set_progress(15, "✅ 반영 준비(행 구성/검증) 중...")
 
-                                # rows 복사(원본 session 분석값 오염 방지)
-                                rows_to_apply = []
-                                for r in payload.get('rows_all') or []:
-                                    rr = dict(r)
-                                    if isinstance(rr.get('financial'), dict):
-                                        rr['financial'] = dict(rr['financial'])
-                                    rows_to_apply.append(rr)
+                                # rows 목록만 얕은 복사
+                                # - smart_import.apply_import는 입력 row/financial을 변경하지 않으므로 전체 복제 불필요
+                                # - 실패 수정분이 있는 행만 새 dict로 교체하여 원본 session 분석값 오염을 방지
+                                rows_to_apply = list(payload.get('rows_all') or [])
 
                                 # 실패 수정본을 rows에 반영
                                 fail_edits = payload.get('fail_edits') or []
@@ -1606,26 +1805,29 @@ def main():
                                     except Exception:
                                         continue
 
-                                for rr in rows_to_apply:
-                                    try:
-                                        seq = int(rr.get('seq') or 0)
-                                    except Exception:
-                                        continue
-                                    if seq in fail_edit_map:
-                                        e = fail_edit_map[seq]
-                                        rr['name'] = e.get('name', rr.get('name'))
-                                        rr['phone'] = e.get('phone', rr.get('phone'))
-                                        rr['birth_date'] = e.get('birth_date', rr.get('birth_date'))
-
-                                        fin = rr.get('financial') or {}
+                                # [성능] seq → 위치 맵을 1회 구성하고 수정된 seq만 직접 찾아감
+                                # - 분석 단계에서 seq는 이미 int(1..N)로 부여되므로 행마다 int()/try 변환 불필요
+                                pos_by_seq = {r.get('seq'): i for i, r in enumerate(rows_to_apply)} if fail_edit_map else {}
+                                for seq, e in fail_edit_map.items():
+                                    i = pos_by_seq.get(seq)
+                                    if i is not None:
+                                        r = rows_to_apply[i]
+                                        fin = dict(r.get('financial') or {})
                                         fin['company'] = e.get('company', fin.get('company'))
                                         fin['product_name'] = e.get('product_name', fin.get('product_name'))
                                         fin['policy_no'] = e.get('policy_no', fin.get('policy_no'))
-                                        rr['financial'] = fin
+                                        rr = {
+                                            **r,
+                                            'name': e.get('name', r.get('name')),
+                                            'phone': e.get('phone', r.get('phone')),
+                                            'birth_date': e.get('birth_date', r.get('birth_date')),
+                                            'financial': fin,
+                                        }
 
                                         # 옵션 체크 시, 실패를 보류로 간주해 반영 시도(저장 전 검증 단계에서 실패를 구조화)
                                         if payload.get('treat_fixed_fail_as_hold') and rr.get('row_status') == '실패':
                                             rr['row_status'] = '보류'
+                                        rows_to_apply[i] = rr
 
                                 # 2) DB 반영 실행
                                 _set_progress(55, "💾 DB 반영 실행 중...")
@@ -1641,29 +1843,39 @@ def main():
                                     decisions=payload.get('decisions') or {},
                                 )
 
-                                # 3) 업로드 이력 기록
+                                # 3) 업로드 이력 기록 (apply_import 커밋 이후 별도 커넥션으로 백그라운드 실행)
                                 _set_progress(85, "🧾 업로드 이력 기록 중...")
-                                try:
-                                    queries.upsert_upload_history(
-                                        payload.get('file_hash'),
-                                        payload.get('action'),
-                                        payload.get('filename'),
-                                        payload.get('filesize'),
-                                        stats,
-                                    )
-                                except Exception:
-                                    pass
+                                history_future = _KFIT_BG_EXECUTOR.submit(
+                                    _kfit_upsert_upload_history,
+                                    payload.get('file_hash'),
+                                    payload.get('action'),
+                                    payload.get('filename'),
+                                    payload.get('filesize'),
+                                    stats,
+                                )
 
                                 # 4) 완료(100% 고정)
                                 st.session_state['_kfit_apply_modal_stats'] = stats
                                 st.session_state['_kfit_apply_modal_done'] = True
+                                history_pending = False
+                                history_error = None
+                                try:
+                                    if history_future.result(timeout=30) is False:
+                                        history_error = "DB 기록 실패"
+                                except FutureTimeoutError:
+                                    # 대기만 끝난 것(백그라운드 기록은 계속 진행)
+                                    history_pending = True
+                                except Exception as e:
+                                    history_error = e
                                 _set_progress(100, "✅ 반영 완료", final=True)
                                 st.success(f"✅ 반영 완료: {stats}")
+                                if history_pending:
+                                    st.info("🧾 업로드 이력 기록이 아직 진행 중입니다(반영은 완료).")
+                                elif history_error is not None:
+                                    st.warning(f"업로드 이력 기록 실패(반영은 완료, 같은 파일 재업로드 경고가 빠질 수 있음): {history_error}")
 
                                 # 분석/결정/실패수정 상태 초기화(다음 업로드 작업을 위해 정리)
-                                st.session_state.pop('smart_upload_analysis', None)
-                                st.session_state.pop('smart_upload_decisions', None)
-                                st.session_state.pop('smart_upload_fail_edits', None)
+                                _kfit_reset_smart_upload_state()
 
                             except Exception as e:
                                 # 실패도 '완료 상태'로 고정하여 UX 일관성 유지(사용자는 닫기로 종료)
@@ -1672,7 +1884,7 @@ def main():
                                 _set_progress(100, "❌ 반영 중 오류 발생", final=True)
                                 st.error(f"반영 중 오류가 발생했습니다: {e}")
                                 try:
-                                    queries.upsert_upload_history(
+                                    _kfit_upsert_upload_history(
                                         payload.get('file_hash'),
                                         payload.get('action'),
                                         payload.get('filename'),
@@ -1692,9 +1904,7 @@ def main():
                     _kfit_apply_modal_run()
 
                 if a2.button("🧹 분석 초기화", use_container_width=True):
-                    st.session_state.pop("smart_upload_analysis", None)
-                    st.session_state.pop("smart_upload_decisions", None)
-                    st.session_state.pop("smart_upload_fail_edits", None)
+                    _kfit_reset_smart_upload_state()
                     st.success("초기화 완료")
                     st.rerun()
 
@@ -1704,8 +1914,13 @@ def main():
     elif menu == "설정":
         st.markdown("### ⚙️ 설정")
         if st.button("⚠️ 데이터 전체 초기화"):
+            queries.flush_audit_log()  # 대기 중인 감사 로그가 초기화 이후 새 DB에 섞이지 않도록 먼저 반영
+            database.close_connection_pool()  # 풀에 열린 연결이 있으면 파일 삭제 불가(Windows)
             if os.path.exists(database.DB_PATH): os.remove(database.DB_PATH)
             database.init_db()
+            # [성능] 프로세스 내 캐시도 DB와 함께 초기화(삭제된 계약/이력이 '유지'로 보이는 문제 방지)
+            queries.clear_recent_contracts()
+            _kfit_cached_get_upload_history.clear()  # 업로드 이력 TTL 캐시(삭제된 이력이 '이미 처리됨'으로 보이는 문제 방지)
             st.toast("초기화됨"); time.sleep(1); st.rerun()
 
 if __name__ == "__main__":
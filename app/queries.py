@@ -10,54 +10,120 @@ KFIT DB Transactions Module
 """
 
 from __future__ import annotations
+import os
 import re
 import hashlib
+import zlib
 import json
-from datetime import datetime, timedelta
+import numbers
+import pickle
+import threading
+import queue
+import atexit
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from datetime import date, datetime, timedelta
 import pandas as pd
 import sqlite3
 from database import get_connection
 import utils # [중요] 정밀 대조 함수 사용을 위해
 
+# [성능] orjson(C 확장)은 미설치일 수 있으니 선택적으로 사용(없으면 표준 json)
+try:
+    import orjson as _orjson
+except Exception:  # pragma: no cover
+    _orjson = None  # type: ignore
+
+# --- Precompiled Patterns ---
+# [성능] 정규화 헬퍼는 (행 수 × 필드 수)만큼 호출되므로 패턴을 모듈 로드 시 1회만 컴파일
+_RE_NON_DIGIT = re.compile(r"\D")
+_RE_WS = re.compile(r"\s+")
+_RE_NAME_STRIP = re.compile(r"[^0-9a-zA-Z가-힣\*]")
+_RE_NON_ALNUM = re.compile(r"[^0-9a-zA-Z]")
+_RE_ISO_DATE = re.compile(r"^(\d{4})-?(\d{2})-?(\d{2})$")
+_RE_ISO_DATETIME = re.compile(r"^\d{4}-\d{2}-\d{2}[ T]")
+_RE_BRACKETS = re.compile(r"[\(\)\[\]\{\}]")
+_RE_DATE_PARSEABLE = re.compile(r"[\da-zA-Z]")  # 숫자/영문이 하나도 없으면 날짜 파서가 해석할 수 없음
+
+# [성능] 숫자/영숫자만 남기는 필터는 ASCII 입력이면 str.translate(삭제 테이블)로 처리
+# - 비ASCII 입력은 기존 정규식 경로를 그대로 사용(유니코드 숫자 처리 결과 동일 유지)
+_ASCII_NON_DIGIT_DEL = str.maketrans("", "", "".join(chr(c) for c in range(128) if not chr(c).isdigit()))
+_ASCII_NON_ALNUM_DEL = str.maketrans("", "", "".join(chr(c) for c in range(128) if not chr(c).isalnum()))
+_WS_DEL = str.maketrans("", "", " \t\n\r\u3000")  # 이름 비교용 공백(전각 공백 포함) 제거
+
+
+def _digits_only(s: str) -> str:
+    return s.translate(_ASCII_NON_DIGIT_DEL) if s.isascii() else _RE_NON_DIGIT.sub("", s)
+
+
+def _alnum_only(s: str) -> str:
+    return s.translate(_ASCII_NON_ALNUM_DEL) if s.isascii() else _RE_NON_ALNUM.sub("", s)
+
 # --- Helper Functions ---
+# [성능] 전화/매칭키 정규화는 업로드 1건 안에서 같은 값이 반복 호출됨(분석→보류 동기화→후보 탐색)
+# - 문자열 입력 기준 캐시 함수에 위임(_norm_text 등과 같은 방식, 공개 함수 시그니처 유지)
+@lru_cache(maxsize=4096)
+def _normalize_phone_str(s: str) -> str:
+    return _digits_only(s)
+
+
 def normalize_phone(phone):
     """전화번호 정규화 (DB 검색용 Key 생성)"""
     if phone is None: return ""
-    return re.sub(r"\D", "", str(phone))
+    return _normalize_phone_str(str(phone))
 
 def phone_last4(phone):
     d = normalize_phone(phone)
     return d[-4:] if len(d) >= 4 else ""
 
+
+@lru_cache(maxsize=4096)
+def _make_match_key_str(name: str, phone_or_last4: str) -> str:
+    first = name.strip()[:1]
+    last4 = _digits_only(phone_or_last4)
+    if len(last4) > 4: last4 = last4[-4:]
+    return f"{first}{last4}" if first and len(last4) == 4 else ""
+
+
 def make_match_key(name, phone_or_last4):
     """[알고리즘] 최소 정보(이름1글자+번호4자리)를 이용한 경량 매칭 키 생성"""
     if not name: return ""
-    first = str(name).strip()[:1]
-    last4 = re.sub(r"\D", "", str(phone_or_last4))
-    if len(last4) > 4: last4 = last4[-4:]
-    return f"{first}{last4}" if first and len(last4) == 4 else ""
+    return _make_match_key_str(str(name), str(phone_or_last4))
+
+
+def normalize_birth(birth):
+    """생년월일 정규화(후보 탐색용): 날짜로 읽히면 YYYY-MM-DD, 아니면 입력 문자열 그대로(앞뒤 공백 제거)."""
+    if birth is None: return ""
+    return _norm_date(birth) or str(birth).strip()
 
 # ---------------------------------------------------------
 # [데이터(db포함) 오류] 계약자(Policyholder) 개인/법인 분기 + 검색 키 정규화
 # - queries.py는 streamlit 의존을 피하기 위해 utils.py를 import하지 않고 동일 로직을 최소로 구현
 # - 특허 관점: "표준화된 정규화 키(policyholder_norm)를 생성하여 검색/그룹핑의 정확도를 높이는 방법"
 # ---------------------------------------------------------
+_CORP_KWS = (
+    "(주)", "㈜", "주식회사", "유한회사", "재단", "사단", "협동조합",
+    "법무법인", "세무법인", "회계법인", "병원", "의원", "학교", "학원",
+    "센터", "협회", "조합", "공사", "공단",
+)
+# [성능] 법인 키워드(부분일치) + 영문 법인 접미사(단어경계)를 하나의 패턴으로 합쳐 1회 스캔
+# - 영문만 대소문자 무시 대상(한글 키워드는 IGNORECASE 영향 없음)
+_RE_CORP_ANY = re.compile(
+    "|".join(re.escape(k) for k in _CORP_KWS) + r"|\b(?:CORP|CORPORATION|LTD|LIMITED|INC)\b",
+    re.I,
+)
+
+
+@lru_cache(maxsize=4096)
 def _is_corporate_name(name: str) -> bool:
     n = (name or "").strip()
     if not n:
         return False
-    corp_kws = [
-        "(주)", "㈜", "주식회사", "유한회사", "재단", "사단", "협동조합",
-        "법무법인", "세무법인", "회계법인", "병원", "의원", "학교", "학원",
-        "센터", "협회", "조합", "공사", "공단",
-    ]
-    if any(k in n for k in corp_kws):
-        return True
-    if re.search(r"\b(CORP|CORPORATION|LTD|LIMITED|INC)\b", n, flags=re.I):
-        return True
-    return False
+    return _RE_CORP_ANY.search(n) is not None
 
 
+@lru_cache(maxsize=4096)
 def _norm_org_name(name: str) -> str:
     n = (name or "").strip()
     if not n:
@@ -65,45 +131,112 @@ def _norm_org_name(name: str) -> str:
     n2 = n.replace(" ", "")
     for k in ["(주)", "㈜", "주식회사", "유한회사", "재단법인", "사단법인"]:
         n2 = n2.replace(k, "")
-    n2 = re.sub(r"[\(\)\[\]\{\}]", "", n2)
+    n2 = _RE_BRACKETS.sub("", n2)
     return n2
 
 
 
+# [성능] 정규화 헬퍼 메모이제이션
+# - 업로드 행마다 같은 보험사/상품명/상태/날짜 문자열이 반복되므로 문자열 입력 기준으로 결과 캐시
+# - lru_cache는 hashable 인자만 받으므로 공개 헬퍼(object 입력)는 str로 변환 후 캐시 함수에 위임
+_NORM_CACHE_SIZE = 16384
+
+
+@lru_cache(maxsize=_NORM_CACHE_SIZE)
+def _norm_text_str(s: str) -> str:
+    return _RE_WS.sub(" ", s.strip()).lower()
+
+
 def _norm_text(x: object) -> str:
     if x is None:
         return ""
-    s = str(x).strip()
-    s = re.sub(r"\s+", " ", s)
-    return s.lower()
+    return _norm_text_str(str(x))
+
+
+@lru_cache(maxsize=_NORM_CACHE_SIZE)
+def _norm_name_str(s: str) -> str:
+    return _RE_NAME_STRIP.sub("", _norm_text_str(s))
 
 
 def _norm_name(x: object) -> str:
     # 이름은 마스킹(*)이 들어올 수 있으므로, 가능한 한 단순 정규화만 수행
-    s = _norm_text(x)
-    s = re.sub(r"[^0-9a-zA-Z가-힣\*]", "", s)
-    return s
+    if x is None:
+        return ""
+    return _norm_name_str(str(x))
 
-def _norm_birth(x: object) -> str:
-    s = re.sub(r"\D", "", str(x or ""))
+
+@lru_cache(maxsize=_NORM_CACHE_SIZE)
+def _norm_birth_str(s: str) -> str:
+    s = _digits_only(s)
     # 8자리(YYYYMMDD) 우선, 없으면 있는 만큼만 사용
     return s[:8] if len(s) >= 8 else s
 
+
+def _norm_birth(x: object) -> str:
+    return _norm_birth_str(str(x or ""))
+
+@lru_cache(maxsize=_NORM_CACHE_SIZE)
+def _norm_policy_no_str(s: str) -> str:
+    return _alnum_only(s).upper()
+
+
 def _norm_policy_no(x: object) -> str:
     # 증권번호/계약번호는 공백/하이픈/특수문자 차이로 흔들리기 쉬움 → 영숫자만 남기고 대문자
-    s = str(x or "").strip()
-    s = re.sub(r"\s+", "", s)
-    s = re.sub(r"[^0-9a-zA-Z]", "", s)
-    return s.upper()
+    return _norm_policy_no_str(str(x or ""))
 
 def _norm_date(x: object) -> str:
     # 가능한 한 YYYY-MM-DD로 통일 (엑셀 serial / 문자열 / Timestamp 모두 대응)
+    # - 문자열 입력은 캐시 경로(반복되는 날짜 문자열의 pd.to_datetime 재호출 방지)
+    if type(x) is str:
+        return _norm_date_str(x)
+    return _norm_date_impl(x)
+
+
+@lru_cache(maxsize=_NORM_CACHE_SIZE)
+def _norm_date_str(x: str) -> str:
+    return _norm_date_impl(x)
+
+
+_EXCEL_EPOCH = date(1899, 12, 30)
+
+def _excel_serial_to_iso(fx: float) -> str:
+    # 엑셀 serial(1900 체계, 소수부=시각) → 'YYYY-MM-DD' (date + timedelta는 일 단위만 반영)
+    return (_EXCEL_EPOCH + timedelta(days=fx)).isoformat()
+
+def _norm_date_impl(x: object) -> str:
     if x is None:
         return ""
     s = str(x).strip()
     if s == "" or s.lower() in ("nan", "none"):
         return ""
 
+    # [성능] 이미 정규화된 입력은 pd.to_datetime(범용 파서) 없이 바로 반환
+    # - 'YYYY-MM-DD' / 'YYYYMMDD' 문자열(실제 존재하는 날짜일 때만), date/datetime/Timestamp 객체
+    # - 'YYYY-MM-DD HH:MM[:SS]' / 'YYYY-MM-DDTHH:MM...' 은 datetime.fromisoformat(C 구현)으로 처리
+    # - 숫자(20000~60000)는 엑셀 serial로 바로 변환 (기존엔 pd.to_datetime이 ns epoch로 해석해 1970-01-01이 되던 문제 포함)
+    if isinstance(x, str):
+        m = _RE_ISO_DATE.match(s)
+        if m:
+            try:
+                return date(int(m[1]), int(m[2]), int(m[3])).isoformat()
+            except ValueError:
+                pass
+        elif _RE_ISO_DATETIME.match(s):
+            try:
+                return datetime.fromisoformat(s).date().isoformat()
+            except ValueError:
+                pass
+    elif isinstance(x, date):
+        if not pd.isna(x):
+            return x.date().isoformat() if isinstance(x, datetime) else x.isoformat()
+    elif isinstance(x, numbers.Real) and not isinstance(x, bool):
+        if 20000 <= x <= 60000:
+            return _excel_serial_to_iso(float(x))
+
+    # [성능] 숫자·영문이 전혀 없는 문자열('정상', '-', 한글 메모 등)은 pd.to_datetime 결과가 항상 NaT → 바로 fallback
+    if isinstance(x, str) and not _RE_DATE_PARSEABLE.search(s):
+        return _RE_WS.sub("", s).lower()
+
     try:
         # pandas Timestamp / datetime 등
         dt = pd.to_datetime(x, errors="coerce")
@@ -113,32 +246,41 @@ def _norm_date(x: object) -> str:
         pass
 
     # 엑셀 serial 가능성(대략 20000~60000일 사이)
-    try:
-        fx = float(x)
+    # [성능] 숫자형은 위에서 처리됨 → 숫자 모양 문자열('45231', '45231.0')만 float 변환 (예외 기반 분기 제거)
+    if isinstance(x, str) and s.replace(".", "", 1).isdecimal():
+        fx = float(s)
         if 20000 <= fx <= 60000:
-            dt = pd.to_datetime(fx, unit="D", origin="1899-12-30", errors="coerce")
-            if not pd.isna(dt):
-                return dt.date().isoformat()
-    except Exception:
-        pass
+            return _excel_serial_to_iso(fx)
 
     # 마지막 fallback: 공백 제거 후 소문자
-    s = re.sub(r"\s+", "", s)
+    s = _RE_WS.sub("", s)
     return s.lower()
 
 def _norm_premium(x: object) -> int:
     try:
-        return int(re.sub(r"\D", "", str(x or "")) or 0)
+        return int(_digits_only(str(x or "")) or 0)
     except Exception:
         return 0
 
 
-def _sha1(s: str) -> str:
-    return hashlib.sha1(s.encode("utf-8")).hexdigest()
+def _dedup_hash(s: str) -> bytes:
+    """중복 판별용 해시 (BLAKE2b-128, 16바이트 digest → SQLite BLOB)
+    - key/stable/content 해시는 보안 용도가 아닌 멱등 키이므로 SHA1 대신 더 빠른 BLAKE2b 사용
+    - [성능] 동등 비교 전용(화면 미표시)이라 hex 문자열 대신 원시 바이트로 저장: 행/인덱스 키 크기 절반
+    - 구버전 SHA1(hex 40자)은 재계산, hex 32자 값은 BLOB로 database.init_db에서 1회 변환됨
+    """
+    return hashlib.blake2b(s.encode("utf-8"), digest_size=16).digest()
+
+
+def _dedup_hash_parts(*parts: str) -> bytes:
+    """_dedup_hash("|".join(parts))
+    - [성능] 조각별 update()/encode() 반복보다 join 후 1회 해시가 파이썬 호출 수가 적어 더 빠름(결과 동일)
+    """
+    return hashlib.blake2b("|".join(parts).encode("utf-8"), digest_size=16).digest()
 
 
 def _contract_key_hash(customer_id: int, company: object, policy_no: object, product_name: object,
-                       start_date: object, premium: object, insured_birth: object = None, insured_name: object = None) -> str:
+                       start_date: object, premium: object, insured_birth: object = None, insured_name: object = None) -> bytes:
     """계약 유일키(멱등 업로드용)
     - 1순위: (customer_id, policy_no_norm)  ※ 증권번호가 정상적으로 들어오는 경우 가장 안전
     - 2순위: (customer_id, company, product_name, start_date, premium, insured_birth/insured_name)
@@ -149,23 +291,21 @@ def _contract_key_hash(customer_id: int, company: object, policy_no: object, pro
     pol = _norm_policy_no(policy_no)
 
     if pol:
-        base = "|".join(["P", cid, comp, pol])
-    else:
-        # 증권번호가 없을 때는 '상품+일자+보험료+피보험자 식별자' 조합을 사용
-        discr = _norm_birth(insured_birth) or _norm_name(insured_name)
-        base = "|".join([
-            "N",
-            cid,
-            comp,
-            _norm_text(product_name),
-            _norm_date(start_date),
-            str(_norm_premium(premium)),
-            discr
-        ])
-    return _sha1(base)
+        return _dedup_hash_parts("P", cid, comp, pol)
+    # 증권번호가 없을 때는 '상품+일자+보험료+피보험자 식별자' 조합을 사용
+    discr = _norm_birth(insured_birth) or _norm_name(insured_name)
+    return _dedup_hash_parts(
+        "N",
+        cid,
+        comp,
+        _norm_text(product_name),
+        _norm_date(start_date),
+        str(_norm_premium(premium)),
+        discr
+    )
 
 def _contract_stable_hash(customer_id: int, company: object, product_name: object, start_date: object, premium: object,
-                          insured_birth: object = None, insured_name: object = None, insured_gender: object = None) -> str:
+                          insured_birth: object = None, insured_name: object = None, insured_gender: object = None) -> bytes:
     """증권번호가 흔들려도 동일 계약을 찾기 위한 '안정 키'(Unique 아님)
     - (customer_id, company, product_name, start_date, premium, insured_birth/insured_name, insured_gender)
     """
@@ -173,19 +313,18 @@ def _contract_stable_hash(customer_id: int, company: object, product_name: objec
     comp = _norm_text(company)
     discr = _norm_birth(insured_birth) or _norm_name(insured_name)
     gen = _norm_text(insured_gender)
-    base = "|".join([
+    return _dedup_hash_parts(
         "S", cid, comp, _norm_text(product_name), _norm_date(start_date), str(_norm_premium(premium)), discr, gen
-    ])
-    return _sha1(base)
+    )
 
 
 
 def _contract_content_hash(customer_id: int, company: object, product_name: object, policy_no: object, premium: object,
                            status: object, start_date: object, end_date: object,
                            insured_name: object, insured_phone: object, insured_birth: object, insured_gender: object,
-                           coverage_summary: object) -> str:
+                           coverage_summary: object) -> bytes:
     # 내용 변경 여부 판단용(정규화 후 해시)
-    base = "|".join([
+    return _dedup_hash_parts(
         str(customer_id or ""),
         _norm_text(company),
         _norm_text(product_name),
@@ -199,8 +338,92 @@ def _contract_content_hash(customer_id: int, company: object, product_name: obje
         _norm_birth(insured_birth),
         _norm_text(insured_gender),
         _norm_text(coverage_summary),
-    ])
-    return _sha1(base)
+    )
+
+
+def _contract_prepare(customer_id, company, product_name, policy_no, premium, status, start_date, end_date,
+                      insured_name, insured_phone, insured_birth, insured_gender, coverage_summary) -> tuple:
+    """add_contract 전처리(정규화 + 해시): DB 없이 계산되는 순수 함수
+    반환: (prem_int, start_norm, end_norm, pol_norm, key_hash, stable_hash, content_hash)
+    """
+    prem_int = _norm_premium(premium)
+    start_norm = _norm_date(start_date)
+    end_norm = _norm_date(end_date)
+    pol_norm = _norm_policy_no(policy_no)
+    return (prem_int, start_norm, end_norm, pol_norm) + _contract_hashes(
+        customer_id, company, product_name, pol_norm, prem_int, status, start_norm, end_norm,
+        insured_name, insured_phone, insured_birth, insured_gender, coverage_summary
+    )
+
+
+# 이전 정규화(pd.to_datetime 우선)는 숫자형 엑셀 serial을 ns epoch로 읽어 '1970-01-01'로 저장·해시했다
+_LEGACY_SERIAL_DATE = "1970-01-01"
+
+
+def _legacy_serial_contract_hashes(customer_id, company, product_name, pol_norm, prem_int, status, start_date, end_date,
+                                   insured_name, insured_phone, insured_birth, insured_gender, coverage_summary):
+    """숫자형 엑셀 serial 시작일로 들어온 계약의 '이전 정규화 기준' (key_hash, stable_hash), 해당 없으면 None
+    - 시작일만 key/stable 해시에 들어가므로 시작일이 숫자 serial(20000~60000)일 때만 계산
+    """
+    if not (isinstance(start_date, numbers.Real) and not isinstance(start_date, bool) and 20000 <= start_date <= 60000):
+        return None
+    return _contract_hashes(
+        customer_id, company, product_name, pol_norm, prem_int, status, _LEGACY_SERIAL_DATE, end_date,
+        insured_name, insured_phone, insured_birth, insured_gender, coverage_summary,
+    )[:2]
+
+
+_CONTRACT_PREP_ARGS = (
+    "customer_id", "company", "product_name", "policy_no", "premium", "status", "start_date", "end_date",
+    "insured_name", "insured_phone", "insured_birth", "insured_gender", "coverage_summary",
+)
+
+
+def _contract_prep_args(kw: dict) -> tuple:
+    """add_contract 키워드 인자 dict → _contract_prepare 위치 인자 튜플 (없는 키는 함수 기본값과 동일)"""
+    return tuple(kw.get(k, "" if k == "coverage_summary" else None) for k in _CONTRACT_PREP_ARGS)
+
+
+def _contract_prepare_many(arg_rows: list) -> list:
+    """_contract_prepare 일괄 버전: 계약 전처리(정규화 + BLAKE2b 해시)를 DB 쓰기 전에 모두 계산
+    - 계산 중 예외가 난 행은 None → 해당 행은 _add_contract_conn에서 다시 계산(행 단위 실패 격리 유지)
+    - 프로세스 풀은 사용하지 않음: Linux 기본 fork는 스레드가 도는 Streamlit 프로세스를 복제해 자식이 상속된 잠금에서
+      멈출 수 있고, spawn/forkserver는 Streamlit이 __main__으로 바꿔 둔 앱 스크립트를 작업 프로세스마다 다시 실행함
+    """
+    out = []
+    for a in arg_rows:
+        try:
+            out.append(_contract_prepare(*a))
+        except Exception:
+            out.append(None)
+    return out
+
+
+def _contract_hashes(customer_id, company, product_name, policy_no, premium, status, start_date, end_date,
+                     insured_name, insured_phone, insured_birth, insured_gender, coverage_summary) -> tuple:
+    """(key_hash, stable_hash, content_hash)를 한 번에 계산
+    - 세 해시 함수를 따로 부른 결과와 동일, 공통 정규화 값(보험사/상품명/일자/보험료/피보험자 식별자)은 1회만 계산
+    """
+    cid = str(customer_id or "")
+    comp = _norm_text(company)
+    prod = _norm_text(product_name)
+    pol = _norm_policy_no(policy_no)
+    start = _norm_date(start_date)
+    prem = str(_norm_premium(premium))
+    birth = _norm_birth(insured_birth)
+    name = _norm_name(insured_name)
+    gen = _norm_text(insured_gender)
+    discr = birth or name
+    if pol:
+        key_hash = _dedup_hash_parts("P", cid, comp, pol)
+    else:
+        key_hash = _dedup_hash_parts("N", cid, comp, prod, start, prem, discr)
+    stable_hash = _dedup_hash_parts("S", cid, comp, prod, start, prem, discr, gen)
+    content_hash = _dedup_hash_parts(
+        cid, comp, prod, pol, prem, _norm_text(status), start, _norm_date(end_date),
+        name, _norm_text(insured_phone), birth, gen, _norm_text(coverage_summary),
+    )
+    return key_hash, stable_hash, content_hash
 
 
 
@@ -210,11 +433,54 @@ def _pick(row: pd.Series, keys: tuple, default: str = "") -> str:
             return str(row[k]).strip()
     return default
 
+
+def _pick_array(df: pd.DataFrame, keys: tuple, default: str = "") -> list:
+    """[성능] _pick의 컬럼 단위 버전: 행마다 keys를 순서대로 보고 처음으로 비어있지 않은 값을 채택
+    - 결과는 행별 _pick(row, keys, default)와 동일, 컬럼별로 1회만 변환
+    - 다음 후보 컬럼은 아직 비어 있는 행만 확인(모두 채워지면 나머지 후보는 건너뜀)
+    - astype(str) 일괄 변환은 datetime 컬럼 표기가 str(Timestamp)와 달라지므로 사용하지 않음
+    """
+    out = [""] * len(df)
+    todo = range(len(df))
+    for k in keys:
+        if not todo:
+            break
+        if k not in df.columns:
+            continue
+        col = df[k]
+        notna = col.notna().to_numpy()
+        vals = col.to_numpy(dtype=object)
+        for i in todo:
+            if notna[i]:
+                out[i] = str(vals[i]).strip()
+        todo = [i for i in todo if not out[i]]
+    return [v or default for v in out]
+
 # --- Customers (Upsert Logic) ---
 # [queries.py] 내부 upsert_customer_identity 함수 수정
 
-def upsert_customer_identity(*, name, phone, birth_date="", gender="", region="", address="", email="", source="", memo="", custom_data="", match_key=""):
-    """[지능형 고객 저장] 공백 제거 강제 적용"""
+# 고객 upsert SQL (단건/일괄 공용)
+_CUSTOMER_UPDATE_SQL = """
+    UPDATE customers SET
+        birth_date = CASE WHEN ? <> '' THEN ? ELSE birth_date END,
+        gender = CASE WHEN ? <> '' THEN ? ELSE gender END,
+        region = CASE WHEN ? <> '' THEN ? ELSE region END,
+        email = CASE WHEN ? <> '' THEN ? ELSE email END,
+        custom_data = CASE WHEN ? <> '' THEN ? ELSE custom_data END
+    WHERE id = ?
+"""
+_CUSTOMER_INSERT_SQL = """
+    INSERT INTO customers (name, phone, phone_norm, match_key, birth_date, gender, region, address, email, source, memo, custom_data)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_IN_CHUNK = 500  # SQLite 바인딩 변수 한도 내 IN (...) 묶음 크기
+_JSON_EACH_IN = "IN (SELECT value FROM json_each(?))"  # 목록을 JSON 배열 1개로 바인딩하는 IN 절
+
+
+def upsert_customer_identity(*, name, phone, birth_date="", gender="", region="", address="", email="", source="", memo="", custom_data="", match_key="", phone_norm=""):
+    """[지능형 고객 저장] 공백 제거 강제 적용
+    - phone_norm을 넘기면(일괄 전처리된 값) 재정규화 생략
+    """
     
     # 1. [핵심] 이름 내 모든 공백 제거 (예: '노 일용' -> '노일용')
     if name:
@@ -223,7 +489,7 @@ def upsert_customer_identity(*, name, phone, birth_date="", gender="", region=""
     if not name or not phone: return False, "이름/연락처 필수", None
     
     # 2. 전화번호 정규화 (숫자만 남김)
-    phone_norm = normalize_phone(phone)
+    if not phone_norm: phone_norm = normalize_phone(phone)
     
     if not match_key: match_key = make_match_key(name, phone_last4(phone_norm))
 
@@ -235,28 +501,140 @@ def upsert_customer_identity(*, name, phone, birth_date="", gender="", region=""
             cid = int(row[0])
             # 기존 고객 업데이트 시에도 이름은 공백 없는 버전으로 갱신 가능하도록 로직 추가 가능하나,
             # 여기서는 안전하게 기존 로직 유지 (필요 시 name=? 구문 추가 가능)
-            cur.execute("""
-                UPDATE customers SET
-                    birth_date = CASE WHEN ? <> '' THEN ? ELSE birth_date END,
-                    gender = CASE WHEN ? <> '' THEN ? ELSE gender END,
-                    region = CASE WHEN ? <> '' THEN ? ELSE region END,
-                    email = CASE WHEN ? <> '' THEN ? ELSE email END,
-                    custom_data = CASE WHEN ? <> '' THEN ? ELSE custom_data END
-                WHERE id = ?
-            """, (birth_date, birth_date, gender, gender, region, region, email, email, custom_data, custom_data, cid))
+            cur.execute(_CUSTOMER_UPDATE_SQL, (birth_date, birth_date, gender, gender, region, region, email, email, custom_data, custom_data, cid))
             conn.commit()
             return True, "Update", cid
         else:
-            cur.execute("""
-                INSERT INTO customers (name, phone, phone_norm, match_key, birth_date, gender, region, address, email, source, memo, custom_data)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (name, phone, phone_norm, match_key, birth_date, gender, region, address, email, source, memo, custom_data))
+            cur.execute(_CUSTOMER_INSERT_SQL, (name, phone, phone_norm, match_key, birth_date, gender, region, address, email, source, memo, custom_data))
             conn.commit()
             return True, "Insert", int(cur.lastrowid)
     except Exception as e:
         conn.rollback(); return False, str(e), None
     finally: conn.close()
 
+def _fetch_customer_ids_by_phone_norm(cur, phone_norms) -> dict:
+    """phone_norm → 고객 id (동일 phone_norm 다건이면 가장 먼저 생성된 id; 단건 조회 LIMIT 1과 동일)"""
+    keys = list(phone_norms)
+    if not keys:
+        return {}
+    # [성능] 키 목록을 JSON 1개로 바인딩 → 행 수와 무관하게 1문장(자리표시자 묶음 반복 없음)
+    try:
+        cur.execute(
+            f"SELECT phone_norm, MIN(id) FROM customers WHERE phone_norm {_JSON_EACH_IN} GROUP BY phone_norm",
+            (json.dumps(keys, ensure_ascii=False),),
+        )
+        return {pn: int(cid) for pn, cid in cur.fetchall()}
+    except sqlite3.OperationalError:
+        pass
+    found = {}
+    for i in range(0, len(keys), _SQL_IN_CHUNK):
+        chunk = keys[i:i + _SQL_IN_CHUNK]
+        cur.execute(
+            f"SELECT phone_norm, MIN(id) FROM customers WHERE phone_norm IN ({','.join('?' * len(chunk))}) GROUP BY phone_norm",
+            chunk,
+        )
+        found.update({pn: int(cid) for pn, cid in cur.fetchall()})
+    return found
+
+
+_CUSTOMER_MAX_ID_SQL = "SELECT COALESCE(MAX(id), 0) FROM customers"
+_CUSTOMER_NEW_IDS_SQL = "SELECT phone_norm, MIN(id) FROM customers WHERE id > ? GROUP BY phone_norm"
+
+
+def bulk_upsert_customer_identity(conn, rows: list[dict]) -> list[tuple]:
+    """[성능] upsert_customer_identity의 일괄 버전 (단일 커넥션/트랜잭션, 커밋은 호출부)
+    - rows: upsert_customer_identity 키워드 인자 dict 목록
+    - 반환: 입력 순서대로 (ok, msg, cid) — msg는 "Insert"/"Update"/오류
+    - 같은 배치 안에서 동일 phone_norm이 반복되면 첫 행만 Insert, 이후 행은 그 고객 Update(단건 반복 호출과 동일)
+    """
+    results: list = [None] * len(rows)
+    prepared = []
+    for i, r in enumerate(rows):
+        name = r.get("name")
+        if name:
+            name = str(name).replace(" ", "").strip()
+        phone = r.get("phone")
+        if not name or not phone:
+            results[i] = (False, "이름/연락처 필수", None)
+            continue
+        pn = r.get("phone_norm") or normalize_phone(phone)
+        mk = r.get("match_key") or make_match_key(name, phone_last4(pn))
+        prepared.append((i, name, phone, pn, mk, r))
+
+    cur = conn.cursor()
+    existing = _fetch_customer_ids_by_phone_norm(cur, {p[3] for p in prepared})
+
+    def _upd_params(r, cid):
+        b, g, rg, em, cd = (r.get(k, "") for k in ("birth_date", "gender", "region", "email", "custom_data"))
+        return (b, b, g, g, rg, rg, em, em, cd, cd, cid)
+
+    to_insert, new_pns, dup_new = [], set(), []
+    for i, name, phone, pn, mk, r in prepared:
+        if pn in existing:
+            continue
+        if pn in new_pns:
+            dup_new.append((i, pn, r))
+            continue
+        new_pns.add(pn)
+        to_insert.append((
+            name, phone, pn, mk,
+            r.get("birth_date", ""), r.get("gender", ""), r.get("region", ""), r.get("address", ""),
+            r.get("email", ""), r.get("source", ""), r.get("memo", ""), r.get("custom_data", ""),
+        ))
+
+    if to_insert:
+        # [성능] 새 고객 id는 삽입 직전 최대 id 이후 구간만 rowid 범위로 읽어 phone_norm → id 맵에 반영
+        # - 키별 phone_norm 인덱스 조회 대신 새로 들어간 행만 순차 스캔, 못 찾은 키만 기존 조회로 보완
+        cur.execute(_CUSTOMER_MAX_ID_SQL)
+        last_id = cur.fetchone()[0]
+        cur.executemany(_CUSTOMER_INSERT_SQL, to_insert)
+        cur.execute(_CUSTOMER_NEW_IDS_SQL, (last_id,))
+        inserted = {pn: int(cid) for pn, cid in cur.fetchall() if pn in new_pns}
+        if len(inserted) < len(new_pns):
+            inserted.update(_fetch_customer_ids_by_phone_norm(cur, new_pns - inserted.keys()))
+    else:
+        inserted = {}
+
+    to_update = []
+    for i, name, phone, pn, mk, r in prepared:
+        if pn in existing:
+            cid = existing[pn]
+            to_update.append(_upd_params(r, cid))
+            results[i] = (True, "Update", cid)
+        elif results[i] is None and pn in inserted:
+            results[i] = (True, "Insert", inserted[pn])
+    for i, pn, r in dup_new:
+        cid = inserted.get(pn)
+        if cid:
+            to_update.append(_upd_params(r, cid))
+            results[i] = (True, "Update", cid)
+
+    if to_update:
+        cur.executemany(_CUSTOMER_UPDATE_SQL, to_update)
+
+    return [res if res is not None else (False, "고객 저장 실패", None) for res in results]
+
+
+def _bulk_phone_norm_and_match_key(df: pd.DataFrame):
+    """df의 name/phone 컬럼에서 (phone_norm 리스트, match_key 리스트)를 벡터 연산으로 계산.
+    - normalize_phone / make_match_key(name 공백제거, phone_last4)와 동일 결과
+    - 이름/연락처가 비어 있는 행은 빈 문자열(호출부에서 실패 처리)
+    """
+    n = len(df)
+    if n == 0:
+        return [], []
+    names = df["name"] if "name" in df.columns else pd.Series([None] * n, index=df.index)
+    phones = df["phone"] if "phone" in df.columns else pd.Series([None] * n, index=df.index)
+
+    phone_norm = phones.astype("string").str.replace(r"\D", "", regex=True).fillna("")
+    name_clean = names.astype("string").str.replace(" ", "", regex=False).str.strip().fillna("")
+
+    first = name_clean.str[:1]
+    last4 = phone_norm.str[-4:].where(phone_norm.str.len() >= 4, "")
+    match_key = (first + last4).where((first != "") & (last4.str.len() == 4), "")
+    return phone_norm.tolist(), match_key.tolist()
+
+
 # --- [핵심] ETL 연동 저장 함수 ---
 def insert_customer_data(df: pd.DataFrame, source: str = "upload"):
     """[특허 포인트: 자동 분배 저장 알고리즘]"""
@@ -266,25 +644,104 @@ def insert_customer_data(df: pd.DataFrame, source: str = "upload"):
         "fail": 0
     }
 
-    for _, row in df.iterrows():
-        name = row.get('name')
-        phone = row.get('phone')
+    # [성능] 이름/연락처 정규화 + match_key를 pandas 문자열 연산으로 일괄 계산(행 루프는 DB I/O만 담당)
+    phone_norms, match_keys = _bulk_phone_norm_and_match_key(df)
+
+    # [성능] 행은 일반 tuple(name=None)로 순회하고 컬럼→위치 맵으로 접근
+    # - namedtuple 생성 비용 제거 + 식별자로 쓸 수 없는 컬럼명도 그대로 접근 가능
+    cols = {c: i for i, c in enumerate(df.columns)}
+    tuples = list(df.itertuples(index=False, name=None))
+
+    def _get(t, col):
+        i = cols.get(col)
+        return t[i] if i is not None else None
+
+    # [성능] 고객 upsert는 1개 커넥션/1회 커밋으로 일괄 처리 (행마다 연결/커밋 반복 제거)
+    ident_rows, ident_pos = [], []
+    for pos, row in enumerate(tuples):
+        name = _get(row, 'name')
+        phone = _get(row, 'phone')
         if not name or not phone:
-            stats['fail'] += 1
             continue
-
-        ok, msg, cid = upsert_customer_identity(
+        ident_pos.append(pos)
+        ident_rows.append(dict(
             name=name, phone=phone,
-            birth_date=row.get('birth_date') or "",
-            gender=row.get('gender') or "",
-            region=row.get('region') or "",
-            address=row.get('address') or "",
-            email=row.get('email') or "",
+            birth_date=_get(row, 'birth_date') or "",
+            gender=_get(row, 'gender') or "",
+            region=_get(row, 'region') or "",
+            address=_get(row, 'address') or "",
+            email=_get(row, 'email') or "",
             source=source,
-            memo=row.get('memo') or "",
-            custom_data=row.get('custom_data') or "",
-            match_key=row.get('match_key') or ""
-        )
+            memo=_get(row, 'memo') or "",
+            custom_data=_get(row, 'custom_data') or "",
+            match_key=_get(row, 'match_key') or match_keys[pos],
+            phone_norm=phone_norms[pos],
+        ))
+
+    # [성능] 고객 upsert와 계약 반영을 1개 커넥션으로 처리 (계약 행마다 connect/PRAGMA/close 반복 제거)
+    conn = get_connection()
+    try:
+        try:
+            # 고객 일괄 upsert는 처음부터 쓰기 잠금(BEGIN IMMEDIATE) → 조회 후 INSERT 시 잠금 승격 대기 없음
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            ident_results = bulk_upsert_customer_identity(conn, ident_rows)
+            conn.commit()
+        except Exception:
+            # 일괄 처리 실패 시 행 단위 upsert로 자가 복구(행별 실패 격리)
+            conn.rollback()
+            ident_results = [upsert_customer_identity(**r) for r in ident_rows]
+        ident_by_pos = dict(zip(ident_pos, ident_results))
+        try:
+            _insert_contract_rows(conn, tuples, _get, ident_by_pos, stats)
+        except Exception:
+            # 미커밋 구간이 버려지므로 최근 처리 캐시도 함께 비움
+            clear_recent_contracts()
+            raise
+    finally:
+        conn.close()
+
+    msg = (
+        f"✅ 고객: 신규 {stats['new_cust']} / 업데이트 {stats['update_cust']}  |  "
+        f"계약: 신규 {stats['new_cont']} / 변경 {stats['update_cont']} / 유지 {stats['same_cont']} / 보류 {stats['ambig_cont']}  |  "
+        f"실패 {stats['fail']}"
+    )
+
+    return True, msg, stats
+
+
+_CONTRACT_COMMIT_EVERY = 500
+
+
+def _add_contract_savepoint(cur, **kwargs) -> str:
+    """공유 커서에서 계약 1건 반영(_add_contract_conn) + 행 단위 SAVEPOINT
+    - 실패("fail"/예외) 시 이 행의 변경만 되돌리고 "fail" 반환, 커밋은 호출부 책임
+    """
+    cur.execute("SAVEPOINT kfit_contract")
+    try:
+        res = _add_contract_conn(cur, **kwargs)
+    except Exception:
+        res = "fail"
+    if res == "fail":
+        cur.execute("ROLLBACK TO SAVEPOINT kfit_contract")
+    cur.execute("RELEASE SAVEPOINT kfit_contract")
+    return res
+
+
+def _insert_contract_rows(conn, tuples, _get, ident_by_pos, stats):
+    """insert_customer_data의 계약 반영 단계 (공유 커넥션 사용)
+    - 계약 전처리(정규화 + 해시)는 DB 쓰기 전에 일괄 계산
+    - 행마다 SAVEPOINT로 감싸 실패 행만 되돌림(기존 행별 트랜잭션과 동일한 실패 격리)
+    - _CONTRACT_COMMIT_EVERY 행마다 커밋해 쓰기 잠금 점유 시간을 제한
+    """
+    cur = conn.cursor()
+    jobs = []
+    for pos, row in enumerate(tuples):
+        if pos not in ident_by_pos:
+            stats['fail'] += 1
+            continue
+
+        ok, msg, cid = ident_by_pos[pos]
         if not ok or not cid:
             stats['fail'] += 1
             continue
@@ -294,11 +751,11 @@ def insert_customer_data(df: pd.DataFrame, source: str = "upload"):
         else:
             stats['update_cust'] += 1
 
-        fin_data = row.get("financial")
+        fin_data = _get(row, 'financial')
         if not isinstance(fin_data, dict):
-            fin_data = row.get("financial_temp")
+            fin_data = _get(row, 'financial_temp')
         if isinstance(fin_data, dict):
-            res = add_contract(
+            jobs.append(dict(
                 customer_id=cid,
                 company=fin_data.get('company'),
                 product_name=fin_data.get('product_name'),
@@ -312,28 +769,182 @@ def insert_customer_data(df: pd.DataFrame, source: str = "upload"):
                 insured_birth=fin_data.get('insured_birth'),
                 insured_gender=fin_data.get('insured_gender'),
                 coverage_summary=fin_data.get('coverage_summary', "")
-            )
-            if res == "insert":
-                stats['new_cont'] += 1
-            elif res == "update":
-                stats['update_cont'] += 1
-            elif res == "same":
-                stats['same_cont'] += 1
-            elif res == "ambig":
-                stats['ambig_cont'] += 1
-            else:
-                stats['fail'] += 1
+            ))
 
-    msg = (
-        f"✅ 고객: 신규 {stats['new_cust']} / 업데이트 {stats['update_cust']}  |  "
-        f"계약: 신규 {stats['new_cont']} / 변경 {stats['update_cont']} / 유지 {stats['same_cont']} / 보류 {stats['ambig_cont']}  |  "
-        f"실패 {stats['fail']}"
-    )
+    preps = _contract_prepare_many([_contract_prep_args(kw) for kw in jobs])
+    pending = 0
+    for kw, prep in zip(jobs, preps):
+        # 트랜잭션 밖의 SAVEPOINT는 RELEASE 시 바로 커밋되므로(행마다 커밋) 먼저 쓰기 트랜잭션을 연다
+        if not conn.in_transaction:
+            cur.execute("BEGIN IMMEDIATE")
+        res = _add_contract_savepoint(cur, prepared=prep, **kw)
+        if res == "insert":
+            stats['new_cont'] += 1
+        elif res == "update":
+            stats['update_cont'] += 1
+        elif res == "same":
+            stats['same_cont'] += 1
+        elif res == "ambig":
+            stats['ambig_cont'] += 1
+        else:
+            stats['fail'] += 1
 
-    return True, msg, stats
+        pending += 1
+        if pending >= _CONTRACT_COMMIT_EVERY:
+            conn.commit()
+            pending = 0
+
+    conn.commit()
 
 # --- Contracts & Dual Verification ---
 
+# 이전 정규화 해시(key_hash 또는 고객+stable_hash)로 저장된 계약 1건 조회
+_CONTRACT_LEGACY_MATCH_SQL = """
+    SELECT id FROM contracts WHERE key_hash = ?
+    UNION ALL
+    SELECT id FROM (
+        SELECT id FROM contracts WHERE customer_id = ? AND stable_hash = ? ORDER BY id ASC LIMIT 1
+    )
+    LIMIT 1
+"""
+
+# add_contract 1~3차 매칭 후보 일괄 조회 (tier, id, content_hash, key_hash, policy_no_norm)
+_CONTRACT_MATCH_SQL = """
+    SELECT 1, id, content_hash, key_hash, COALESCE(policy_no_norm,'') FROM (
+        SELECT id, content_hash, key_hash, policy_no_norm FROM contracts WHERE key_hash = ? LIMIT 1
+    )
+    UNION ALL
+    SELECT 2, id, content_hash, key_hash, COALESCE(policy_no_norm,'') FROM (
+        SELECT id, content_hash, key_hash, policy_no_norm FROM contracts
+        WHERE customer_id = ? AND policy_no_norm = ? ORDER BY id ASC LIMIT 5
+    )
+    UNION ALL
+    SELECT 3, id, content_hash, key_hash, COALESCE(policy_no_norm,'') FROM (
+        SELECT id, content_hash, key_hash, policy_no_norm FROM contracts
+        WHERE customer_id = ? AND stable_hash = ? ORDER BY id ASC LIMIT 10
+    )
+"""
+
+# ---------------------------------------------------------
+# [성능] 최근 처리 계약 LRU (같은 세션 재업로드 시 DB 조회 생략)
+# - (key_hash, content_hash) → 계약 id. 적중하면 매칭/비교 없이 바로 'same'
+# - 해당 계약 행이 갱신되면 그 id에 걸린 항목을 모두 제거(다른 입력으로 내용이 바뀐 경우 대비)
+# - 항목 추가는 트랜잭션 커밋 이후에만 반영(롤백되면 버려짐) → 호출부의 롤백 처리와 무관하게 DB와 일치
+# - 삭제/초기화 시에는 통째로 비움(clear_recent_contracts)
+# ---------------------------------------------------------
+_RECENT_MAX = 4096
+_RECENT_CONTRACTS: "OrderedDict[tuple, int]" = OrderedDict()
+_RECENT_BY_ID: dict = {}
+_RECENT_LOCK = threading.Lock()
+
+def _recent_contract_hit(key) -> bool:
+    with _RECENT_LOCK:
+        if key not in _RECENT_CONTRACTS:
+            return False
+        _RECENT_CONTRACTS.move_to_end(key)
+        return True
+
+def _recent_contract_put(cur, key, contract_id, changed: bool = False):
+    """cur 연결의 트랜잭션이 커밋되면 캐시에 반영 (갱신된 id의 기존 항목은 즉시 제거)"""
+    if contract_id is None:
+        return
+    if changed:
+        with _RECENT_LOCK:
+            for k in _RECENT_BY_ID.pop(contract_id, ()):
+                _RECENT_CONTRACTS.pop(k, None)
+    _kfit_db.run_after_commit(cur.connection, lambda: _recent_contract_add(key, contract_id, changed))
+
+def _recent_contract_add(key, contract_id, changed: bool = False):
+    with _RECENT_LOCK:
+        if changed:
+            for k in _RECENT_BY_ID.pop(contract_id, ()):
+                _RECENT_CONTRACTS.pop(k, None)
+        old_id = _RECENT_CONTRACTS.pop(key, None)
+        if old_id is not None and old_id != contract_id:
+            _RECENT_BY_ID.get(old_id, set()).discard(key)
+        _RECENT_CONTRACTS[key] = contract_id
+        _RECENT_BY_ID.setdefault(contract_id, set()).add(key)
+        while len(_RECENT_CONTRACTS) > _RECENT_MAX:
+            k, cid = _RECENT_CONTRACTS.popitem(last=False)
+            keys = _RECENT_BY_ID.get(cid)
+            if keys is not None:
+                keys.discard(k)
+                if not keys:
+                    del _RECENT_BY_ID[cid]
+
+def clear_recent_contracts():
+    """최근 처리 계약 캐시 초기화 (롤백/삭제 등 DB가 캐시와 달라질 수 있을 때)"""
+    with _RECENT_LOCK:
+        _RECENT_CONTRACTS.clear()
+        _RECENT_BY_ID.clear()
+    _corp_search_cache_clear()
+
+
+# add_contract 갱신 SQL (일반 갱신/키 충돌 갱신 공용)
+# - key_hash = COALESCE(?, key_hash): 새 키를 넘기면 교체, None이면 기존 키 유지
+_UPDATE_CONTRACT_SQL = """
+    UPDATE contracts SET
+        company = ?,
+        product_name = ?,
+        policy_no = ?,
+        policy_no_norm = ?,
+        premium = ?,
+        status = ?,
+        start_date = ?,
+        end_date = ?,
+        insured_name = ?,
+        insured_phone = ?,
+        insured_birth = ?,
+        insured_gender = ?,
+        coverage_summary = ?,
+        policyholder_name = ?,
+        policyholder_type = ?,
+        policyholder_norm = ?,
+        policyholder_phone = ?,
+        primary_role = ?,
+        stable_hash = ?,
+        content_hash = ?,
+        key_hash = COALESCE(?, key_hash)
+    WHERE id = ?
+"""
+
+# [성능] add_contract 경로의 나머지 SQL도 모듈 상수로 고정(문자열이 같으면 sqlite3 문장 캐시에서 재사용)
+_CONTRACT_INSERT_SQL = """
+    INSERT INTO contracts (
+        customer_id, company, product_name, policy_no, policy_no_norm,
+        premium, status, start_date, end_date, coverage_summary,
+        insured_name, insured_phone, insured_birth, insured_gender,
+        policyholder_name, policyholder_type, policyholder_norm, policyholder_phone, primary_role,
+        stable_hash, key_hash, content_hash
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+# [성능] SQLite 3.24+: key_hash 충돌을 예외 대신 ON CONFLICT DO NOTHING(rowcount 0)으로 판별
+_CONTRACT_INSERT_OR_SKIP_SQL = (
+    _CONTRACT_INSERT_SQL.rstrip() + " ON CONFLICT(key_hash) DO NOTHING"
+    if sqlite3.sqlite_version_info >= (3, 24, 0) else None
+)
+_CONTRACT_MATCH_KEY_ONLY_SQL = "SELECT 1, id, content_hash, key_hash, '' FROM contracts WHERE key_hash = ? LIMIT 1"
+_CONTRACT_BY_KEY_SQL = "SELECT id, content_hash FROM contracts WHERE key_hash = ? LIMIT 1"
+
+
+def _update_contract_row(cur, match_id, update_vals, key_hash=None):
+    """계약 행 갱신 (key_hash=None이면 기존 키 유지)"""
+    cur.execute(_UPDATE_CONTRACT_SQL, (*update_vals, key_hash, match_id))
+
+
+def _insert_contract_row(cur, params) -> bool:
+    """계약 행 INSERT, key_hash가 이미 있으면 False (그 외 제약 위반은 IntegrityError 그대로)
+    - key_hash UNIQUE 인덱스가 없으면(마이그레이션 실패 DB) ON CONFLICT 대상이 없어 일반 INSERT로 후퇴
+    """
+    if _CONTRACT_INSERT_OR_SKIP_SQL:
+        try:
+            cur.execute(_CONTRACT_INSERT_OR_SKIP_SQL, params)
+            return cur.rowcount > 0
+        except sqlite3.OperationalError:
+            pass
+    cur.execute(_CONTRACT_INSERT_SQL, params)
+    return True
+
 def add_contract(customer_id, company, product_name, policy_no, premium, status, start_date, end_date,
                  insured_name=None, insured_phone=None, insured_birth=None, insured_gender=None, coverage_summary="",
                  policyholder_name=None, policyholder_phone=None, policyholder_type=None, policyholder_norm=None,
@@ -345,257 +956,338 @@ def add_contract(customer_id, company, product_name, policy_no, premium, status,
     3) 내용(content_hash)이 동일하면 UPDATE하지 않고 'same' 처리
     반환: "insert" | "update" | "same" | "ambig" | "fail"
     """
-    conn = get_connection(); cur = conn.cursor()
-    try:
-        prem_int = _norm_premium(premium)
-        start_norm = _norm_date(start_date)
-        end_norm = _norm_date(end_date)
-        pol_norm = _norm_policy_no(policy_no)
-        stable_hash = _contract_stable_hash(customer_id, company, product_name, start_norm, prem_int,
-                                            insured_birth, insured_name, insured_gender)
-        key_hash = _contract_key_hash(customer_id, company, pol_norm, product_name, start_norm, prem_int,
-                                      insured_birth, insured_name)
-        content_hash = _contract_content_hash(
-            customer_id, company, product_name, pol_norm, prem_int, status, start_norm, end_norm,
-            insured_name, insured_phone, insured_birth, insured_gender, coverage_summary
-        )
-
-        # --------------------------
-        # ---------------------------------------------------------
-        # [데이터(db포함) 오류] 계약자(Policyholder) 정보 정규화/보강
-        # - 계약 표시/법인 검색/상담주체(primary_role) 분기에서 사용
-        # - 정책:
-        #   * policyholder_name 미제공 시: insured_name으로 대체(표시/검색 최소 보장)
-        #   * type/norm 미제공 시: 휴리스틱으로 자동 산출
-        # ---------------------------------------------------------
-        ph_name = (policyholder_name or "").strip()
-        if not ph_name:
-            ph_name = (insured_name or "").strip()
-        ph_phone = (policyholder_phone or "").strip()
-        ph_type = (policyholder_type or "").strip()
-        if not ph_type:
-            ph_type = "CORP" if _is_corporate_name(ph_name) else "PERSON"
-        ph_norm = (policyholder_norm or "").strip()
-        if not ph_norm:
-            ph_norm = _norm_org_name(ph_name)
-        pr_role = (primary_role or "").strip()
-        if not pr_role:
-            # 기본값: 계약자 기준(POLICYHOLDER). 단, 계약자가 법인이며 피보험자가 따로 있으면 INSURED로 둔다.
-            if ph_type == "CORP" and (insured_name or "").strip() and ph_name and ph_name.replace(" ", "") != (insured_name or "").strip().replace(" ", ""):
-                pr_role = "INSURED"
-            else:
-                pr_role = "POLICYHOLDER"
-
-        # 1) key_hash 직접 매칭
-        # --------------------------
-        cur.execute("SELECT id, content_hash, key_hash FROM contracts WHERE key_hash = ? LIMIT 1", (key_hash,))
-        row = cur.fetchone()
-        match_id = None
-        existing_content = None
-        existing_key = None
-
-        if row:
-            match_id, existing_content, existing_key = row
-
-        # --------------------------
-        # 2) policy_no_norm 매칭 (증권번호 포맷 흔들림/기존 key_hash 방식 차이 대비)
-        # --------------------------
-        if match_id is None and pol_norm:
+    with db() as conn:
+        cur = conn.cursor()
+        try:
+            # [성능/정합성] 조회(1~3차 매칭)와 INSERT/UPDATE를 하나의 쓰기 트랜잭션으로 묶음
+            # - 시작 시점에 쓰기 잠금을 잡아 매칭 후 다른 연결이 끼어드는 경합을 방지
+            # - 바깥 db() 트랜잭션 안에서 호출되면 SAVEPOINT로 자기 변경만 되돌릴 수 있게 함
+            if not conn.in_transaction:
+                cur.execute("BEGIN IMMEDIATE")
+            cur.execute("SAVEPOINT kfit_add_contract")
+            res = _add_contract_conn(
+                cur, customer_id, company, product_name, policy_no, premium, status, start_date, end_date,
+                insured_name, insured_phone, insured_birth, insured_gender, coverage_summary,
+                policyholder_name, policyholder_phone, policyholder_type, policyholder_norm, primary_role,
+            )
+            cur.execute("RELEASE SAVEPOINT kfit_add_contract")
+            conn.commit()
+            return res
+        except Exception:
+            # 커밋되지 않은 결과가 최근 처리 캐시에 남지 않도록 비움
+            clear_recent_contracts()
             try:
-                cur.execute(
-                    "SELECT id, content_hash, key_hash FROM contracts WHERE customer_id = ? AND policy_no_norm = ? ORDER BY id ASC LIMIT 5",
-                    (customer_id, pol_norm)
-                )
-                rows = cur.fetchall()
-                if rows:
-                    # 완전 동일 내용이 있으면 same
-                    for r in rows:
-                        if r[1] == content_hash:
-                            match_id, existing_content, existing_key = r[0], r[1], r[2]
-                            break
-                    if match_id is None and len(rows) == 1:
-                        match_id, existing_content, existing_key = rows[0][0], rows[0][1], rows[0][2]
+                cur.execute("ROLLBACK TO SAVEPOINT kfit_add_contract")
+                cur.execute("RELEASE SAVEPOINT kfit_add_contract")
             except Exception:
-                # 컬럼이 아직 없거나(마이그레이션 전) 등의 예외는 stable_hash로 이어서 처리
                 pass
-
-        # --------------------------
-        # 3) stable_hash 매칭 (증권번호 없거나 바뀌어도 동일 계약을 찾기)
-        # --------------------------
-        if match_id is None and stable_hash:
             try:
-                cur.execute(
-                    "SELECT id, content_hash, key_hash, COALESCE(policy_no_norm,'') FROM contracts WHERE customer_id = ? AND stable_hash = ? ORDER BY id ASC LIMIT 10",
-                    (customer_id, stable_hash)
-                )
-                rows = cur.fetchall()
-                if rows:
-                    # 완전 동일 내용이 있으면 same
-                    for r in rows:
-                        if r[1] == content_hash:
-                            match_id, existing_content, existing_key = r[0], r[1], r[2]
-                            break
-
-                    if match_id is None:
-                        if len(rows) == 1:
-                            match_id, existing_content, existing_key = rows[0][0], rows[0][1], rows[0][2]
-                        else:
-                            # 여러 개가 걸렸는데 증권번호가 서로 다르면 실제로 복수 계약일 수 있음 → 안전하게 ambiguous 처리(추가 입력 방지)
-                            policy_set = set([r[3] for r in rows if r[3]])
-                            if (not pol_norm) and len(policy_set) == 0:
-                                # 모두 증권번호 없음 → 중복으로 보는 편이 안전(첫 번째로 귀속)
-                                match_id, existing_content, existing_key = rows[0][0], rows[0][1], rows[0][2]
-                            else:
-                                return "ambig"
+                conn.rollback()
             except Exception:
                 pass
+            return "fail"
 
-        # --------------------------
-        # Match found → same/update
-        # --------------------------
-        if match_id is not None:
-            if existing_content == content_hash:
-                return "same"
 
-            # update (키 갱신은 충돌시 기존 키 유지)
-            try:
-                cur.execute("""
-                    UPDATE contracts SET
-                        company = ?,
-                        product_name = ?,
-                        policy_no = ?,
-                        policy_no_norm = ?,
-                        premium = ?,
-                        status = ?,
-                        start_date = ?,
-                        end_date = ?,
-                        insured_name = ?,
-                        insured_phone = ?,
-                        insured_birth = ?,
-                        insured_gender = ?,
-                        coverage_summary = ?,
-                        policyholder_name = ?,
-                        policyholder_type = ?,
-                        policyholder_norm = ?,
-                        policyholder_phone = ?,
-                        primary_role = ?,
-                        stable_hash = ?,
-                        content_hash = ?,
-                        key_hash = ?
-                    WHERE id = ?
-                """, (
-                    company, product_name, policy_no, pol_norm, prem_int, status, start_norm, end_norm,
-                    insured_name, insured_phone, insured_birth, insured_gender, coverage_summary,
-                    ph_name, ph_type, ph_norm, ph_phone, pr_role,
-                    stable_hash, content_hash, key_hash,
-                    match_id
-                ))
-                conn.commit()
-                return "update"
-            except sqlite3.IntegrityError:
-                # key_hash 충돌(이미 동일 key_hash가 다른 행에 존재) → 기존 key 유지하고 업데이트
-                cur.execute("""
-                    UPDATE contracts SET
-                        company = ?,
-                        product_name = ?,
-                        policy_no = ?,
-                        policy_no_norm = ?,
-                        premium = ?,
-                        status = ?,
-                        start_date = ?,
-                        end_date = ?,
-                        insured_name = ?,
-                        insured_phone = ?,
-                        insured_birth = ?,
-                        insured_gender = ?,
-                        coverage_summary = ?,
-                        policyholder_name = ?,
-                        policyholder_type = ?,
-                        policyholder_norm = ?,
-                        policyholder_phone = ?,
-                        primary_role = ?,
-                        stable_hash = ?,
-                        content_hash = ?
-                    WHERE id = ?
-                """, (
-                    company, product_name, policy_no, pol_norm, prem_int, status, start_norm, end_norm,
-                    insured_name, insured_phone, insured_birth, insured_gender, coverage_summary,
-                    stable_hash, content_hash,
-                    match_id
-                ))
-                conn.commit()
-                return "update"
+def add_contracts_bulk(rows) -> list:
+    """계약 여러 건을 1개 커넥션·1개 커서·1회 커밋으로 반영 (add_contract의 일괄 버전)
 
-        # --------------------------
-        # No match → insert
-        # --------------------------
+    rows: add_contract 키워드 인자 dict 목록
+    반환: 행별 결과 목록("insert" | "update" | "same" | "ambig" | "fail"), 트랜잭션 실패 시 전부 "fail"
+    - 같은 커서에서 상수 SQL을 반복 실행하므로 prepared statement가 행마다 재사용됨
+    """
+    rows = list(rows or [])
+    if not rows:
+        return []
+    with db() as conn:
+        cur = conn.cursor()
         try:
-            cur.execute("""
-                INSERT INTO contracts (
-                    customer_id, company, product_name, policy_no, policy_no_norm,
-                    premium, status, start_date, end_date, coverage_summary,
-                    insured_name, insured_phone, insured_birth, insured_gender,
-                    policyholder_name, policyholder_type, policyholder_norm, policyholder_phone, primary_role,
-                    stable_hash, key_hash, content_hash
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                customer_id, company, product_name, policy_no, pol_norm,
-                prem_int, status, start_norm, end_norm, coverage_summary,
-                insured_name, insured_phone, insured_birth, insured_gender,
-                ph_name, ph_type, ph_norm, ph_phone, pr_role,
-                stable_hash, key_hash, content_hash
-            ))
+            if not conn.in_transaction:
+                cur.execute("BEGIN IMMEDIATE")
+            results = [_add_contract_savepoint(cur, **r) for r in rows]
             conn.commit()
-            return "insert"
-        except sqlite3.IntegrityError:
-            # 이미 들어간 경우(key_hash 유일 제약) → same/update로 정리
-            cur.execute("SELECT id, content_hash FROM contracts WHERE key_hash = ? LIMIT 1", (key_hash,))
-            row = cur.fetchone()
-            if row:
-                if row[1] == content_hash:
-                    return "same"
-                # 다른 내용이면 해당 행 업데이트
-                match_id = row[0]
-                cur.execute("""
-                    UPDATE contracts SET
-                        company = ?,
-                        product_name = ?,
-                        policy_no = ?,
-                        policy_no_norm = ?,
-                        premium = ?,
-                        status = ?,
-                        start_date = ?,
-                        end_date = ?,
-                        insured_name = ?,
-                        insured_phone = ?,
-                        insured_birth = ?,
-                        insured_gender = ?,
-                        coverage_summary = ?,
-                        policyholder_name = ?,
-                        policyholder_type = ?,
-                        policyholder_norm = ?,
-                        policyholder_phone = ?,
-                        primary_role = ?,
-                        stable_hash = ?,
-                        content_hash = ?
-                    WHERE id = ?
-                """, (
-                    company, product_name, policy_no, pol_norm, prem_int, status, start_norm, end_norm,
-                    insured_name, insured_phone, insured_birth, insured_gender, coverage_summary,
-                    stable_hash, content_hash, match_id
-                ))
-                conn.commit()
-                return "update"
-            return "fail"
+            return results
+        except Exception:
+            clear_recent_contracts()
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            return ["fail"] * len(rows)
+
 
+def _add_contract_conn(cur, customer_id, company, product_name, policy_no, premium, status, start_date, end_date,
+                        insured_name=None, insured_phone=None, insured_birth=None, insured_gender=None, coverage_summary="",
+                        policyholder_name=None, policyholder_phone=None, policyholder_type=None, policyholder_norm=None,
+                        primary_role=None, prepared=None):
+    """add_contract 본체 (호출부가 연 커넥션/트랜잭션 안에서 실행, 커밋은 호출부 책임)
+    - 일괄 반영 시 한 커넥션으로 여러 계약을 처리하기 위해 분리
+    - prepared: 같은 인자로 미리 계산한 _contract_prepare 결과(일괄 전처리 시), 없으면 여기서 계산
+    """
+    if prepared is None:
+        prepared = _contract_prepare(
+            customer_id, company, product_name, policy_no, premium, status, start_date, end_date,
+            insured_name, insured_phone, insured_birth, insured_gender, coverage_summary,
+        )
+    prem_int, start_norm, end_norm, pol_norm, key_hash, stable_hash, content_hash = prepared
+    recent_key = (key_hash, content_hash)
+    if _recent_contract_hit(recent_key):
+        return "same"
+
+    # --------------------------
+    # ---------------------------------------------------------
+    # [데이터(db포함) 오류] 계약자(Policyholder) 정보 정규화/보강
+    # - 계약 표시/법인 검색/상담주체(primary_role) 분기에서 사용
+    # - 정책:
+    #   * policyholder_name 미제공 시: insured_name으로 대체(표시/검색 최소 보장)
+    #   * type/norm 미제공 시: 휴리스틱으로 자동 산출
+    # ---------------------------------------------------------
+    ins_name = (insured_name or "").strip()
+    ph_name = (policyholder_name or "").strip()
+    if not ph_name:
+        ph_name = ins_name
+    ph_phone = (policyholder_phone or "").strip()
+    ph_type = (policyholder_type or "").strip()
+    if not ph_type:
+        ph_type = "CORP" if _is_corporate_name(ph_name) else "PERSON"
+    ph_norm = (policyholder_norm or "").strip()
+    if not ph_norm:
+        ph_norm = _norm_org_name(ph_name)
+    pr_role = (primary_role or "").strip()
+    if not pr_role:
+        # 기본값: 계약자 기준(POLICYHOLDER). 단, 계약자가 법인이며 피보험자가 따로 있으면 INSURED로 둔다.
+        if ph_type == "CORP" and ins_name and ph_name and ph_name.translate(_WS_DEL) != ins_name.translate(_WS_DEL):
+            pr_role = "INSURED"
+        else:
+            pr_role = "POLICYHOLDER"
+    # 갱신 경로 공용 파라미터(_UPDATE_CONTRACT_SQL의 key_hash/id 앞부분)
+    update_vals = (
+        company, product_name, policy_no, pol_norm, prem_int, status, start_norm, end_norm,
+        insured_name, insured_phone, insured_birth, insured_gender, coverage_summary,
+        ph_name, ph_type, ph_norm, ph_phone, pr_role,
+        stable_hash, content_hash,
+    )
+
+    # 1~3차 매칭 후보를 단일 UNION ALL 쿼리로 한 번에 조회 (tier 1=key_hash, 2=policy_no_norm, 3=stable_hash)
+    # - 증권번호가 없으면 2차 조건에 NULL을 넣어 결과 0건
+    # - 컬럼 미존재(마이그레이션 전) 등으로 실패하면 key_hash 단건 조회로 후퇴
+    # --------------------------
+    try:
+        cur.execute(_CONTRACT_MATCH_SQL, (key_hash, customer_id, pol_norm or None, customer_id, stable_hash))
+        fetched = cur.fetchall()
     except Exception:
+        cur.execute(_CONTRACT_MATCH_KEY_ONLY_SQL, (key_hash,))
+        fetched = cur.fetchall()
+    rows_t1, rows_t2, rows_t3 = [], [], []
+    for r in fetched:
+        (rows_t1, rows_t2, rows_t3)[r[0] - 1].append(r[1:])
+
+    match_id = None
+    existing_content = None
+    existing_key = None
+
+    # 1) key_hash 직접 매칭
+    if rows_t1:
+        match_id, existing_content, existing_key = rows_t1[0][0], rows_t1[0][1], rows_t1[0][2]
+
+    # --------------------------
+    # 2) policy_no_norm 매칭 (증권번호 포맷 흔들림/기존 key_hash 방식 차이 대비)
+    # --------------------------
+    if match_id is None and pol_norm:
+        rows = rows_t2
+        if rows:
+            # 완전 동일 내용이 있으면 same
+            for r in rows:
+                if r[1] == content_hash:
+                    match_id, existing_content, existing_key = r[0], r[1], r[2]
+                    break
+            if match_id is None and len(rows) == 1:
+                match_id, existing_content, existing_key = rows[0][0], rows[0][1], rows[0][2]
+
+    # --------------------------
+    # 3) stable_hash 매칭 (증권번호 없거나 바뀌어도 동일 계약을 찾기)
+    # --------------------------
+    if match_id is None and stable_hash:
+        rows = rows_t3
+        if rows:
+            # 완전 동일 내용이 있으면 same
+            for r in rows:
+                if r[1] == content_hash:
+                    match_id, existing_content, existing_key = r[0], r[1], r[2]
+                    break
+
+            if match_id is None:
+                if len(rows) == 1:
+                    match_id, existing_content, existing_key = rows[0][0], rows[0][1], rows[0][2]
+                else:
+                    # 여러 개가 걸렸는데 증권번호가 서로 다르면 실제로 복수 계약일 수 있음 → 안전하게 ambiguous 처리(추가 입력 방지)
+                    policy_set = {r[3] for r in rows if r[3]}
+                    if (not pol_norm) and not policy_set:
+                        # 모두 증권번호 없음 → 중복으로 보는 편이 안전(첫 번째로 귀속)
+                        match_id, existing_content, existing_key = rows[0][0], rows[0][1], rows[0][2]
+                    else:
+                        return "ambig"
+
+    # --------------------------
+    # Match found → same/update
+    # --------------------------
+    if match_id is not None:
+        if existing_content == content_hash:
+            _recent_contract_put(cur, recent_key, match_id)
+            return "same"
+
+        # update (키 갱신은 충돌시 기존 키 유지)
         try:
-            conn.rollback()
-        except Exception:
-            pass
-        return "fail"
-    finally:
-        conn.close()
+            _update_contract_row(cur, match_id, update_vals, key_hash)
+        except sqlite3.IntegrityError:
+            # key_hash 충돌(이미 동일 key_hash가 다른 행에 존재) → 기존 key 유지하고 업데이트
+            _update_contract_row(cur, match_id, update_vals, None)
+        _recent_contract_put(cur, recent_key, match_id, changed=True)
+        return "update"
+
+    # --------------------------
+    # 이전 정규화('1970-01-01')로 저장된 계약 → 실제 날짜/해시로 갱신(지연 복구, 중복 삽입 방지)
+    # --------------------------
+    legacy = _legacy_serial_contract_hashes(
+        customer_id, company, product_name, pol_norm, prem_int, status, start_date, end_date,
+        insured_name, insured_phone, insured_birth, insured_gender, coverage_summary,
+    )
+    if legacy is not None:
+        cur.execute(_CONTRACT_LEGACY_MATCH_SQL, (legacy[0], customer_id, legacy[1]))
+        row = cur.fetchone()
+        if row:
+            try:
+                _update_contract_row(cur, row[0], update_vals, key_hash)
+            except sqlite3.IntegrityError:
+                _update_contract_row(cur, row[0], update_vals, None)
+            _recent_contract_put(cur, recent_key, row[0], changed=True)
+            return "update"
+
+    # --------------------------
+    # No match → insert
+    # --------------------------
+    try:
+        inserted = _insert_contract_row(cur, (
+            customer_id, company, product_name, policy_no, pol_norm,
+            prem_int, status, start_norm, end_norm, coverage_summary,
+            insured_name, insured_phone, insured_birth, insured_gender,
+            ph_name, ph_type, ph_norm, ph_phone, pr_role,
+            stable_hash, key_hash, content_hash
+        ))
+    except sqlite3.IntegrityError:
+        inserted = False
+    if inserted:
+        _recent_contract_put(cur, recent_key, cur.lastrowid)
+        return "insert"
+
+    # 이미 들어간 경우(key_hash 유일 제약) → same/update로 정리
+    cur.execute(_CONTRACT_BY_KEY_SQL, (key_hash,))
+    row = cur.fetchone()
+    if row:
+        if row[1] == content_hash:
+            _recent_contract_put(cur, recent_key, row[0])
+            return "same"
+        # 다른 내용이면 해당 행 업데이트
+        match_id = row[0]
+        _update_contract_row(cur, match_id, update_vals, None)
+        _recent_contract_put(cur, recent_key, match_id, changed=True)
+        return "update"
+    return "fail"
+
+def _fetch_customers_by_match_key(cur, match_keys) -> dict:
+    """match_key 목록 → {match_key: [(id, name), ...]} (일괄 조회, id 오름차순)"""
+    out: dict = {}
+    keys = list(match_keys)
+    if not keys:
+        return out
+    # [성능] 고유 match_key 전체를 JSON 1개로 바인딩해 1문장으로 조회(청크 반복 없음), 미지원 시 IN 청크로 후퇴
+    try:
+        cur.execute(
+            f"SELECT id, name, match_key FROM customers WHERE match_key {_JSON_EACH_IN} ORDER BY id",
+            (json.dumps(keys, ensure_ascii=False),),
+        )
+        for cid, name, mk in cur.fetchall():
+            out.setdefault(mk, []).append((cid, name))
+        return out
+    except sqlite3.OperationalError:
+        out.clear()
+    for k in range(0, len(keys), _SQL_IN_CHUNK):
+        chunk = keys[k:k + _SQL_IN_CHUNK]
+        cur.execute(
+            f"SELECT id, name, match_key FROM customers WHERE match_key IN ({','.join('?' * len(chunk))}) ORDER BY id",
+            chunk,
+        )
+        for cid, name, mk in cur.fetchall():
+            out.setdefault(mk, []).append((cid, name))
+    return out
+
+
+_NAME_WILDCARDS = frozenset("*?Xx")
+
+
+@lru_cache(maxsize=4096)
+def _name_match_regex(masked_input: str):
+    """utils.is_name_match(real_name, masked_input) 판정을 정규식 1개로 컴파일
+    - masked_input(공백 제거)의 와일드카드(*, ?, X, x)는 임의 1글자, 나머지는 같은 글자 → 길이까지 일치해야 fullmatch
+    """
+    return re.compile(
+        "".join("." if ch in _NAME_WILDCARDS else re.escape(ch) for ch in masked_input.strip()),
+        re.DOTALL,
+    )
+
+
+def _resolve_masked_targets(items, cur):
+    """bulk_import_masked_contracts 1단계: 행별 대상 고객 결정
+    items: (pos, masked_name, match_key) 목록 → {pos: (kind, target_id)}
+    kind: "ok" | "nokey" | "nocand" | "ambig" | "mismatch"
+    - [성능] 고객 후보는 고유 match_key로 IN 절 일괄 조회(행마다 SELECT 반복 제거), 이후는 dict 조회 + 이름 대조만 수행
+    """
+    candidates_by_mk = _fetch_customers_by_match_key(cur, {mk for _, _, mk in items if mk})
+    out = {}
+    for pos, masked_name, mk in items:
+        if not mk:
+            out[pos] = ("nokey", None)
+            continue
+        candidates = candidates_by_mk.get(mk)
+        if not candidates:
+            out[pos] = ("nocand", None)
+            continue
+        # [성능] 후보마다 utils.is_name_match 루프 대신 캐시된 정규식 fullmatch (인자 순서·판정 동일)
+        m_clean = str(masked_name).strip()
+        valid = [
+            cid for cid, real_name in candidates
+            if masked_name and real_name and _name_match_regex(str(real_name)).fullmatch(m_clean)
+        ]
+        if len(valid) > 1:
+            out[pos] = ("ambig", None)
+        elif not valid:
+            out[pos] = ("mismatch", None)
+        else:
+            out[pos] = ("ok", int(valid[0]))
+    return out
+
+
+def _digits_series(values: list) -> pd.Series:
+    """[성능] _digits_only의 컬럼 단위 버전(object dtype 유지 → 파이썬 정규식 \\D와 동일한 유니코드 처리)"""
+    return pd.Series(values, dtype=object).str.replace(_RE_NON_DIGIT.pattern, "", regex=True)
+
+
+def _masked_match_keys(names: list, phones: list) -> list:
+    """[성능] 행별 make_match_key(name, phone_last4(phone))를 str 접근자로 한 번에 계산
+    - names/phones는 _pick_array 결과(앞뒤 공백 제거된 문자열)라는 전제
+    """
+    if not names:
+        return []
+    first = pd.Series(names, dtype=object).str[:1]
+    d = _digits_series(phones)
+    last4 = d.str[-4:].where(d.str.len() >= 4, "")
+    ok = (first != "") & (last4.str.len() == 4)
+    return (first + last4).where(ok, "").tolist()
+
+
+def _premium_ints(values: list) -> list:
+    """[성능] 보험료 문자열 → 숫자만 남겨 int(없으면 0), 숫자 추출은 컬럼 단위로 처리"""
+    return [int(d) if d else 0 for d in _digits_series(values).tolist()]
+
 
 def bulk_import_masked_contracts(df: pd.DataFrame, progress_cb=None):
     """
@@ -624,54 +1316,69 @@ def bulk_import_masked_contracts(df: pd.DataFrame, progress_cb=None):
     _cb(0, "시작")
 
     try:
-        for i, (_, row) in enumerate(df.iterrows(), start=1):
-            masked_name = _pick(row, ("이름", "고객명", "피보험자", "계약자"))
-            phone = _pick(row, ("연락처", "휴대폰", "휴대전화"))
-            mk = make_match_key(masked_name, phone_last4(phone))
-            if not mk:
+        # [성능] 필드별 후보 컬럼을 루프 전에 1회만 골라 배열로 만들고, 루프에서는 위치로만 접근
+        names = _pick_array(df, ("이름", "고객명", "피보험자", "계약자"))
+        phones = _pick_array(df, ("연락처", "휴대폰", "휴대전화"))
+        companies = _pick_array(df, ("보험사", "회사", "보험회사"))
+        product_names = _pick_array(df, ("상품명", "상품", "담보", "보험상품"))
+        policy_nos = _pick_array(df, ("증권번호", "증권", "증서번호", "증번호", "계약번호", "폴리시번호", "policy_no"))
+        statuses = _pick_array(df, ("상태", "계약상태"))
+        start_dates = _pick_array(df, ("계약일", "청약일", "가입일", "개시일"))
+        end_dates = _pick_array(df, ("만기일", "해지일", "종료일"))
+        premiums = _pick_array(df, ("보험료", "납입보험료", "월보험료", "보험료(월)"))
+
+        # [성능] 1단계: 고객 후보 일괄 조회 + 이름 패턴 대조로 행별 대상 고객을 먼저 결정
+        # - 2단계(add_contract 쓰기)는 행 순서대로 진행
+        match_keys = _masked_match_keys(names, phones)
+        premium_ints = _premium_ints(premiums)
+        items = [(pos, names[pos], match_keys[pos]) for pos in range(total)]
+        resolved = _resolve_masked_targets(items, cur)
+        # 대상 고객이 정해진 행만 계약 전처리(정규화 + 해시)를 쓰기 전에 일괄 계산
+        ok_pos = [pos for pos in range(total) if resolved[pos][0] == "ok"]
+        preps = dict(zip(ok_pos, _contract_prepare_many([
+            (resolved[pos][1], companies[pos], product_names[pos], policy_nos[pos], premium_ints[pos],
+             statuses[pos], start_dates[pos], end_dates[pos], None, None, None, None, "")
+            for pos in ok_pos
+        ])))
+        pending = 0
+
+        for i in range(1, total + 1):
+            pos = i - 1
+            masked_name = names[pos]
+            kind, target_id = resolved[pos]
+            if kind == "nokey":
                 failed += 1
                 _cb(i, f"{masked_name} / match_key 없음")
                 continue
-
-            cur.execute("SELECT id, name FROM customers WHERE match_key = ?", (mk,))
-            candidates = cur.fetchall()
-            if not candidates:
+            if kind == "nocand":
                 failed += 1
                 _cb(i, f"{masked_name} / 고객 후보 없음")
                 continue
-
-            valid_candidates = []
-            for cid, real_name in candidates:
-                if utils.is_name_match(masked_name, real_name):
-                    valid_candidates.append((cid, real_name))
-
-            if len(valid_candidates) > 1:
+            if kind == "ambig":
                 ambig += 1
                 _cb(i, f"{masked_name} / 후보 다수(모호)")
                 continue
-            if len(valid_candidates) == 0:
+            if kind == "mismatch":
                 failed += 1
                 _cb(i, f"{masked_name} / 이름 불일치")
                 continue
 
-            target_id = int(valid_candidates[0][0])
-
-            company = _pick(row, ("보험사", "회사", "보험회사"))
-            product_name = _pick(row, ("상품명", "상품", "담보", "보험상품"))
-            policy_no = _pick(row, ("증권번호", "증권", "증서번호", "증번호", "계약번호", "폴리시번호", "policy_no"))
-            status = _pick(row, ("상태", "계약상태"))
-            start_date = _pick(row, ("계약일", "청약일", "가입일", "개시일"))
-            end_date = _pick(row, ("만기일", "해지일", "종료일"))
-
-            premium = 0
-            try:
-                premium = int(re.sub(r"\D", "", str(_pick(row, ("보험료", "납입보험료", "월보험료", "보험료(월)")))))
-            except:
-                premium = 0
-
-            res = add_contract(
-                customer_id=target_id, company=company, product_name=product_name, policy_no=policy_no,
-                premium=premium, status=status, start_date=start_date, end_date=end_date
+            company = companies[pos]
+            product_name = product_names[pos]
+            policy_no = policy_nos[pos]
+            status = statuses[pos]
+            start_date = start_dates[pos]
+            end_date = end_dates[pos]
+
+            premium = premium_ints[pos]
+
+            # [성능] 행마다 add_contract(연결 획득/BEGIN/COMMIT) 대신 이 연결 하나의 트랜잭션에서 반영
+            # - 행별 SAVEPOINT로 실패 행만 되돌림(add_contract와 같은 실패 격리), 커밋은 _CONTRACT_COMMIT_EVERY 행마다
+            if not conn.in_transaction:
+                cur.execute("BEGIN IMMEDIATE")
+            res = _add_contract_savepoint(
+                cur, customer_id=target_id, company=company, product_name=product_name, policy_no=policy_no,
+                premium=premium, status=status, start_date=start_date, end_date=end_date, prepared=preps[pos]
             )
             if res == "insert":
                 inserted += 1
@@ -684,6 +1391,11 @@ def bulk_import_masked_contracts(df: pd.DataFrame, progress_cb=None):
             else:
                 failed += 1
 
+            pending += 1
+            if pending >= _CONTRACT_COMMIT_EVERY:
+                conn.commit()
+                pending = 0
+
             # 5건마다 / 마지막에만 갱신(너무 잦은 UI 업데이트 방지)
             if i == 1 or i % 5 == 0 or i == total:
                 _cb(i, f"{masked_name} / {policy_no}")
@@ -702,6 +1414,8 @@ def bulk_import_masked_contracts(df: pd.DataFrame, progress_cb=None):
         return True, msg, stats
     except Exception as e:
         conn.rollback()
+        # 미커밋 구간이 버려지므로 최근 처리 캐시도 함께 비움
+        clear_recent_contracts()
         stats = {"new_cont": inserted, "update_cont": updated, "same_cont": same, "hold_cont": hold, "failed": failed, "ambig": ambig}
         _cb(0, "오류")
         return False, f"오류: {e}", stats
@@ -711,7 +1425,9 @@ def bulk_import_masked_contracts(df: pd.DataFrame, progress_cb=None):
 
 # --- Upload History (Duplicate Upload Guard) ---
 def get_upload_history(file_hash: str, action: str):
-    """동일 파일(sha256) + 동일 액션 처리 이력이 있으면 반환"""
+    """동일 파일(file_hash) + 동일 액션 처리 이력이 있으면 반환
+    - 조회 캐시는 main.py의 _kfit_cached_get_upload_history 한 곳에서만 관리(무효화 지점 단일화)
+    """
     conn = get_connection()
     try:
         cur = conn.cursor()
@@ -743,6 +1459,7 @@ def get_upload_history(file_hash: str, action: str):
     finally:
         conn.close()
 
+
 def upsert_upload_history(file_hash: str, action: str, filename: str, filesize: int, summary: dict):
     """처리 결과를 업로드 이력에 기록. (동일 file_hash+action이면 최신으로 갱신)"""
     conn = get_connection()
@@ -798,8 +1515,21 @@ def upsert_upload_history(file_hash: str, action: str, filename: str, filesize:
 # - audit        => audit_logs
 # ---------------------------------------------------------
 
+_ORJSON_OPTS = (
+    _orjson.OPT_NON_STR_KEYS | _orjson.OPT_PASSTHROUGH_DATETIME
+    | _orjson.OPT_PASSTHROUGH_SUBCLASS | _orjson.OPT_PASSTHROUGH_DATACLASS
+) if _orjson is not None else 0
+
+
 def _json_dumps_safe(obj) -> str:
     """JSON 직렬화 안전 래퍼(특허: 입력 다양성에 대한 견고성)."""
+    if _orjson is not None:
+        # [성능] orjson 우선. 표준 json이 처리하지 못하는 타입(datetime/하위 클래스 등)은
+        # passthrough로 실패시켜 아래 표준 경로(repr 폴백 포함)와 같은 결과를 유지한다.
+        try:
+            return _orjson.dumps(obj or {}, option=_ORJSON_OPTS).decode("utf-8")
+        except Exception:
+            pass
     try:
         return json.dumps(obj or {}, ensure_ascii=False)
     except Exception:
@@ -809,21 +1539,123 @@ def _json_dumps_safe(obj) -> str:
             return "{}"
 
 
-def audit_log(event_type: str, ref_table: str, ref_id: int | None, payload: dict | None = None) -> None:
-    """감사 로그 기록(실패해도 앱이 죽지 않도록 방어)."""
-    conn = get_connection()
+# [성능] 감사 로그 비동기 기록
+# - 바깥 트랜잭션(db()) 진행 중: 같은 연결에 바로 INSERT → 호출부 commit에 합류(원자성 유지, 추가 fsync 없음)
+# - 트랜잭션 밖: 큐에 적재 → 백그라운드 스레드가 최대 _AUDIT_BATCH건/_AUDIT_FLUSH_SEC 단위로 executemany + commit 1회
+_AUDIT_INSERT_SQL = """INSERT INTO audit_logs (event_type, ref_table, ref_id, payload_json)
+                          VALUES (?, ?, ?, ?)"""
+_AUDIT_QUEUE: "queue.Queue[tuple]" = queue.Queue()
+_AUDIT_BATCH = 100
+_AUDIT_FLUSH_SEC = 0.2
+_AUDIT_THREAD: threading.Thread | None = None
+_AUDIT_THREAD_LOCK = threading.Lock()
+
+
+def _audit_writer_loop() -> None:
+    while True:
+        batch = [_AUDIT_QUEUE.get()]
+        try:
+            while len(batch) < _AUDIT_BATCH:
+                try:
+                    batch.append(_AUDIT_QUEUE.get(timeout=_AUDIT_FLUSH_SEC))
+                except queue.Empty:
+                    break
+            with db() as conn:
+                conn.executemany(_AUDIT_INSERT_SQL, batch)
+                conn.commit()
+        except Exception:
+            pass
+        finally:
+            for _ in batch:
+                _AUDIT_QUEUE.task_done()
+
+
+def _ensure_audit_writer() -> bool:
+    global _AUDIT_THREAD
+    if _AUDIT_THREAD is not None and _AUDIT_THREAD.is_alive():
+        return True
+    with _AUDIT_THREAD_LOCK:
+        if _AUDIT_THREAD is None or not _AUDIT_THREAD.is_alive():
+            try:
+                t = threading.Thread(target=_audit_writer_loop, name="kfit-audit-writer", daemon=True)
+                t.start()
+                _AUDIT_THREAD = t
+            except Exception:
+                return False
+    return True
+
+
+def flush_audit_log() -> None:
+    """대기 중인 감사 로그를 모두 DB에 반영(종료/초기화 직전 호출)."""
+    if _AUDIT_THREAD is not None and _AUDIT_THREAD.is_alive():
+        _AUDIT_QUEUE.join()
+        return
+    # writer 스레드가 없으면 현재 스레드에서 직접 비움
+    batch = []
+    while True:
+        try:
+            batch.append(_AUDIT_QUEUE.get_nowait())
+        except queue.Empty:
+            break
+    if not batch:
+        return
     try:
-        cur = conn.cursor()
-        cur.execute(
-            """INSERT INTO audit_logs (event_type, ref_table, ref_id, payload_json)
-                   VALUES (?, ?, ?, ?)""",
-            (event_type, ref_table, int(ref_id) if ref_id is not None else None, _json_dumps_safe(payload)),
-        )
-        conn.commit()
+        with db() as conn:
+            conn.executemany(_AUDIT_INSERT_SQL, batch)
+            conn.commit()
     except Exception:
         pass
     finally:
-        conn.close()
+        for _ in batch:
+            _AUDIT_QUEUE.task_done()
+
+
+atexit.register(flush_audit_log)
+
+
+def audit_log(
+    event_type: str,
+    ref_table: str,
+    ref_id: int | None,
+    payload: dict | None = None,
+    decided_by: str | None = None,
+) -> None:
+    """감사 로그 기록(실패해도 앱이 죽지 않도록 방어).
+
+    - decided_by: 처리자(있으면 payload["by"]로 기록)
+    """
+    if decided_by:
+        payload = dict(payload or {}, by=decided_by)
+    # payload는 호출 시점 값으로 고정(이후 호출부에서 dict가 바뀌어도 기록 불변)
+    entry = (event_type, ref_table, int(ref_id) if ref_id is not None else None, _json_dumps_safe(payload))
+
+    if _kfit_db.has_active_db():
+        with db() as conn:
+            # 호출부가 쓰기 트랜잭션 중이면 그 commit에 합류, 이미 commit한 뒤라면 큐로
+            if conn.in_transaction:
+                try:
+                    conn.execute(_AUDIT_INSERT_SQL, entry)
+                except Exception:
+                    pass
+                return
+
+    _AUDIT_QUEUE.put_nowait(entry)
+    if not _ensure_audit_writer():
+        flush_audit_log()
+
+
+def _audit_log_many(cur, entries) -> None:
+    """감사 로그 일괄 기록: entries = [(event_type, ref_table, ref_id, payload), ...] (호출부 트랜잭션 안에서 실행)."""
+    try:
+        cur.executemany(
+            _AUDIT_INSERT_SQL,
+            [
+                (ev, tbl, int(rid) if rid is not None else None, _json_dumps_safe(payload))
+                for ev, tbl, rid, payload in entries
+            ],
+        )
+    except Exception:
+        pass
 
 
 def create_customer_direct(
@@ -850,40 +1682,42 @@ def create_customer_direct(
     pn = normalize_phone(ph)
     mk = make_match_key(nm, phone_last4(ph))
 
-    conn = get_connection()
-    try:
-        cur = conn.cursor()
-        cur.execute(
-            """INSERT INTO customers (name, phone, phone_norm, birth_date, gender, region, address, email, source,
-                                      custom_data, match_key, memo, created_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)""",
-            (
-                nm,
-                ph,
-                pn,
-                (birth_date or "").strip(),
-                (gender or "").strip(),
-                (region or "").strip(),
-                (address or "").strip(),
-                (email or "").strip(),
-                (source or "").strip(),
-                _json_dumps_safe(custom_data or {}),
-                mk,
-                (memo or "").strip(),
-            ),
-        )
-        cid = int(cur.lastrowid)
-        conn.commit()
-        audit_log("CUSTOMER_CREATE_DIRECT", "customers", cid, {"name": nm, "phone_norm": pn, "birth_date": birth_date})
-        return True, "created", cid
-    except Exception as e:
+    with db() as conn:
         try:
-            conn.rollback()
-        except Exception:
-            pass
-        return False, f"오류: {e}", None
-    finally:
-        conn.close()
+            cur = conn.cursor()
+            cur.execute(
+                """INSERT INTO customers (name, phone, phone_norm, birth_date, gender, region, address, email, source,
+                                          custom_data, match_key, memo, created_at)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)""",
+                (
+                    nm,
+                    ph,
+                    pn,
+                    (birth_date or "").strip(),
+                    (gender or "").strip(),
+                    (region or "").strip(),
+                    (address or "").strip(),
+                    (email or "").strip(),
+                    (source or "").strip(),
+                    _json_dumps_safe(custom_data or {}),
+                    mk,
+                    (memo or "").strip(),
+                ),
+            )
+            cid = int(cur.lastrowid)
+            conn.commit()
+            audit_log("CUSTOMER_CREATE_DIRECT", "customers", cid, {"name": nm, "phone_norm": pn, "birth_date": birth_date})
+            return True, "created", cid
+        except Exception as e:
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            return False, f"오류: {e}", None
+
+
+# 이름(공백 제거) 비교식: database.py의 idx_customers_name_birth 식 인덱스와 글자 그대로 같아야 인덱스를 탄다
+_CUST_NAME_NOSPACE = "REPLACE(name, ' ', '')"
 
 
 def find_customer_candidates(name: str = "", phone: str = "", birth_date: str = "", limit: int = 30):
@@ -902,64 +1736,145 @@ def find_customer_candidates(name: str = "", phone: str = "", birth_date: str =
     mk = make_match_key(nm, phone_last4(ph))
     bd = (birth_date or "").strip()
 
-    conn = get_connection()
-    try:
+    # [성능] 기준별 조회를 UNION ALL 1회로 실행(tier: 1=phone, 2=match_key, 3=name+birth)
+    # - 기준마다 최신(id 큰) limit건, 점수/중복 제거 규칙은 _assemble_candidates에서 일괄 적용
+    parts, params = [], []
+    if pn:
+        parts.append("""SELECT * FROM (SELECT 1, id, name, phone, birth_date FROM customers
+                                        WHERE phone_norm = ? ORDER BY id DESC LIMIT ?)""")
+        params += [pn, limit]
+    if mk:
+        parts.append("""SELECT * FROM (SELECT 2, id, name, phone, birth_date FROM customers
+                                        WHERE match_key = ? ORDER BY id DESC LIMIT ?)""")
+        params += [mk, limit]
+    if nm and bd:
+        parts.append(f"""SELECT * FROM (SELECT 3, id, name, phone, birth_date FROM customers
+                                         WHERE {_CUST_NAME_NOSPACE} = ? AND birth_date = ?
+                                         ORDER BY id DESC LIMIT ?)""")
+        params += [nm.replace(" ", ""), bd, limit]
+    if not parts:
+        return []
+
+    tiers = ([], [], [])
+    with db() as conn:
         cur = conn.cursor()
-        seen = {}
+        cur.execute(" UNION ALL ".join(parts), params)
+        for tier, cid, cname, cphone, cbd in cur.fetchall():
+            tiers[tier - 1].append((int(cid), cname, cphone, cbd))
+    return _assemble_candidates(nm, *tiers, limit)
 
-        # 1) phone_norm
-        if pn:
-            cur.execute(
-                """SELECT id, name, phone, birth_date FROM customers
-                       WHERE phone_norm = ?
-                       ORDER BY id DESC
-                       LIMIT ?""",
-                (pn, limit),
-            )
-            for cid, cname, cphone, cbd in cur.fetchall():
-                seen[int(cid)] = {"id": int(cid), "name": cname, "phone": cphone, "birth_date": cbd, "score": 100, "reason": "phone"}
 
-        # 2) match_key
-        if mk:
-            cur.execute(
-                """SELECT id, name, phone, birth_date FROM customers
-                       WHERE match_key = ?
-                       ORDER BY id DESC
-                       LIMIT ?""",
-                (mk, limit),
-            )
-            for cid, cname, cphone, cbd in cur.fetchall():
-                cid = int(cid)
-                # 이름 패턴 검증(마스킹/초성 등)
-                try:
-                    ok = utils.is_name_match(nm, cname) if nm else True
-                except Exception:
-                    ok = True
-                if not ok:
-                    continue
-                if cid not in seen:
-                    seen[cid] = {"id": cid, "name": cname, "phone": cphone, "birth_date": cbd, "score": 70, "reason": "match_key"}
+def _assemble_candidates(nm: str, phone_rows, mk_rows, pair_rows, limit: int) -> list[dict]:
+    """기준별 조회 결과(각각 id 내림차순) → 점수/중복 제거/정렬된 후보 리스트.
+
+    - 중복 id는 phone → match_key → name+birth 순으로 먼저 걸린 기준을 유지
+    - match_key 후보는 이름 패턴 검증(마스킹/초성 등)을 통과한 것만
+    """
+    seen = {}
 
-        # 3) name+birth
-        if nm and bd:
+    # 1) phone_norm
+    for cid, cname, cphone, cbd in phone_rows[:limit]:
+        seen[cid] = {"id": cid, "name": cname, "phone": cphone, "birth_date": cbd, "score": 100, "reason": "phone"}
+
+    # 2) match_key
+    for cid, cname, cphone, cbd in mk_rows[:limit]:
+        try:
+            ok = utils.is_name_match(nm, cname) if nm else True
+        except Exception:
+            ok = True
+        if not ok:
+            continue
+        if cid not in seen:
+            seen[cid] = {"id": cid, "name": cname, "phone": cphone, "birth_date": cbd, "score": 70, "reason": "match_key"}
+
+    # 3) name+birth
+    for cid, cname, cphone, cbd in pair_rows[:limit]:
+        if cid not in seen:
+            seen[cid] = {"id": cid, "name": cname, "phone": cphone, "birth_date": cbd, "score": 80, "reason": "name_birth"}
+
+    # 정렬
+    return sorted(seen.values(), key=lambda r: (-int(r.get("score", 0)), -int(r.get("id", 0))))[:limit]
+
+
+_CAND_PAIR_CHUNK = 400  # (이름, 생년월일) 쌍 묶음 크기(쌍당 바인딩 변수 최대 2개)
+
+def find_customer_candidates_bulk(keys: list[tuple], limit: int = 30) -> list[list[dict]]:
+    """find_customer_candidates의 일괄 버전: keys = [(name, phone, birth_date), ...] → 입력 순서대로 후보 리스트.
+
+    - [성능] 행마다 SELECT 3회 대신 기준별 IN (...) 쿼리로 한 번에 조회 후 Python에서 행별로 조립
+    - 기준별 최신(id 큰) limit건, 점수/정렬 규칙은 단건 버전과 동일(_assemble_candidates 공용)
+    """
+    norm = []
+    for name, phone, birth_date in keys:
+        nm = (name or "").strip()
+        ph = (phone or "").strip()
+        norm.append((nm, normalize_phone(ph), make_match_key(nm, phone_last4(ph)), (birth_date or "").strip()))
+
+    pns = {pn for _, pn, _, _ in norm if pn}
+    mks = {mk for _, _, mk, _ in norm if mk}
+    pairs = {(nm.replace(" ", ""), bd) for nm, _, _, bd in norm if nm and bd}
+
+    by_pn: dict = {}
+    by_mk: dict = {}
+    by_pair: dict = {}
+    with db() as conn:
+        cur = conn.cursor()
+        for col, vals, bucket in (("phone_norm", list(pns), by_pn), ("match_key", list(mks), by_mk)):
+            for k in range(0, len(vals), _SQL_IN_CHUNK):
+                chunk = vals[k:k + _SQL_IN_CHUNK]
+                cur.execute(
+                    f"""SELECT id, name, phone, birth_date, {col} FROM customers
+                           WHERE {col} IN ({','.join('?' * len(chunk))})
+                           ORDER BY id DESC""",
+                    chunk,
+                )
+                for cid, cname, cphone, cbd, key in cur.fetchall():
+                    bucket.setdefault(key, []).append((int(cid), cname, cphone, cbd))
+        pair_list = list(pairs)
+        for k in range(0, len(pair_list), _CAND_PAIR_CHUNK):
+            chunk = pair_list[k:k + _CAND_PAIR_CHUNK]
+            # 이름/생년월일 각각 IN 목록(식 인덱스 idx_customers_name_birth 사용), 교차 조합으로 더 걸린 행은 조회 키에 없어 무시됨
+            c_names = list({nm_ns for nm_ns, _ in chunk})
+            c_bds = list({bd for _, bd in chunk})
             cur.execute(
-                """SELECT id, name, phone, birth_date FROM customers
-                       WHERE REPLACE(name, ' ', '') = REPLACE(?, ' ', '')
-                         AND birth_date = ?
-                       ORDER BY id DESC
-                       LIMIT ?""",
-                (nm, bd, limit),
+                f"""SELECT id, name, phone, birth_date, {_CUST_NAME_NOSPACE} FROM customers
+                       WHERE {_CUST_NAME_NOSPACE} IN ({','.join('?' * len(c_names))})
+                         AND birth_date IN ({','.join('?' * len(c_bds))})
+                       ORDER BY id DESC""",
+                c_names + c_bds,
             )
-            for cid, cname, cphone, cbd in cur.fetchall():
-                cid = int(cid)
-                if cid not in seen:
-                    seen[cid] = {"id": cid, "name": cname, "phone": cphone, "birth_date": cbd, "score": 80, "reason": "name_birth"}
-
-        # 정렬
-        out = sorted(seen.values(), key=lambda r: (-int(r.get("score", 0)), -int(r.get("id", 0))))
-        return out[:limit]
-    finally:
-        conn.close()
+            for cid, cname, cphone, cbd, nm_ns in cur.fetchall():
+                by_pair.setdefault((nm_ns, cbd), []).append((int(cid), cname, cphone, cbd))
+
+    return [
+        _assemble_candidates(
+            nm,
+            by_pn.get(pn, ()) if pn else (),
+            by_mk.get(mk, ()) if mk else (),
+            by_pair.get((nm.replace(" ", ""), bd), ()) if nm and bd else (),
+            limit,
+        )
+        for nm, pn, mk, bd in norm
+    ]
+
+
+# 보류 사유 규칙: (메시지에 모두 포함돼야 하는 키워드, 사유코드) — 위에서부터 먼저 맞는 규칙 적용
+_REASON_RULES: tuple[tuple[tuple[str, ...], str], ...] = (
+    (("파일 내부", "연락처", "서로 다른"), "PHONE_NAME_CONFLICT_FILE"),
+    (("동일 연락처", "이름", "불일치"), "PHONE_NAME_MISMATCH_DB"),
+    (("동일 연락처 고객이 2명 이상",), "PHONE_DUP_DB"),
+    (("필수",), "REQUIRED_MISSING"),
+    (("없음",), "REQUIRED_MISSING"),
+)
+
+
+@lru_cache(maxsize=1024)
+def _reason_code_for_msg(msg: str) -> str:
+    # [성능] 사유 메시지는 분석기 템플릿 문장이라 종류가 적다 → 메시지별 결과를 캐시(행마다 규칙 재평가 없음)
+    for keywords, code in _REASON_RULES:
+        if all(k in msg for k in keywords):
+            return code
+    return "HOLD"
 
 
 def _reason_code_from_row(r: dict) -> str:
@@ -967,19 +1882,35 @@ def _reason_code_from_row(r: dict) -> str:
     cr = (r.get("customer_reason") or "")
     rr = (r.get("row_reason") or "")
     tr = (r.get("contract_reason") or "")
-    msg = f"{cr} {rr} {tr}".strip()
-
-    if "파일 내부" in msg and "연락처" in msg and "서로 다른" in msg:
-        return "PHONE_NAME_CONFLICT_FILE"
-    if "동일 연락처" in msg and "이름" in msg and "불일치" in msg:
-        return "PHONE_NAME_MISMATCH_DB"
-    if "동일 연락처 고객이 2명 이상" in msg:
-        return "PHONE_DUP_DB"
-    if "필수" in msg or "없음" in msg:
-        return "REQUIRED_MISSING"
-    return "HOLD"
+    return _reason_code_for_msg(f"{cr} {rr} {tr}".strip())
+
+
+def _zip_json(text: str) -> bytes:
+    # [성능] 원본 행 JSON(raw)은 보관용 → zlib 압축 BLOB으로 저장(한글 JSON 기준 수 배 축소)
+    return zlib.compress(text.encode("utf-8"), 3)
 
 
+def _unzip_json(blob) -> str:
+    try:
+        return zlib.decompress(blob).decode("utf-8")
+    except Exception:
+        return ""
+
+
+_HOLD_INSERT_SQL = """
+    INSERT INTO upload_holds (file_hash, row_no, filename, reason_code, reason_msg, status,
+                              raw_zlib, normalized_json, corrected_json, candidates_json, row_payload_json,
+                              created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, 'OPEN', ?, ?, '', ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+"""
+
+_HOLD_UPDATE_SQL = """
+    UPDATE upload_holds
+       SET filename=?, reason_code=?, reason_msg=?, status=COALESCE(NULLIF(status,''),'OPEN'),
+           raw_json=NULL, raw_zlib=?, normalized_json=?, candidates_json=?, row_payload_json=?, updated_at=CURRENT_TIMESTAMP
+     WHERE id=?
+"""
+
 def sync_upload_holds(file_hash: str, filename: str, rows: list[dict]) -> int:
     """분석 결과의 보류 행을 upload_holds로 동기화한다.
 
@@ -991,101 +1922,129 @@ def sync_upload_holds(file_hash: str, filename: str, rows: list[dict]) -> int:
     if not rows:
         return 0
 
-    conn = get_connection()
+    # [성능] 보류 행만 먼저 추림 → 보류가 없으면(대부분의 정상 업로드) 연결/쓰기 트랜잭션 자체를 생략
+    hold_rows = []
     try:
-        cur = conn.cursor()
-        synced = 0
         for r in rows:
             if (r.get("row_status") or "") != "보류":
                 continue
             row_no = int(r.get("seq") or r.get("row_no") or 0)
-            if row_no <= 0:
-                continue
-
-            reason_code = _reason_code_from_row(r)
-            reason_msg = (r.get("customer_reason") or r.get("contract_reason") or r.get("row_reason") or "보류").strip()
-
-            name = r.get("name") or ""
-            phone = r.get("phone") or ""
-            birth_date = r.get("birth_date") or ""
-            normalized = {
-                "name_norm": (str(name).strip().replace(" ", "")),
-                "phone_norm": normalize_phone(phone),
-                "birth_date": str(birth_date).strip(),
-            }
+            if row_no > 0:
+                hold_rows.append((r, row_no))
+    except Exception:
+        return 0
+    if not hold_rows:
+        return 0
 
-            candidates = r.get("customer_candidates")
-            if not candidates:
-                # 파일 내부 충돌/신규 보류인 경우에도 후보를 생성해둔다(사후 UI 편의)
-                candidates = find_customer_candidates(name=name, phone=phone, birth_date=birth_date, limit=20)
-
-            # 반영용 최소 payload (원본 보존)
-            row_payload = {
-                "seq": r.get("seq"),
-                "name": name,
-                "phone": phone,
-                "birth_date": birth_date,
-                "gender": r.get("gender"),
-                "region": r.get("region"),
-                "address": r.get("address"),
-                "email": r.get("email"),
-                "source": r.get("source"),
-                "memo": r.get("memo"),
-                "custom_data": r.get("custom_data"),
-                "policyholder_name": r.get("policyholder_name"),
-                "policyholder_phone": r.get("policyholder_phone"),
-                "policyholder_type": r.get("policyholder_type"),
-                "policyholder_norm": r.get("policyholder_norm"),
-                "primary_role": r.get("primary_role"),
-                "financial": r.get("financial") or {},
-            }
+    with db() as conn:
+        try:
+            cur = conn.cursor()
+            # [성능] 전체 동기화를 1개 쓰기 트랜잭션으로 처리(행마다 커밋/fsync 없음)
+            if not conn.in_transaction:
+                cur.execute("BEGIN IMMEDIATE")
+            # [성능] 이 파일의 기존 보류를 1회 조회해 row_no → (id, status) 맵으로 사용(행별 SELECT 제거)
+            cur.execute("SELECT row_no, id, status FROM upload_holds WHERE file_hash = ?", (file_hash,))
+            existing = {int(rn): (hid, st) for rn, hid, st in cur.fetchall()}
+            to_insert: dict = {}   # row_no → 값 튜플
+            to_update: dict = {}   # hold id → 값 튜플
+            synced = 0
+
+            targets = []
+            for r, row_no in hold_rows:
+                # 이미 RESOLVED면 덮어쓰지 않음
+                ex = existing.get(row_no)
+                if ex and (ex[1] or "") == "RESOLVED":
+                    continue
+                targets.append((r, row_no, ex))
+
+            # 파일 내부 충돌/신규 보류인 경우에도 후보를 생성해둔다(사후 UI 편의)
+            # [성능] 후보가 없는 행들을 모아 일괄 조회(행별 find_customer_candidates 반복 제거)
+            need = [i for i, (r, _, _) in enumerate(targets) if not r.get("customer_candidates")]
+            found = find_customer_candidates_bulk(
+                [(targets[i][0].get("name") or "", targets[i][0].get("phone") or "", targets[i][0].get("birth_date") or "") for i in need],
+                limit=20,
+            ) if need else []
+            cands_by_idx = dict(zip(need, found))
+
+            for idx, (r, row_no, ex) in enumerate(targets):
+                reason_code = _reason_code_from_row(r)
+                reason_msg = (r.get("customer_reason") or r.get("contract_reason") or r.get("row_reason") or "보류").strip()
+
+                name = r.get("name") or ""
+                phone = r.get("phone") or ""
+                birth_date = r.get("birth_date") or ""
+                normalized = {
+                    "name_norm": (str(name).strip().replace(" ", "")),
+                    "phone_norm": normalize_phone(phone),
+                    "birth_date": str(birth_date).strip(),
+                }
 
-            # 이미 RESOLVED면 덮어쓰지 않음
-            cur.execute(
-                """SELECT id, status FROM upload_holds WHERE file_hash = ? AND row_no = ?""",
-                (file_hash, row_no),
-            )
-            ex = cur.fetchone()
-            if ex and (ex[1] or "") == "RESOLVED":
-                continue
+                candidates = r.get("customer_candidates") or cands_by_idx.get(idx, [])
+
+                # 반영용 최소 payload (원본 보존)
+                row_payload = {
+                    "seq": r.get("seq"),
+                    "name": name,
+                    "phone": phone,
+                    "birth_date": birth_date,
+                    "gender": r.get("gender"),
+                    "region": r.get("region"),
+                    "address": r.get("address"),
+                    "email": r.get("email"),
+                    "source": r.get("source"),
+                    "memo": r.get("memo"),
+                    "custom_data": r.get("custom_data"),
+                    "policyholder_name": r.get("policyholder_name"),
+                    "policyholder_phone": r.get("policyholder_phone"),
+                    "policyholder_type": r.get("policyholder_type"),
+                    "policyholder_norm": r.get("policyholder_norm"),
+                    "primary_role": r.get("primary_role"),
+                    "financial": r.get("financial") or {},
+                }
 
-            raw_json = _json_dumps_safe(r)
-            normalized_json = _json_dumps_safe(normalized)
-            candidates_json = _json_dumps_safe(candidates)
-            row_payload_json = _json_dumps_safe(row_payload)
+                raw_zlib = _zip_json(_json_dumps_safe(r))
+                normalized_json = _json_dumps_safe(normalized)
+                candidates_json = _json_dumps_safe(candidates)
+                row_payload_json = _json_dumps_safe(row_payload)
+
+                # 같은 row_no가 여러 번 오면 마지막 값으로 반영(기존 INSERT 후 UPDATE와 동일한 최종 상태)
+                vals = (filename, reason_code, reason_msg, raw_zlib, normalized_json, candidates_json, row_payload_json)
+                if not ex:
+                    to_insert[row_no] = vals
+                else:
+                    to_update[int(ex[0])] = vals
+                synced += 1
 
-            if not ex:
-                cur.execute(
-                    """INSERT INTO upload_holds (file_hash, row_no, filename, reason_code, reason_msg, status,
-                                                  raw_json, normalized_json, corrected_json, candidates_json, row_payload_json,
-                                                  created_at, updated_at)
-                           VALUES (?, ?, ?, ?, ?, 'OPEN', ?, ?, '', ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)""",
-                    (file_hash, row_no, filename, reason_code, reason_msg, raw_json, normalized_json, candidates_json, row_payload_json),
+            # [성능] INSERT/UPDATE/감사로그를 executemany로 일괄 실행(행마다 Python↔C 왕복 제거)
+            if to_insert:
+                cur.executemany(
+                    _HOLD_INSERT_SQL,
+                    [(file_hash, rn, *vals) for rn, vals in to_insert.items()],
                 )
-                hold_id = int(cur.lastrowid)
-                audit_log("HOLD_CREATE", "upload_holds", hold_id, {"file_hash": file_hash, "row_no": row_no, "reason": reason_code})
-                synced += 1
-            else:
-                hold_id = int(ex[0])
-                cur.execute(
-                    """UPDATE upload_holds
-                          SET filename=?, reason_code=?, reason_msg=?, status=COALESCE(NULLIF(status,''),'OPEN'),
-                              raw_json=?, normalized_json=?, candidates_json=?, row_payload_json=?, updated_at=CURRENT_TIMESTAMP
-                        WHERE id=?""",
-                    (filename, reason_code, reason_msg, raw_json, normalized_json, candidates_json, row_payload_json, hold_id),
+                cur.execute("SELECT row_no, id FROM upload_holds WHERE file_hash = ?", (file_hash,))
+                id_by_row = {int(rn): int(hid) for rn, hid in cur.fetchall()}
+                _audit_log_many(
+                    cur,
+                    [
+                        ("HOLD_CREATE", "upload_holds", id_by_row.get(rn),
+                         {"file_hash": file_hash, "row_no": rn, "reason": vals[1]})
+                        for rn, vals in to_insert.items()
+                    ],
+                )
+            if to_update:
+                cur.executemany(
+                    _HOLD_UPDATE_SQL,
+                    [(*vals, hid) for hid, vals in to_update.items()],
                 )
-                synced += 1
 
-        conn.commit()
-        return synced
-    except Exception:
-        try:
-            conn.rollback()
+            conn.commit()
+            return synced
         except Exception:
-            pass
-        return 0
-    finally:
-        conn.close()
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            return 0
 
 
 def list_upload_hold_reason_codes() -> list[str]:
@@ -1094,20 +2053,40 @@ def list_upload_hold_reason_codes() -> list[str]:
     [데이터(db포함) 오류] 운영 중 사유코드는 추가/변경될 수 있으므로, UI에서 하드코딩하지 않고
     DB에서 현재 사용 중인 사유코드를 가져와 필터로 제공할 수 있도록 한다.
     """
-    conn = get_connection()
-    try:
-        cur = conn.cursor()
-        cur.execute(
-            """SELECT DISTINCT reason_code
-                   FROM upload_holds
-                  WHERE COALESCE(reason_code,'') <> ''
-                  ORDER BY reason_code ASC"""
-        )
-        return [r[0] for r in cur.fetchall() if r and r[0]]
-    except Exception:
-        return []
-    finally:
-        conn.close()
+    with db() as conn:
+        try:
+            cur = conn.cursor()
+            cur.execute(
+                """SELECT DISTINCT reason_code
+                       FROM upload_holds
+                      WHERE COALESCE(reason_code,'') <> ''
+                      ORDER BY reason_code ASC"""
+            )
+            return [r[0] for r in cur.fetchall() if r and r[0]]
+        except Exception:
+            return []
+
+
+_UPLOAD_BATCHES_SQL = """
+    SELECT file_hash, filename, created_at, open_count, resolved_count, skipped_count
+      FROM upload_batches
+     ORDER BY created_at DESC
+     LIMIT ?
+"""
+
+_UPLOAD_BATCHES_GROUP_SQL = """
+    SELECT
+        file_hash AS upload_id,
+        MAX(filename) AS filename,
+        MIN(created_at) AS created_at,
+        SUM(CASE WHEN status='OPEN' THEN 1 ELSE 0 END) AS open_count,
+        SUM(CASE WHEN status='RESOLVED' THEN 1 ELSE 0 END) AS resolved_count,
+        SUM(CASE WHEN status='SKIPPED' THEN 1 ELSE 0 END) AS skipped_count
+    FROM upload_holds
+    GROUP BY file_hash
+    ORDER BY created_at DESC
+    LIMIT ?
+"""
 
 
 def list_upload_hold_batches(limit: int = 50) -> list[dict]:
@@ -1116,44 +2095,51 @@ def list_upload_hold_batches(limit: int = 50) -> list[dict]:
     [데이터(db포함) 오류] '업로드보류(관리)' 화면에서 특정 업로드(파일)만 골라 보류를 처리할 수 있어야 한다.
     - upload_id: 내부적으로 file_hash를 사용(명세서의 업로드 배치 식별자와 1:1 매핑)
     - open_count: 아직 해결되지 않은 보류(OPEN)
+
+    [성능] 트리거로 유지되는 upload_batches 요약 테이블에서 읽는다(없으면 upload_holds GROUP BY로 후퇴).
     """
-    conn = get_connection()
-    try:
-        cur = conn.cursor()
-        cur.execute(
-            """SELECT
-                    file_hash AS upload_id,
-                    MAX(filename) AS filename,
-                    MIN(created_at) AS created_at,
-                    SUM(CASE WHEN status='OPEN' THEN 1 ELSE 0 END) AS open_count,
-                    SUM(CASE WHEN status='RESOLVED' THEN 1 ELSE 0 END) AS resolved_count,
-                    SUM(CASE WHEN status='SKIPPED' THEN 1 ELSE 0 END) AS skipped_count
-                FROM upload_holds
-                GROUP BY file_hash
-                ORDER BY created_at DESC
-                LIMIT ?""",
-            (int(limit),),
-        )
-        rows = cur.fetchall() or []
-        out = []
-        for r in rows:
-            out.append(
-                {
-                    "upload_id": r[0],
-                    "filename": r[1],
-                    "created_at": r[2],
-                    "open_count": int(r[3] or 0),
-                    "resolved_count": int(r[4] or 0),
-                    "skipped_count": int(r[5] or 0),
-                }
-            )
-        return out
-    except Exception:
-        return []
-    finally:
-        conn.close()
+    with db() as conn:
+        try:
+            cur = conn.cursor()
+            try:
+                cur.execute(_UPLOAD_BATCHES_SQL, (int(limit),))
+            except sqlite3.Error:
+                cur.execute(_UPLOAD_BATCHES_GROUP_SQL, (int(limit),))
+            rows = cur.fetchall() or []
+            out = []
+            for r in rows:
+                out.append(
+                    {
+                        "upload_id": r[0],
+                        "filename": r[1],
+                        "created_at": r[2],
+                        "open_count": int(r[3] or 0),
+                        "resolved_count": int(r[4] or 0),
+                        "skipped_count": int(r[5] or 0),
+                    }
+                )
+            return out
+        except Exception:
+            return []
 
 
+def _json_col(col: str, path: str) -> str:
+    # 빈 문자열/깨진 JSON이면 NULL (json_extract는 잘못된 JSON에서 오류를 내므로 json_valid로 보호)
+    return f"json_extract(CASE WHEN json_valid({col}) THEN {col} END, '{path}')"
+
+# list_upload_holds 목록용 추출 컬럼(정정/정규화/원본 이름·연락처 + 계약 힌트)
+# - normalized_json 키는 저장 시점(sync_upload_holds)과 같은 name_norm/phone_norm/birth_date
+_LIST_HOLD_JSON_COLS = ",\n                   ".join(
+    [
+        _json_col("corrected_json", "$.name"), _json_col("corrected_json", "$.phone"), _json_col("corrected_json", "$.birth_date"),
+        _json_col("normalized_json", "$.name_norm"), _json_col("normalized_json", "$.phone_norm"), _json_col("normalized_json", "$.birth_date"),
+        _json_col("row_payload_json", "$.name"), _json_col("row_payload_json", "$.phone"),
+    ]
+    + [_json_col("row_payload_json", f"$.financial.{k}") for k in
+       ("policy_no", "company", "product_name", "status", "start_date", "end_date", "insured_name", "policyholder_name")]
+    + [_json_col("row_payload_json", "$.policyholder_name")]
+)
+
 def list_upload_holds(
     statuses: list[str] | None = None,
     keyword: str | None = None,
@@ -1161,6 +2147,8 @@ def list_upload_holds(
     reason_codes: list[str] | None = None,
     limit: int = 200,
     offset: int = 0,
+    after_created_at: str | None = None,
+    after_id: int | None = None,
 ):
     """upload_holds 목록 조회(업로드보류 관리용).
 
@@ -1168,11 +2156,18 @@ def list_upload_holds(
 
     반환 dict 스키마(주요):
     - id, row_no, status, reason_code, reason_msg
-    - normalized: dict
-    - corrected: dict
+    - normalized: dict(name/phone/birth_date)
+    - corrected: dict(name/phone/birth_date)
     - candidates: list[dict]
     - contract_hint: dict(보험사/상품/증권/상태 등)
     - display_name/display_phone: UI 표시용(정정 > 정규화 > 원본 순)
+
+    [성능] 목록에 필요한 필드만 SQLite json_extract로 뽑아 온다(행마다 JSON 4개 파싱 제거).
+    원본 payload 전체가 필요하면 get_upload_hold(hold_id)를 사용.
+
+    [성능] 페이지 이동은 keyset 방식: after_created_at/after_id(직전 페이지 마지막 행,
+    upload_hold_page_cursor()로 구함)를 주면 그 뒤부터 조회한다(OFFSET처럼 앞 행을 건너뛰며 읽지 않음).
+    커서가 있으면 offset은 무시.
     """
 
     def _loads(s: str, default):
@@ -1206,71 +2201,85 @@ def list_upload_holds(
         where.append(f"reason_code IN ({','.join(['?']*len(rcodes))})")
         params.extend(rcodes)
 
+    if after_created_at is not None and after_id is not None:
+        where.append("(created_at, id) < (?, ?)")
+        params.extend([after_created_at, int(after_id)])
+        offset = 0
+
+    def _sql(where_parts):
+        return f"""
+            SELECT id, file_hash, row_no, filename, reason_code, reason_msg, status,
+                   candidates_json, created_at, updated_at,
+                   {_LIST_HOLD_JSON_COLS}
+              FROM upload_holds
+             WHERE {' AND '.join(where_parts)}
+             ORDER BY created_at DESC, id DESC
+             LIMIT ? OFFSET ?
+        """
+
+    page = [int(limit), int(offset)]
+    like_where, like_params = where, params
+    fts_where, fts_params = None, None
     if kw:
         like = f"%{kw}%"
         # JSON 컬럼을 대상으로 단순 LIKE 검색(속도는 느릴 수 있으나 운영 규모(로컬)에서 충분)
-        where.append("(row_payload_json LIKE ? OR normalized_json LIKE ? OR corrected_json LIKE ? OR candidates_json LIKE ? OR reason_msg LIKE ?)")
-        params.extend([like, like, like, like, like])
-
-    sql = f"""
-        SELECT id, file_hash, row_no, filename, reason_code, reason_msg, status,
-               normalized_json, corrected_json, candidates_json, row_payload_json,
-               created_at, updated_at
-          FROM upload_holds
-         WHERE {' AND '.join(where)}
-         ORDER BY created_at DESC, id DESC
-         LIMIT ? OFFSET ?
-    """
-    params.extend([int(limit), int(offset)])
-
-    conn = get_connection()
-    try:
+        like_where = where + ["(row_payload_json LIKE ? OR normalized_json LIKE ? OR corrected_json LIKE ? OR candidates_json LIKE ? OR reason_msg LIKE ?)"]
+        like_params = params + [like, like, like, like, like]
+        if len(kw) >= 3:
+            # [성능] 3글자 이상은 FTS5(trigram) 색인으로 부분 문자열 검색(구문 검색으로 키워드를 그대로 매칭)
+            fts_where = where + ["id IN (SELECT rowid FROM upload_holds_fts WHERE upload_holds_fts MATCH ?)"]
+            fts_params = params + ['"' + kw.replace('"', '""') + '"']
+
+    with db() as conn:
         cur = conn.cursor()
-        cur.execute(sql, params)
-        rows = cur.fetchall() or []
-    except Exception:
-        rows = []
-    finally:
-        conn.close()
+        rows = None
+        if fts_where is not None:
+            try:
+                cur.execute(_sql(fts_where), fts_params + page)
+                rows = cur.fetchall() or []
+            except Exception:
+                # FTS 미지원/색인 없음 → LIKE로 후퇴
+                rows = None
+        if rows is None:
+            try:
+                cur.execute(_sql(like_where), like_params + page)
+                rows = cur.fetchall() or []
+            except Exception:
+                rows = []
 
     out = []
     for r in rows:
-        hid = int(r[0])
-        file_hash = r[1]
-        row_no = int(r[2])
-        filename = r[3]
-        reason_code = r[4]
-        reason_msg = r[5]
-        status = r[6]
-        normalized = _loads(r[7] or "", {})
-        corrected = _loads(r[8] or "", {})
-        candidates = _loads(r[9] or "", [])
-        payload = _loads(r[10] or "", {})
-        created_at = r[11]
-        updated_at = r[12]
+        (hid, file_hash, row_no, filename, reason_code, reason_msg, status,
+         candidates_json, created_at, updated_at,
+         corr_name, corr_phone, corr_birth, nrm_name, nrm_phone, nrm_birth, raw_name, raw_phone,
+         policy_no, company, product_name, fin_status, start_date, end_date, insured_name,
+         fin_ph_name, ph_name) = r
+        corrected = {k: v for k, v in (("name", corr_name), ("phone", corr_phone), ("birth_date", corr_birth)) if v is not None}
+        normalized = {k: v for k, v in (("name_norm", nrm_name), ("phone_norm", nrm_phone), ("birth_date", nrm_birth)) if v is not None}
+        candidates = _loads(candidates_json or "", [])
 
         # 계약 힌트(행 payload에 저장해둔 financial 요약을 그대로 사용)
-        fin = payload.get("financial") if isinstance(payload.get("financial"), dict) else {}
         contract_hint = {
-            "policy_no": fin.get("policy_no"),
-            "company": fin.get("company"),
-            "product_name": fin.get("product_name"),
-            "status": fin.get("status"),
-            "start_date": fin.get("start_date"),
-            "end_date": fin.get("end_date"),
-            "insured_name": fin.get("insured_name"),
-            "policyholder_name": fin.get("policyholder_name") or payload.get("policyholder_name"),
+            "policy_no": policy_no,
+            "company": company,
+            "product_name": product_name,
+            "status": fin_status,
+            "start_date": start_date,
+            "end_date": end_date,
+            "insured_name": insured_name,
+            "policyholder_name": fin_ph_name or ph_name,
         }
 
-        display_name = (corrected.get("name") or normalized.get("name") or payload.get("name") or "").strip() or "-"
-        display_phone = (corrected.get("phone") or normalized.get("phone") or payload.get("phone") or "").strip() or "-"
+        # 정정 > 원본 (정규화 dict에는 name/phone 키가 없어 기존에도 원본으로 넘어감)
+        display_name = (corr_name or raw_name or "").strip() or "-"
+        display_phone = (corr_phone or raw_phone or "").strip() or "-"
 
         out.append(
             {
-                "id": hid,
+                "id": int(hid),
                 "file_hash": file_hash,
                 "upload_id": file_hash,
-                "row_no": row_no,
+                "row_no": int(row_no),
                 "filename": filename,
                 "reason_code": reason_code,
                 "reason_msg": reason_msg,
@@ -1278,7 +2287,6 @@ def list_upload_holds(
                 "normalized": normalized,
                 "corrected": corrected,
                 "candidates": candidates,
-                "payload": payload,
                 "contract_hint": contract_hint,
                 "display_name": display_name,
                 "display_phone": display_phone,
@@ -1289,39 +2297,65 @@ def list_upload_holds(
     return out
 
 
+def upload_hold_page_cursor(holds: list[dict], limit: int) -> tuple[str, int] | None:
+    """list_upload_holds 결과 → 다음 페이지 커서(after_created_at, after_id). 마지막 페이지면 None."""
+    if not holds or len(holds) < int(limit):
+        return None
+    last = holds[-1]
+    return (last.get("created_at"), int(last.get("id")))
+
+
+# [성능] 보류 단건 조회/상태 변경 SQL은 모듈 상수로 고정(연결의 statement cache 재사용)
+_HOLD_ROW_COLS = """id, file_hash, row_no, filename, reason_code, reason_msg, status,
+                   raw_json, normalized_json, corrected_json, candidates_json, row_payload_json,
+                   created_at, updated_at, raw_zlib"""
+_HOLD_ROW_SELECT = f"SELECT {_HOLD_ROW_COLS} FROM upload_holds"
+_HOLD_GET_SQL = _HOLD_ROW_SELECT + " WHERE id=?"
+_HOLD_GET_BY_FILE_ROW_SQL = _HOLD_ROW_SELECT + " WHERE file_hash=? AND row_no=?"
+_HOLD_SET_STATUS_SQL = """UPDATE upload_holds
+                             SET status=?, updated_at=CURRENT_TIMESTAMP
+                           WHERE id=?"""
+# [성능] SQLite 3.35+: 상태 변경과 변경 후 행 조회를 RETURNING 1문장으로(재조회 SELECT 생략)
+_HOLD_SET_STATUS_RETURNING_SQL = (
+    _HOLD_SET_STATUS_SQL + f" RETURNING {_HOLD_ROW_COLS}"
+    if sqlite3.sqlite_version_info >= (3, 35, 0) else None
+)
+_HOLD_SET_STATUS_BY_FILE_ROW_SQL = """UPDATE upload_holds
+                                         SET status=?, updated_at=CURRENT_TIMESTAMP
+                                       WHERE file_hash=? AND row_no=?"""
+_HOLD_SET_CORRECTED_SQL = """UPDATE upload_holds
+                                SET corrected_json=?, candidates_json=?, updated_at=CURRENT_TIMESTAMP
+                              WHERE id=?"""
+_HOLD_DECISION_INSERT_SQL = """INSERT INTO hold_decisions (hold_id, decision, target_customer_id, decision_json, decided_by)
+                                  VALUES (?, ?, ?, ?, ?)"""
+_APPROVAL_PROOF_INSERT_SQL = """INSERT INTO approval_proofs (hold_id, approval, approval_json, approved_by)
+                                   VALUES (?, ?, ?, ?)"""
+
+
+def _hold_row_to_dict(r) -> dict | None:
+    if not r:
+        return None
+    return {
+        "id": int(r[0]),
+        "file_hash": r[1],
+        "row_no": int(r[2]),
+        "filename": r[3],
+        "reason_code": r[4],
+        "reason_msg": r[5],
+        "status": r[6],
+        "raw_json": _unzip_json(r[14]) if r[14] is not None else r[7],
+        "normalized_json": r[8],
+        "corrected_json": r[9],
+        "candidates_json": r[10],
+        "row_payload_json": r[11],
+        "created_at": r[12],
+        "updated_at": r[13],
+    }
+
+
 def get_upload_hold(hold_id: int):
-    conn = get_connection()
-    try:
-        cur = conn.cursor()
-        cur.execute(
-            """SELECT id, file_hash, row_no, filename, reason_code, reason_msg, status,
-                      raw_json, normalized_json, corrected_json, candidates_json, row_payload_json,
-                      created_at, updated_at
-                   FROM upload_holds
-                  WHERE id=?""",
-            (int(hold_id),),
-        )
-        r = cur.fetchone()
-        if not r:
-            return None
-        return {
-            "id": int(r[0]),
-            "file_hash": r[1],
-            "row_no": int(r[2]),
-            "filename": r[3],
-            "reason_code": r[4],
-            "reason_msg": r[5],
-            "status": r[6],
-            "raw_json": r[7],
-            "normalized_json": r[8],
-            "corrected_json": r[9],
-            "candidates_json": r[10],
-            "row_payload_json": r[11],
-            "created_at": r[12],
-            "updated_at": r[13],
-        }
-    finally:
-        conn.close()
+    with db() as conn:
+        return _hold_row_to_dict(conn.execute(_HOLD_GET_SQL, (int(hold_id),)).fetchone())
 
 
 def get_upload_hold_by_file_row(file_hash: str, row_no: int):
@@ -1340,38 +2374,10 @@ def get_upload_hold_by_file_row(file_hash: str, row_no: int):
     if not file_hash or not row_no:
         return None
 
-    conn = get_connection()
-    try:
-        cur = conn.cursor()
-        cur.execute(
-            """SELECT id, file_hash, row_no, filename, reason_code, reason_msg, status,
-                      raw_json, normalized_json, corrected_json, candidates_json, row_payload_json,
-                      created_at, updated_at
-                   FROM upload_holds
-                  WHERE file_hash=? AND row_no=?""",
-            (str(file_hash), int(row_no)),
+    with db() as conn:
+        return _hold_row_to_dict(
+            conn.execute(_HOLD_GET_BY_FILE_ROW_SQL, (str(file_hash), int(row_no))).fetchone()
         )
-        r = cur.fetchone()
-        if not r:
-            return None
-        return {
-            "id": int(r[0]),
-            "file_hash": r[1],
-            "row_no": int(r[2]),
-            "filename": r[3],
-            "reason_code": r[4],
-            "reason_msg": r[5],
-            "status": r[6],
-            "raw_json": r[7],
-            "normalized_json": r[8],
-            "corrected_json": r[9],
-            "candidates_json": r[10],
-            "row_payload_json": r[11],
-            "created_at": r[12],
-            "updated_at": r[13],
-        }
-    finally:
-        conn.close()
 
 
 
@@ -1409,57 +2415,50 @@ def update_upload_hold_corrected(
     # 후보 재탐색(정정값 기반)
     candidates = find_customer_candidates(corr_name, corr_phone, corr_birth, limit=30)
 
-    conn = get_connection()
-    try:
-        cur = conn.cursor()
-        cur.execute(
-            """UPDATE upload_holds
-                   SET corrected_json=?,
-                       candidates_json=?,
-                       updated_at=CURRENT_TIMESTAMP
-                 WHERE id=?""",
-            (_json_dumps_safe({"name": corr_name, "phone": corr_phone, "birth_date": corr_birth}),
-             _json_dumps_safe(candidates),
-             int(hold_id)),
-        )
-        conn.commit()
-        audit_log(
-            "HOLD_CORRECTED_UPDATED",
-            "upload_holds",
-            int(hold_id),
-            {"corrected": {"name": corr_name, "phone": corr_phone, "birth_date": corr_birth}, "cand_count": len(candidates)},
-            decided_by,
-        )
-        return True, "정정 저장 완료", {"candidates": candidates}
-    except Exception as e:
+    with db() as conn:
         try:
-            conn.rollback()
-        except Exception:
-            pass
-        return False, f"정정 저장 실패: {e}", None
-    finally:
-        conn.close()
+            cur = conn.cursor()
+            cur.execute(
+                _HOLD_SET_CORRECTED_SQL,
+                (_json_dumps_safe({"name": corr_name, "phone": corr_phone, "birth_date": corr_birth}),
+                 _json_dumps_safe(candidates),
+                 int(hold_id)),
+            )
+            conn.commit()
+            audit_log(
+                "HOLD_CORRECTED_UPDATED",
+                "upload_holds",
+                int(hold_id),
+                {"corrected": {"name": corr_name, "phone": corr_phone, "birth_date": corr_birth}, "cand_count": len(candidates)},
+                decided_by,
+            )
+            return True, "정정 저장 완료", {
+                "candidates": candidates,
+                "corrected": {"name": corr_name, "phone": corr_phone, "birth_date": corr_birth},
+            }
+        except Exception as e:
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            return False, f"정정 저장 실패: {e}", None
 
 
 def set_upload_hold_status_by_file_row(file_hash: str, row_no: int, status: str) -> None:
     """(file_hash,row_no)로 보류 상태를 변경한다."""
-    conn = get_connection()
-    try:
-        cur = conn.cursor()
-        cur.execute(
-            """UPDATE upload_holds
-                  SET status=?, updated_at=CURRENT_TIMESTAMP
-                WHERE file_hash=? AND row_no=?""",
-            ((status or "OPEN").upper(), file_hash, int(row_no)),
-        )
-        conn.commit()
-    except Exception:
+    with db() as conn:
         try:
-            conn.rollback()
+            cur = conn.cursor()
+            cur.execute(
+                _HOLD_SET_STATUS_BY_FILE_ROW_SQL,
+                ((status or "OPEN").upper(), file_hash, int(row_no)),
+            )
+            conn.commit()
         except Exception:
-            pass
-    finally:
-        conn.close()
+            try:
+                conn.rollback()
+            except Exception:
+                pass
 
 
 def resolve_upload_hold_by_file_row(file_hash: str, row_no: int) -> None:
@@ -1473,72 +2472,63 @@ def set_upload_hold_status(hold_id: int, status: str, *, decided_by: str = ""):
 
     반환: (ok:bool, msg:str, extra:dict|None)
     """
-    conn = get_connection()
-    try:
-        cur = conn.cursor()
-        cur.execute(
-            """UPDATE upload_holds
-                   SET status=?,
-                       updated_at=CURRENT_TIMESTAMP
-                 WHERE id=?""",
-            (str(status).upper(), int(hold_id)),
-        )
-        conn.commit()
-        audit_log(
-            "HOLD_STATUS_UPDATED",
-            "upload_holds",
-            int(hold_id),
-            {"status": str(status).upper()},
-            decided_by,
-        )
-        return True, "상태 변경 완료", get_upload_hold(int(hold_id))
-    except Exception as e:
+    with db() as conn:
         try:
-            conn.rollback()
-        except Exception:
-            pass
-        return False, f"상태 변경 실패: {e}", None
-    finally:
-        conn.close()
+            cur = conn.cursor()
+            if _HOLD_SET_STATUS_RETURNING_SQL:
+                cur.execute(_HOLD_SET_STATUS_RETURNING_SQL, (str(status).upper(), int(hold_id)))
+                updated = _hold_row_to_dict(cur.fetchone())
+            else:
+                cur.execute(_HOLD_SET_STATUS_SQL, (str(status).upper(), int(hold_id)))
+                updated = get_upload_hold(int(hold_id))
+            conn.commit()
+            audit_log(
+                "HOLD_STATUS_UPDATED",
+                "upload_holds",
+                int(hold_id),
+                {"status": str(status).upper()},
+                decided_by,
+            )
+            return True, "상태 변경 완료", updated
+        except Exception as e:
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            return False, f"상태 변경 실패: {e}", None
 
 
 
 def insert_hold_decision(hold_id: int, decision: str, target_customer_id: int | None = None, decision_json: dict | None = None, decided_by: str = "") -> None:
-    conn = get_connection()
-    try:
-        cur = conn.cursor()
-        cur.execute(
-            """INSERT INTO hold_decisions (hold_id, decision, target_customer_id, decision_json, decided_by)
-                   VALUES (?, ?, ?, ?, ?)""",
-            (int(hold_id), (decision or "").upper(), int(target_customer_id) if target_customer_id else None, _json_dumps_safe(decision_json), (decided_by or "").strip()),
-        )
-        conn.commit()
-    except Exception:
+    with db() as conn:
         try:
-            conn.rollback()
+            cur = conn.cursor()
+            cur.execute(
+                _HOLD_DECISION_INSERT_SQL,
+                (int(hold_id), (decision or "").upper(), int(target_customer_id) if target_customer_id else None, _json_dumps_safe(decision_json), (decided_by or "").strip()),
+            )
+            conn.commit()
         except Exception:
-            pass
-    finally:
-        conn.close()
+            try:
+                conn.rollback()
+            except Exception:
+                pass
 
 
 def insert_approval_proof(hold_id: int, approval: str, approval_json: dict | None = None, approved_by: str = "") -> None:
-    conn = get_connection()
-    try:
-        cur = conn.cursor()
-        cur.execute(
-            """INSERT INTO approval_proofs (hold_id, approval, approval_json, approved_by)
-                   VALUES (?, ?, ?, ?)""",
-            (int(hold_id), (approval or "AUTO").upper(), _json_dumps_safe(approval_json), (approved_by or "").strip()),
-        )
-        conn.commit()
-    except Exception:
+    with db() as conn:
         try:
-            conn.rollback()
+            cur = conn.cursor()
+            cur.execute(
+                _APPROVAL_PROOF_INSERT_SQL,
+                (int(hold_id), (approval or "AUTO").upper(), _json_dumps_safe(approval_json), (approved_by or "").strip()),
+            )
+            conn.commit()
         except Exception:
-            pass
-    finally:
-        conn.close()
+            try:
+                conn.rollback()
+            except Exception:
+                pass
 
 
 def apply_upload_hold_decision(
@@ -1558,7 +2548,37 @@ def apply_upload_hold_decision(
 
     main.py 호환:
     - 반환: (ok:bool, msg:str, extra:dict|None)
+
+    [성능] 조회/정정/고객생성/계약반영/결정/승인/감사 헬퍼가 db() 공유 연결 1개를 쓰고 마지막에 1회 커밋
+    - 시작 시 BEGIN IMMEDIATE로 쓰기 잠금을 먼저 잡는다(중간에 잠금 승격 실패/대기 없음)
+    - 도중 예외면 전체 rollback → 보류/고객/계약/증적이 결정 이전 상태 그대로 남는다
     """
+    with db() as conn:
+        try:
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            res = _apply_upload_hold_decision(int(hold_id), decision, target_customer_id, corrected, decided_by)
+            conn.commit()
+            return res
+        except Exception as e:
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            # 롤백된 구간에서 add_contract가 남긴 최근 처리 캐시 항목도 함께 비움
+            clear_recent_contracts()
+            audit_log("HOLD_DECISION_FAILED", "upload_holds", int(hold_id), {"decision": (decision or "").upper(), "error": str(e)}, decided_by)
+            return False, f"결정 반영 실패: {e}", {"decision": (decision or "").upper()}
+
+
+def _apply_upload_hold_decision(
+    hold_id: int,
+    decision: str,
+    target_customer_id: int | None,
+    corrected: dict | None,
+    decided_by: str,
+):
+    """apply_upload_hold_decision 본체(바깥 db() 구간 안에서 실행)."""
     hold = get_upload_hold(int(hold_id))
     if not hold:
         return False, "보류 항목을 찾을 수 없음", None
@@ -1566,9 +2586,12 @@ def apply_upload_hold_decision(
     dec = (decision or "").upper().strip()
 
     # 정정 저장(선택) - UI에서 입력한 정정값을 hold_store에 즉시 반영
+    # [성능] 저장된 정정값은 반환값으로 받아 사용(hold 재조회 SELECT 생략)
+    stored_corr = None
     if corrected is not None:
-        update_upload_hold_corrected(int(hold_id), corrected, decided_by=decided_by)
-        hold = get_upload_hold(int(hold_id)) or hold
+        c_saved, _, c_extra = update_upload_hold_corrected(int(hold_id), corrected, decided_by=decided_by)
+        if c_saved and c_extra:
+            stored_corr = c_extra.get("corrected")
 
     # SKIP(보류 유지 또는 스킵 처리)
     if dec == "SKIP":
@@ -1585,10 +2608,13 @@ def apply_upload_hold_decision(
         payload = {}
 
     # effective customer fields
-    try:
-        corr = json.loads(hold.get("corrected_json") or "{}")
-    except Exception:
-        corr = {}
+    if stored_corr is not None:
+        corr = stored_corr
+    else:
+        try:
+            corr = json.loads(hold.get("corrected_json") or "{}")
+        except Exception:
+            corr = {}
     if corrected is not None:
         # 바로 전달된 정정값을 우선
         corr = corrected or corr
@@ -1623,8 +2649,8 @@ def apply_upload_hold_decision(
 
     fin = payload.get("financial") or {}
 
-    # 계약 반영
-    c_ok, c_action = add_contract(
+    # 계약 반영(add_contract는 'insert'/'update'/'same'/'ambig'/'fail' 문자열을 반환)
+    c_action = add_contract(
         customer_id=cid,
         company=fin.get("company"),
         product_name=fin.get("product_name"),
@@ -1638,13 +2664,13 @@ def apply_upload_hold_decision(
         insured_phone=fin.get("insured_phone"),
         insured_birth=fin.get("insured_birth"),
         insured_gender=fin.get("insured_gender"),
-        insured_ssn=fin.get("insured_ssn"),
         policyholder_name=payload.get("policyholder_name"),
         policyholder_phone=payload.get("policyholder_phone"),
         policyholder_type=payload.get("policyholder_type"),
         policyholder_norm=payload.get("policyholder_norm"),
         primary_role=payload.get("primary_role"),
     )
+    c_ok = c_action in ("insert", "update", "same")
 
     # decision 기록(증적용)
     insert_hold_decision(int(hold_id), dec, cid, {"contract_action": c_action}, decided_by)
@@ -1652,23 +2678,21 @@ def apply_upload_hold_decision(
 
     if not c_ok or c_action in ("ambig", "fail"):
         # 계약 반영이 실패/모호면 hold를 OPEN으로 유지(대표님 재확인 필요)
-        conn = get_connection()
-        try:
-            cur = conn.cursor()
-            cur.execute(
-                """UPDATE upload_holds
-                      SET reason_msg=?, status='OPEN', updated_at=CURRENT_TIMESTAMP
-                    WHERE id=?""",
-                (f"{hold.get('reason_msg') or ''} | 계약반영:{c_action}", int(hold_id)),
-            )
-            conn.commit()
-        except Exception:
+        with db() as conn:
             try:
-                conn.rollback()
+                cur = conn.cursor()
+                cur.execute(
+                    """UPDATE upload_holds
+                          SET reason_msg=?, status='OPEN', updated_at=CURRENT_TIMESTAMP
+                        WHERE id=?""",
+                    (f"{hold.get('reason_msg') or ''} | 계약반영:{c_action}", int(hold_id)),
+                )
+                conn.commit()
             except Exception:
-                pass
-        finally:
-            conn.close()
+                try:
+                    conn.rollback()
+                except Exception:
+                    pass
         audit_log(
             "HOLD_DECISION_APPLIED_BUT_CONTRACT_NOT_OK",
             "upload_holds",
@@ -1683,6 +2707,39 @@ def apply_upload_hold_decision(
     return True, f"반영 완료: customer_id={cid}, contract={c_action}", {"decision": dec, "customer_id": cid, "contract_action": c_action}
 
 
+def _query_df(conn, sql: str, params=(), dtypes: dict | None = None) -> pd.DataFrame:
+    """고정 스키마 목록 조회용 DataFrame 생성(pd.read_sql 대체).
+
+    [성능] fetchall 결과를 DataFrame.from_records로 바로 만든다(read_sql 래퍼/SQL 방언 판별 생략)
+    - coerce_float=True로 read_sql과 같은 dtype(정수/실수/문자열) 추론 결과를 유지
+    - dtypes를 주면 해당 컬럼만 astype(copy=False)
+    """
+    cur = conn.execute(sql, params)
+    cols = [d[0] for d in cur.description]
+    df = pd.DataFrame.from_records(cur.fetchall(), columns=cols, coerce_float=True)
+    if dtypes:
+        df = df.astype(dtypes, copy=False)
+    return df
+
+
+# [성능] 표시용 이름 치환(CASE)은 database.v_contracts_display 뷰 한 곳에서 계산
+_CONTRACT_DISPLAY_COLS = """
+            id, customer_id,
+            company, product_name, policy_no, policy_no_norm,
+            premium, status, start_date, end_date, coverage_summary,
+            insured_phone, insured_birth, insured_gender,
+            policyholder_name, policyholder_type, policyholder_norm, policyholder_phone, primary_role,
+            insured_name, display_party_label"""
+_CONTRACT_DISPLAY_COLS_WITH_RAW = """
+            id, customer_id,
+            company, product_name, policy_no, policy_no_norm,
+            premium, status, start_date, end_date, coverage_summary,
+            insured_phone, insured_birth, insured_gender,
+            insured_name_raw,
+            policyholder_name, policyholder_type, policyholder_norm, policyholder_phone, primary_role,
+            insured_name, display_party_label"""
+
+
 # [데이터(db포함) 오류] 계약자/피보험자 분기 + 법인 계약자 검색 지원(명세서 반영)
 def get_customer_contracts(customer_id):
     """고객(상담 주체) 기준 계약 조회.
@@ -1696,33 +2753,14 @@ def get_customer_contracts(customer_id):
     - 조회 단계에서 insured_name을 '표시용 이름(display_party)'으로 치환해 반환한다.
     """
     conn = get_connection()
-    sql = """
-        SELECT
-            id, customer_id,
-            company, product_name, policy_no, policy_no_norm,
-            premium, status, start_date, end_date, coverage_summary,
-            insured_phone, insured_birth, insured_gender,
-            policyholder_name, policyholder_type, policyholder_norm, policyholder_phone, primary_role,
-            CASE
-                WHEN COALESCE(policyholder_name,'') <> ''
-                 AND COALESCE(insured_name,'') <> ''
-                 AND REPLACE(policyholder_name,' ','') <> REPLACE(insured_name,' ','')
-                THEN policyholder_name
-                ELSE insured_name
-            END AS insured_name,
-            CASE
-                WHEN COALESCE(policyholder_name,'') <> ''
-                 AND COALESCE(insured_name,'') <> ''
-                 AND REPLACE(policyholder_name,' ','') <> REPLACE(insured_name,' ','')
-                THEN '계'
-                ELSE '피'
-            END AS display_party_label
-        FROM contracts
+    sql = f"""
+        SELECT {_CONTRACT_DISPLAY_COLS}
+        FROM v_contracts_display
         WHERE customer_id = ?
         ORDER BY start_date DESC, id DESC
     """
     try:
-        return pd.read_sql(sql, conn, params=(customer_id,))
+        return _query_df(conn, sql, (customer_id,))
     except Exception:
         return pd.DataFrame()
     finally:
@@ -1731,6 +2769,39 @@ def get_customer_contracts(customer_id):
 
 
 
+# [성능] 법인 계약자 검색 결과 단기 캐시(입력창 재실행마다 같은 검색어를 다시 조회하지 않음)
+# - (LIKE 검색값, limit) → DataFrame, _CORP_SEARCH_TTL_SEC 이내만 재사용(호출부에는 복사본 반환)
+# - 계약 삭제/초기화 등으로 clear_recent_contracts()가 불리면 같이 비움
+_CORP_SEARCH_TTL_SEC = 5.0
+_CORP_SEARCH_MAX = 64
+_CORP_SEARCH_CACHE: "OrderedDict[tuple, tuple[float, pd.DataFrame]]" = OrderedDict()
+_CORP_SEARCH_LOCK = threading.Lock()
+
+
+def _corp_search_cache_get(key: tuple) -> pd.DataFrame | None:
+    with _CORP_SEARCH_LOCK:
+        hit = _CORP_SEARCH_CACHE.get(key)
+        if hit is None:
+            return None
+        if time.monotonic() - hit[0] > _CORP_SEARCH_TTL_SEC:
+            _CORP_SEARCH_CACHE.pop(key, None)
+            return None
+        return hit[1].copy()
+
+
+def _corp_search_cache_put(key: tuple, df: pd.DataFrame) -> None:
+    with _CORP_SEARCH_LOCK:
+        _CORP_SEARCH_CACHE.pop(key, None)
+        _CORP_SEARCH_CACHE[key] = (time.monotonic(), df)
+        while len(_CORP_SEARCH_CACHE) > _CORP_SEARCH_MAX:
+            _CORP_SEARCH_CACHE.popitem(last=False)
+
+
+def _corp_search_cache_clear() -> None:
+    with _CORP_SEARCH_LOCK:
+        _CORP_SEARCH_CACHE.clear()
+
+
 def search_corporate_contracts(policyholder_query: str, *, limit: int = 200) -> pd.DataFrame:
     """법인 계약자 기준 전체 계약 조회(검색용).
     - UI: '법인 계약자 검색' 입력창에서 사용
@@ -1744,42 +2815,63 @@ def search_corporate_contracts(policyholder_query: str, *, limit: int = 200) ->
     # 정규화가 너무 공격적일 수 있으므로, norm이 비면 원문 기반으로도 한번 더 조회 가능하도록 한다.
     like_val = f"%{qn or q.replace(' ', '')}%"
 
-    conn = get_connection()
-    sql = """
-        SELECT
-            id, customer_id,
-            company, product_name, policy_no, policy_no_norm,
-            premium, status, start_date, end_date, coverage_summary,
-            insured_phone, insured_birth, insured_gender,
-                        insured_name AS insured_name_raw,
-policyholder_name, policyholder_type, policyholder_norm, policyholder_phone, primary_role,
-            -- 표시 규칙 동일 적용(2/3은 계약자만, 1은 피보험자만)
-            CASE
-                WHEN COALESCE(policyholder_name,'') <> ''
-                 AND COALESCE(insured_name,'') <> ''
-                 AND REPLACE(policyholder_name,' ','') <> REPLACE(insured_name,' ','')
-                THEN policyholder_name
-                ELSE insured_name
-            END AS insured_name,
-            CASE
-                WHEN COALESCE(policyholder_name,'') <> ''
-                 AND COALESCE(insured_name,'') <> ''
-                 AND REPLACE(policyholder_name,' ','') <> REPLACE(insured_name,' ','')
-                THEN '계'
-                ELSE '피'
-            END AS display_party_label
-        FROM contracts
+    needle = like_val[1:-1]
+
+    def _sql(extra: str = "") -> str:
+        return f"""
+        SELECT {_CONTRACT_DISPLAY_COLS_WITH_RAW}
+        FROM v_contracts_display
         WHERE COALESCE(policyholder_type,'') = 'CORP'
-          AND COALESCE(policyholder_norm,'') LIKE ?
+          AND COALESCE(policyholder_norm,'') LIKE ?{extra}
         ORDER BY policyholder_norm ASC, start_date DESC, id DESC
         LIMIT ?
     """
+
+    cache_key = (like_val, int(limit))
+    cached = _corp_search_cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    conn = get_connection()
     try:
-        return pd.read_sql(sql, conn, params=(like_val, int(limit)))
+        df = None
+        # [성능] 3글자 이상(와일드카드 없음)은 FTS5(trigram)로 후보 rowid만 추린 뒤 기존 LIKE로 최종 판정
+        # - trigram 결과는 LIKE 결과의 상위집합 → LIKE를 남겨 대소문자 규칙까지 기존과 동일
+        if len(needle) >= 3 and "%" not in needle and "_" not in needle:
+            try:
+                df = _query_df(
+                    conn,
+                    _sql("\n          AND id IN (SELECT rowid FROM contracts_ph_fts WHERE contracts_ph_fts MATCH ?)"),
+                    (like_val, '"' + needle.replace('"', '""') + '"', int(limit)),
+                )
+            except Exception:
+                # FTS 미지원/색인 없음 → LIKE로 후퇴
+                df = None
+        if df is None:
+            df = _query_df(conn, _sql(), (like_val, int(limit)))
     except Exception:
         return pd.DataFrame()
     finally:
         conn.close()
+    _corp_search_cache_put(cache_key, df)
+    return df.copy()
+
+
+# [성능] 앱 설정(JSON) 캐시: 설정 파일의 (경로, mtime, 크기)가 같으면 다시 읽지 않음
+# - 설정 화면에서 저장하면 mtime이 바뀌므로 다음 호출에서 자동 갱신
+@lru_cache(maxsize=1)
+def _app_config_cached(path: str, mtime_ns: int, size: int) -> dict:
+    return utils.load_app_config()
+
+
+def _app_config() -> dict:
+    path = utils.APP_CONFIG_PATH
+    try:
+        st = os.stat(path)
+    except OSError:
+        # 파일이 없으면 load_app_config가 기본값으로 생성(다음 호출부터 캐시)
+        return utils.load_app_config()
+    return dict(_app_config_cached(path, st.st_mtime_ns, st.st_size))
 
 
 def add_task(customer_id, type, due_date):
@@ -1788,22 +2880,37 @@ def add_task(customer_id, type, due_date):
     except: return False
     finally: conn.close()
 
+# [성능] SQLite 3.35+: 완료 처리와 일정 조회를 UPDATE ... RETURNING 1문장으로(SELECT→UPDATE 사이 경합 없음)
+_TASK_COMPLETE_SQL = "UPDATE tasks SET status='완료' WHERE id=? AND status<>'완료'"
+_TASK_OPEN_GET_SQL = "SELECT id, type, due_date, gcal_event_id, gcal_calendar_id FROM tasks WHERE id=? AND status<>'완료'"
+_TASK_COMPLETE_RETURNING_SQL = (
+    _TASK_COMPLETE_SQL + " RETURNING id, type, due_date, gcal_event_id, gcal_calendar_id"
+    if sqlite3.sqlite_version_info >= (3, 35, 0) else None
+)
+
+
 def complete_task(tid: int, *, sync_gcal: bool = True) -> bool:
     """Task 완료 처리 + (선택) 구글 캘린더 이벤트도 같이 처리
     - utils.load_app_config()의 gcal_done_action에 따라:
         * 'prefix' : 제목 앞에 ✅ 붙이기
         * 'delete' : 구글 캘린더 이벤트 삭제
+    - 없는 일정이거나 이미 '완료'면 False(캘린더 처리도 중복 실행하지 않음)
     """
     conn = get_connection()
     try:
         cur = conn.cursor()
-        cur.execute("SELECT id, type, due_date, gcal_event_id, gcal_calendar_id FROM tasks WHERE id=?", (int(tid),))
-        row = cur.fetchone()
+        if _TASK_COMPLETE_RETURNING_SQL:
+            cur.execute(_TASK_COMPLETE_RETURNING_SQL, (int(tid),))
+            row = cur.fetchone()
+        else:
+            cur.execute(_TASK_OPEN_GET_SQL, (int(tid),))
+            row = cur.fetchone()
+            if row:
+                cur.execute(_TASK_COMPLETE_SQL, (int(row[0]),))
         if not row:
             return False
 
         task_id, title, due_date, event_id, cal_id = row
-        cur.execute("UPDATE tasks SET status='완료' WHERE id=?", (int(task_id),))
         conn.commit()
     except Exception:
         try:
@@ -1820,7 +2927,7 @@ def complete_task(tid: int, *, sync_gcal: bool = True) -> bool:
 
     cfg = {}
     try:
-        cfg = utils.load_app_config()
+        cfg = _app_config()
     except Exception:
         cfg = {}
 
@@ -1836,27 +2943,27 @@ def complete_task(tid: int, *, sync_gcal: bool = True) -> bool:
     done_action = (cfg.get("gcal_done_action") or "prefix").strip().lower()
     tz = cfg.get("gcal_timezone") or "Asia/Seoul"
 
-    try:
-        import gcal_sync
-        ok = False
-        if done_action == "delete":
-            ok = gcal_sync.delete_event(calendar_id=cal_id, event_id=str(event_id))
-            _set_task_gcal_sync(task_id, sync_status=("DONE_DELETED" if ok else "DONE_DELETE_FAIL"))
-        else:
-            ok = gcal_sync.mark_event_done(calendar_id=cal_id, event_id=str(event_id))
-            _set_task_gcal_sync(task_id, sync_status=("DONE_PREFIXED" if ok else "DONE_PREFIX_FAIL"))
-        return True
-    except Exception:
-        _set_task_gcal_sync(task_id, sync_status="DONE_SYNC_EXCEPTION")
-        return True
+    # [성능] 캘린더 API 호출은 백그라운드 작업자에 맡기고 즉시 반환(결과는 gcal_sync_status에 기록)
+    _enqueue_gcal_job("done", task_id, str(cal_id), {"event_id": str(event_id), "action": done_action})
+    return True
+
+
+# [성능] 동기화 시각은 SQLite가 직접 기록(쓰기마다 Python datetime 생성/문자열화 생략)
+# - 기존 datetime.now().isoformat(sep=' ')와 같은 로컬시각 'YYYY-MM-DD HH:MM:SS.fff' (마이크로초 → 밀리초)
+_GCAL_LAST_SYNC_NOW = "strftime('%Y-%m-%d %H:%M:%f', 'now', 'localtime')"
+_TASK_GCAL_INFO_SQL = (
+    "UPDATE tasks SET gcal_calendar_id=?, gcal_event_id=?, gcal_html_link=?, gcal_sync_status=?, "
+    f"gcal_last_sync={_GCAL_LAST_SYNC_NOW} WHERE id=?"
+)
+_TASK_GCAL_SYNC_SQL = f"UPDATE tasks SET gcal_sync_status=?, gcal_last_sync={_GCAL_LAST_SYNC_NOW} WHERE id=?"
 
 
 def _set_task_gcal_info(task_id: int, *, calendar_id: str | None, event_id: str | None, html_link: str | None, sync_status: str) -> None:
     conn = get_connection()
     try:
         conn.execute(
-            "UPDATE tasks SET gcal_calendar_id=?, gcal_event_id=?, gcal_html_link=?, gcal_sync_status=?, gcal_last_sync=? WHERE id=?",
-            (calendar_id, event_id, html_link, sync_status, datetime.now().isoformat(sep=' '), int(task_id)),
+            _TASK_GCAL_INFO_SQL,
+            (calendar_id, event_id, html_link, sync_status, int(task_id)),
         )
         conn.commit()
     except Exception:
@@ -1869,8 +2976,8 @@ def _set_task_gcal_sync(task_id: int, *, sync_status: str) -> None:
     conn = get_connection()
     try:
         conn.execute(
-            "UPDATE tasks SET gcal_sync_status=?, gcal_last_sync=? WHERE id=?",
-            (sync_status, datetime.now().isoformat(sep=' '), int(task_id)),
+            _TASK_GCAL_SYNC_SQL,
+            (sync_status, int(task_id)),
         )
         conn.commit()
     except Exception:
@@ -1879,6 +2986,257 @@ def _set_task_gcal_sync(task_id: int, *, sync_status: str) -> None:
         conn.close()
 
 
+# [성능] 구글 캘린더 동기화 백그라운드 작업자
+# - 요청 경로(완료 처리/일정 등록)는 DB 커밋 후 큐에 넣고 즉시 반환(gcal_sync_status='QUEUED')
+# - 작업자는 초당 _GCAL_RATE_PER_SEC건 이하로 호출, 429/403/5xx 등은 Retry-After 또는 지수 백오프로 최대 _GCAL_MAX_TRIES회
+# - 이벤트 생성(insert)은 멱등이 아니므로 요청이 거절된 것이 확실한 429/403만 재시도(5xx는 실제 생성됐을 수 있어 중복 방지)
+# - 큐는 메모리에만 있으므로 작업자 최초 기동 시 'QUEUED'로 남은 일정(재시작 등)을 DB에서 복원해 다시 넣음
+# - 작업자 스레드를 못 띄우면 기존처럼 현재 스레드에서 바로 처리
+_GCAL_QUEUE: "queue.Queue[tuple]" = queue.Queue()
+_GCAL_RATE_PER_SEC = 5.0
+_GCAL_MAX_TRIES = 3
+_GCAL_BACKOFF_SEC = 1.0
+_GCAL_BACKOFF_MAX_SEC = 30.0
+_GCAL_RETRY_HTTP = {403, 429, 500, 502, 503, 504}
+_GCAL_CREATE_RETRY_HTTP = {403, 429}
+_GCAL_THREAD: threading.Thread | None = None
+_GCAL_THREAD_LOCK = threading.Lock()
+_GCAL_LAST_CALL = 0.0
+_GCAL_RESUMED = False
+_GCAL_QUEUED_TASKS_SQL = (
+    "SELECT id, type, status, due_date, gcal_event_id, gcal_calendar_id FROM tasks "
+    "WHERE gcal_sync_status='QUEUED' ORDER BY id"
+)
+
+
+class _GcalRetry(Exception):
+    """재시도 대상 실패(API가 False 반환 또는 일시적 HTTP 오류)."""
+
+    def __init__(self, wait: float = 0.0):
+        super().__init__("gcal retry")
+        self.wait = wait
+
+
+def _gcal_throttle() -> None:
+    # 작업자 1개가 순차 호출하므로 호출 간 최소 간격만 지키면 초당 호출 수 상한이 된다
+    global _GCAL_LAST_CALL
+    gap = (1.0 / _GCAL_RATE_PER_SEC) - (time.monotonic() - _GCAL_LAST_CALL)
+    if gap > 0:
+        time.sleep(gap)
+    _GCAL_LAST_CALL = time.monotonic()
+
+
+def _gcal_retry_wait(e: Exception, retry_http=_GCAL_RETRY_HTTP) -> float | None:
+    """googleapiclient HttpError 등에서 재시도 대기 시간(Retry-After) 추출, 재시도 대상이 아니면 None."""
+    resp = getattr(e, "resp", None)
+    try:
+        status = int(getattr(resp, "status", 0) or 0)
+    except Exception:
+        status = 0
+    if status not in retry_http:
+        return None
+    try:
+        return max(0.0, float(resp.get("retry-after")))
+    except Exception:
+        return 0.0
+
+
+def _gcal_call(fn, retry_http=_GCAL_RETRY_HTTP):
+    """fn()을 속도 제한 + 재시도로 실행. 최종 실패 시 False/예외를 그대로 돌려준다.
+    - retry_http: 재시도할 HTTP 상태 코드(멱등이 아닌 호출은 _GCAL_CREATE_RETRY_HTTP)
+    """
+    for attempt in range(_GCAL_MAX_TRIES):
+        _gcal_throttle()
+        try:
+            res = fn()
+            if res is False:
+                raise _GcalRetry()
+            return res
+        except Exception as e:
+            wait = e.wait if isinstance(e, _GcalRetry) else _gcal_retry_wait(e, retry_http)
+            last = attempt + 1 >= _GCAL_MAX_TRIES
+            if wait is None or last:
+                if isinstance(e, _GcalRetry):
+                    return False
+                raise
+            backoff = min(_GCAL_BACKOFF_MAX_SEC, _GCAL_BACKOFF_SEC * (2 ** attempt))
+            time.sleep(max(wait or 0.0, backoff))
+    return False
+
+
+def _run_gcal_job(op: str, task_id: int, cal_id: str, payload: dict) -> None:
+    try:
+        import gcal_sync
+    except Exception:
+        # 라이브러리 미설치 등
+        _set_task_gcal_sync(task_id, sync_status=("DONE_SYNC_EXCEPTION" if op == "done" else "CREATE_FAIL"))
+        return
+
+    if op == "done":
+        event_id = payload.get("event_id")
+        try:
+            if payload.get("action") == "delete":
+                ok = _gcal_call(lambda: gcal_sync.delete_event(calendar_id=cal_id, event_id=event_id))
+                _set_task_gcal_sync(task_id, sync_status=("DONE_DELETED" if ok else "DONE_DELETE_FAIL"))
+            else:
+                ok = _gcal_call(lambda: gcal_sync.mark_event_done(calendar_id=cal_id, event_id=event_id))
+                _set_task_gcal_sync(task_id, sync_status=("DONE_PREFIXED" if ok else "DONE_PREFIX_FAIL"))
+        except Exception:
+            _set_task_gcal_sync(task_id, sync_status="DONE_SYNC_EXCEPTION")
+        return
+
+    if op == "create":
+        try:
+            tz = payload.get("tz") or "Asia/Seoul"
+            start_dt, end_dt = gcal_sync.parse_due_datetime(payload.get("due") or "", tz=tz)
+            ev_id, html_link = _gcal_call(lambda: gcal_sync.create_event(
+                calendar_id=cal_id,
+                summary=payload.get("summary") or "",
+                start_dt=start_dt,
+                end_dt=end_dt,
+                description=payload.get("description") or "",
+                timezone=tz,
+                interactive=False,
+            ), retry_http=_GCAL_CREATE_RETRY_HTTP)
+            _set_task_gcal_info(task_id, calendar_id=cal_id, event_id=str(ev_id), html_link=str(html_link), sync_status="CREATED")
+        except Exception:
+            # OAuth 미완료/라이브러리 미설치/재시도 소진 등
+            _set_task_gcal_sync(task_id, sync_status="CREATE_FAIL")
+
+
+def _gcal_worker_loop() -> None:
+    while True:
+        job = _GCAL_QUEUE.get()
+        try:
+            _run_gcal_job(*job)
+        except Exception:
+            pass
+        finally:
+            _GCAL_QUEUE.task_done()
+
+
+def _gcal_queued_jobs() -> list:
+    """'QUEUED'로 남았지만 큐에는 없는 일정(앱 재시작 등)을 현재 설정 기준 작업으로 복원.
+    - 완료 + 이벤트 있음 → done, 미완료 + 이벤트 없음 → create(상담 설명은 보관되지 않아 빈 값)
+    - 그 밖의 조합/연동 OFF는 작업 없이 상태만 정리
+    """
+    conn = get_connection()
+    try:
+        rows = conn.execute(_GCAL_QUEUED_TASKS_SQL).fetchall()
+    except Exception:
+        rows = []
+    finally:
+        conn.close()
+    if not rows:
+        return []
+    try:
+        cfg = _app_config()
+    except Exception:
+        cfg = {}
+    enabled = bool(cfg.get("gcal_enabled", False))
+    default_cal = cfg.get("gcal_calendar_id") or "primary"
+    tz = cfg.get("gcal_timezone") or "Asia/Seoul"
+    done_action = (cfg.get("gcal_done_action") or "prefix").strip().lower()
+
+    jobs = []
+    for task_id, title, status, due_date, event_id, cal_id in rows:
+        if not enabled:
+            _set_task_gcal_sync(task_id, sync_status="DISABLED")
+        elif status == "완료" and event_id:
+            jobs.append(("done", int(task_id), str(cal_id or default_cal), {"event_id": str(event_id), "action": done_action}))
+        elif status == "완료":
+            _set_task_gcal_sync(task_id, sync_status="NO_EVENT_ID")
+        elif not event_id:
+            jobs.append(("create", int(task_id), str(default_cal), {
+                "summary": str(title or ""), "due": str(due_date or ""), "tz": str(tz), "description": "",
+            }))
+        else:
+            _set_task_gcal_sync(task_id, sync_status="CREATED")
+    return jobs
+
+
+def _ensure_gcal_worker() -> bool:
+    global _GCAL_THREAD, _GCAL_RESUMED
+    if _GCAL_THREAD is not None and _GCAL_THREAD.is_alive():
+        return True
+    with _GCAL_THREAD_LOCK:
+        if _GCAL_THREAD is None or not _GCAL_THREAD.is_alive():
+            try:
+                t = threading.Thread(target=_gcal_worker_loop, name="kfit-gcal-sync", daemon=True)
+                t.start()
+                _GCAL_THREAD = t
+            except Exception:
+                return False
+            # 프로세스 최초 기동 시 1회: 이전 프로세스 큐에 있던(이제는 사라진) 작업 복원
+            # - 호출부의 새 작업은 이 함수 반환 후 'QUEUED' 기록 → 여기서 중복으로 집히지 않음
+            if not _GCAL_RESUMED:
+                _GCAL_RESUMED = True
+                for job in _gcal_queued_jobs():
+                    _GCAL_QUEUE.put(job)
+    return True
+
+
+def resume_gcal_sync() -> None:
+    """앱 시작 시 호출: 작업자를 띄우고 'QUEUED'로 남은 일정 동기화를 재개 (이미 떠 있으면 아무것도 안 함)."""
+    _ensure_gcal_worker()
+
+
+def _enqueue_gcal_job(op: str, task_id: int, cal_id: str, payload: dict) -> None:
+    job = (op, int(task_id), str(cal_id), dict(payload or {}))
+    if _ensure_gcal_worker():
+        _set_task_gcal_sync(int(task_id), sync_status="QUEUED")
+        _GCAL_QUEUE.put(job)
+    else:
+        _run_gcal_job(*job)
+
+
+def wait_gcal_sync(timeout: float | None = None) -> bool:
+    """대기 중인 캘린더 동기화 작업이 끝날 때까지 대기(테스트/일괄 작업 마무리용). 시간 내 완료 여부 반환."""
+    if _GCAL_THREAD is None or not _GCAL_THREAD.is_alive():
+        return _GCAL_QUEUE.unfinished_tasks == 0
+    if timeout is None:
+        _GCAL_QUEUE.join()
+        return True
+    end = time.monotonic() + float(timeout)
+    while _GCAL_QUEUE.unfinished_tasks and time.monotonic() < end:
+        time.sleep(0.05)
+    return _GCAL_QUEUE.unfinished_tasks == 0
+
+
+# [성능] 대시보드 위젯(할일/갱신, 청약 기념일) 결과 캐시
+# - dashboard_cache(scope, payload=pickle, computed_at=epoch초), _DASH_CACHE_TTL_SEC 이내면 재계산 없이 반환
+# - scope에 오늘 날짜/조회 범위를 넣어 날짜가 바뀌면 자동으로 다른 키
+# - tasks/contracts/customers 변경 시 DB 트리거가 캐시를 비움(database._ensure_dashboard_cache)
+# - 캐시 테이블이 없거나 깨져도 매번 계산하는 기존 동작으로 후퇴
+_DASH_CACHE_TTL_SEC = 60.0
+_DASH_CACHE_GET_SQL = "SELECT payload, computed_at FROM dashboard_cache WHERE scope=?"
+_DASH_CACHE_PUT_SQL = "INSERT OR REPLACE INTO dashboard_cache (scope, payload, computed_at) VALUES (?, ?, ?)"
+
+
+def _dash_cache_get(scope: str):
+    conn = get_connection()
+    try:
+        row = conn.execute(_DASH_CACHE_GET_SQL, (scope,)).fetchone()
+        if not row or time.time() - float(row[1] or 0) > _DASH_CACHE_TTL_SEC:
+            return None
+        return pickle.loads(row[0])
+    except Exception:
+        return None
+    finally:
+        conn.close()
+
+
+def _dash_cache_put(scope: str, value) -> None:
+    conn = get_connection()
+    try:
+        conn.execute(_DASH_CACHE_PUT_SQL, (scope, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), time.time()))
+        conn.commit()
+    except Exception:
+        pass
+    finally:
+        conn.close()
+
+
 def get_dashboard_todos(
     days_task_lookahead: int = 7,
     days_renewal_lookahead: int = 30,
@@ -1896,8 +3254,6 @@ def get_dashboard_todos(
     - 기존 코드(포지션 인자)도 그대로 동작
     반환 DF 컬럼: customer_id, name, type, date, source, msg
     """
-    conn = get_connection()
-    todos = []
     now = datetime.now()
 
     # ✅ days_lookahead(키워드) 우선 적용
@@ -1913,94 +3269,74 @@ def get_dashboard_todos(
     upper_task_s = upper_task.strftime("%Y-%m-%d %H:%M")
     today_s = now.strftime("%Y-%m-%d")
 
-    try:
-        cur = conn.cursor()
+    upper_renew = (now + timedelta(days=int(days_renewal_lookahead))).date().isoformat()
 
-        # 1) 다음 일정(미완료) : 연체 포함, 상한일까지
-        # 1) 다음 일정(미완료)
-        #  - include_overdue=True : 과거(연체) + 미래(상한일까지)
-        #  - include_overdue=False: 오늘~상한일까지(미래만)
-        if include_overdue:
-            cur.execute(
-                """
-                SELECT t.id, t.customer_id, c.name, t.type, t.due_date
-                  FROM tasks t
-                  JOIN customers c ON t.customer_id = c.id
-                 WHERE t.status = '미완료'
-                   AND COALESCE(t.due_date,'') <> ''
-                   AND datetime(t.due_date) <= datetime(?)
-                 ORDER BY datetime(t.due_date) ASC
-                """,
-                (upper_task_s,),
-            )
-        else:
-            cur.execute(
-                """
-                SELECT t.id, t.customer_id, c.name, t.type, t.due_date
-                  FROM tasks t
-                  JOIN customers c ON t.customer_id = c.id
-                 WHERE t.status = '미완료'
-                   AND COALESCE(t.due_date,'') <> ''
-                   AND date(t.due_date) >= date(?)
-                   AND datetime(t.due_date) <= datetime(?)
-                 ORDER BY datetime(t.due_date) ASC
-                """,
-                (today_s, upper_task_s),
-            )
-        for r in cur.fetchall():
-            todos.append({
-                "id": r[0],
-                "customer_id": r[1],
-                "name": r[2],
-                "type": r[3],
-                "date": r[4],
-                "source": "task",
-                "msg": f"{r[2]} {r[3]}",
-            })
-
-        # 2) 갱신 알림(정상 계약, 만기일)
-        upper_renew = (now + timedelta(days=int(days_renewal_lookahead))).date().isoformat()
-        cur.execute(
-            """
-            SELECT con.id, con.customer_id, c.name, con.product_name, con.end_date
+    # [성능] 할일/갱신을 UNION ALL 1문장으로 조회해 최종 컬럼/정렬까지 SQL에서 완성 → read_sql 1회
+    # - 1) 다음 일정(미완료)
+    #    include_overdue=True : 과거(연체) + 미래(상한일까지) / False: 오늘~상한일까지(미래만)
+    # - 2) 갱신 알림(정상 계약, 만기일)
+    # - msg는 기존 f-string과 동일하게 NULL을 'None'으로 표기
+    # - 정렬: date(문자열) → 할일 먼저 → 각 구간의 기존 정렬 순서
+    task_from = "" if include_overdue else "AND date(t.due_date) >= date(?)"
+    sql = f"""
+        SELECT id, customer_id, name, type, date, source, msg FROM (
+            SELECT t.id, t.customer_id, c.name, t.type, t.due_date AS date, 'task' AS source,
+                   IFNULL(c.name, 'None') || ' ' || IFNULL(t.type, 'None') AS msg,
+                   0 AS part, datetime(t.due_date) AS part_key, t.id AS part_id
+              FROM tasks t
+              JOIN customers c ON t.customer_id = c.id
+             WHERE t.status = '미완료'
+               AND COALESCE(t.due_date,'') <> ''
+               {task_from}
+               AND datetime(t.due_date) <= datetime(?)
+            UNION ALL
+            SELECT con.id, con.customer_id, c.name, '갱신', con.end_date, 'renewal',
+                   IFNULL(c.name, 'None') || ' ' || IFNULL(con.product_name, 'None') || ' 만기',
+                   1, con.end_date, con.id
               FROM contracts con
               JOIN customers c ON con.customer_id = c.id
              WHERE con.status = '정상'
                AND COALESCE(con.end_date,'') <> ''
                AND con.end_date BETWEEN ? AND ?
-             ORDER BY con.end_date ASC
-            """,
-            (today_s, upper_renew),
         )
-        for r in cur.fetchall():
-            todos.append({
-                "id": r[0],
-                "customer_id": r[1],
-                "name": r[2],
-                "type": "갱신",
-                "date": r[4],
-                "source": "renewal",
-                "msg": f"{r[2]} {r[3]} 만기",
-            })
+        ORDER BY date, part, part_key, part_id
+    """
+    params = ([] if include_overdue else [today_s]) + [upper_task_s, today_s, upper_renew]
 
+    scope = f"todos:{today_s}:{int(days_task_lookahead)}:{int(days_renewal_lookahead)}:{int(bool(include_overdue))}"
+    cached = _dash_cache_get(scope)
+    if cached is not None:
+        return cached
+
+    conn = get_connection()
+    try:
+        df = pd.read_sql(sql, conn, params=params)
     except Exception:
         return pd.DataFrame()
     finally:
         conn.close()
 
-    return pd.DataFrame(todos).sort_values("date") if todos else pd.DataFrame()
+    df = df if not df.empty else pd.DataFrame()
+    _dash_cache_put(scope, df)
+    return df
+
+_CUSTOMER_LIST_COLS = (
+    "c.id, c.name, c.phone, c.phone_norm, c.birth_date, c.gender, c.region, c.address, c.email, "
+    "c.last_contact, c.created_at"
+)
 
 def get_all_customers():
     """전체 고객 목록을 반환합니다.
 
-    - customers 테이블 기본 컬럼 + 고객별 상담(consultations) 건수(consult_count)를 포함합니다.
+    - 목록/대시보드가 쓰는 customers 컬럼 + 고객별 상담(consultations) 건수(consult_count)를 포함합니다.
     - consult_count는 상담 이력이 없는 고객도 0으로 반환됩니다.
+    - [성능] memo/custom_data 같은 긴 TEXT는 읽지 않음(상세 정보는 get_customer_detail)
     """
     conn = get_connection()
     try:
-        q = """
+        q = f"""
             SELECT
-                c.*,
+                {_CUSTOMER_LIST_COLS},
                 COALESCE(x.consult_count, 0) AS consult_count
             FROM customers c
             LEFT JOIN (
@@ -2011,7 +3347,7 @@ def get_all_customers():
             ON c.id = x.customer_id
             ORDER BY c.created_at DESC
         """
-        return pd.read_sql(q, conn)
+        return _query_df(conn, q)
     except:
         return pd.DataFrame()
     finally:
@@ -2027,11 +3363,113 @@ def add_interaction_log(cid, type, content, date):
     except: return False
     finally: conn.close()
 
-def get_customer_logs(cid):
+
+# [성능] 대량 적재용: 행마다 연결/파싱/커밋하지 않고 BEGIN IMMEDIATE 1회 + executemany 묶음 처리
+# - 같은 SQL 문자열을 반복 사용 → 풀 연결의 statement cache(cached_statements)에서 재사용
+_BULK_FLUSH_ROWS = 10000
+_TASK_INSERT_SQL = "INSERT INTO tasks (customer_id, type, due_date) VALUES (?, ?, ?)"
+_CONSULT_INSERT_SQL = "INSERT INTO consultations (customer_id, consult_type, content, consult_date) VALUES (?,?,?,?)"
+_CUSTOMER_LAST_CONTACT_SQL = "UPDATE customers SET last_contact=? WHERE id=?"
+
+
+def _bulk_row(r, keys: tuple[str, ...]) -> tuple:
+    # dict(키 이름) / tuple·list(순서) 모두 허용, 첫 칸(customer_id)은 int로 고정
+    vals = tuple(r.get(k) for k in keys) if isinstance(r, dict) else tuple(r)[:len(keys)]
+    if len(vals) != len(keys):
+        raise ValueError(f"컬럼 수 불일치: {len(vals)} != {len(keys)}")
+    return (int(vals[0]),) + vals[1:]
+
+
+def _executemany_chunked(cur, sql: str, rows: list[tuple]) -> None:
+    for i in range(0, len(rows), _BULK_FLUSH_ROWS):
+        cur.executemany(sql, rows[i:i + _BULK_FLUSH_ROWS])
+
+
+def add_tasks_bulk(rows) -> int:
+    """일정(tasks) 여러 건을 한 트랜잭션으로 저장.
+
+    rows: (customer_id, type, due_date) 튜플 또는 같은 키의 dict 목록
+    반환: 저장 건수(실패 시 0, 전체 rollback)
+    """
+    try:
+        data = [_bulk_row(r, ("customer_id", "type", "due_date")) for r in (rows or [])]
+    except Exception:
+        return 0
+    if not data:
+        return 0
+
+    with db() as conn:
+        try:
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            _executemany_chunked(conn.cursor(), _TASK_INSERT_SQL, data)
+            conn.commit()
+            return len(data)
+        except Exception:
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            return 0
+
+
+def add_consultations_bulk(rows) -> int:
+    """상담이력(consultations) 여러 건을 한 트랜잭션으로 저장 + 고객 last_contact 갱신.
+
+    rows: (customer_id, consult_type, content, consult_date) 튜플 또는 같은 키의 dict 목록
+    - last_contact는 add_interaction_log를 순서대로 부른 것과 같게 행 순서대로 덮어쓴다
+    반환: 저장 건수(실패 시 0, 전체 rollback)
+    """
+    try:
+        data = [_bulk_row(r, ("customer_id", "consult_type", "content", "consult_date")) for r in (rows or [])]
+    except Exception:
+        return 0
+    if not data:
+        return 0
+
+    with db() as conn:
+        try:
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            cur = conn.cursor()
+            _executemany_chunked(cur, _CONSULT_INSERT_SQL, data)
+            _executemany_chunked(cur, _CUSTOMER_LAST_CONTACT_SQL, [(d[3], d[0]) for d in data])
+            conn.commit()
+            return len(data)
+        except Exception:
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            return 0
+
+# [성능] 소량 조회(상담이력/최근활동/다음일정)는 기본으로 list[dict] 반환(DataFrame 생성 비용 생략)
+# - 화면에서 DataFrame이 필요한 곳만 as_df=True (기존 pd.read_sql 결과와 동일)
+def _fetch_dicts(cur) -> list[dict]:
+    cols = [d[0] for d in cur.description]
+    return [dict(zip(cols, r)) for r in cur.fetchall()]
+
+
+def _small_query(sql: str, params: tuple, as_df: bool):
     conn = get_connection()
-    try: return pd.read_sql("SELECT id, consult_date as '날짜', consult_type as '방법', content as '내용' FROM consultations WHERE customer_id=? ORDER BY consult_date DESC", conn, params=(cid,))
-    except: return pd.DataFrame()
-    finally: conn.close()
+    try:
+        if as_df:
+            return _query_df(conn, sql, params)
+        return _fetch_dicts(conn.execute(sql, params))
+    except Exception:
+        return pd.DataFrame() if as_df else []
+    finally:
+        conn.close()
+
+
+_CUSTOMER_LOGS_SQL = "SELECT id, consult_date as '날짜', consult_type as '방법', content as '내용' FROM consultations WHERE customer_id=? ORDER BY consult_date DESC"
+_RECENT_ACTIVITIES_SQL = "SELECT c.name, l.consult_date as date, l.consult_type as type, l.content FROM consultations l JOIN customers c ON l.customer_id=c.id ORDER BY l.consult_date DESC LIMIT ?"
+_OPEN_TASKS_SQL = "SELECT id, type, status, due_date, gcal_event_id, gcal_html_link, gcal_calendar_id, gcal_sync_status FROM tasks WHERE customer_id=? AND status='미완료' ORDER BY due_date ASC"
+
+
+def get_customer_logs(cid, *, as_df: bool = False):
+    """고객 상담이력(최신순). 키: id, 날짜, 방법, 내용"""
+    return _small_query(_CUSTOMER_LOGS_SQL, (cid,), as_df)
 
 
 
@@ -2051,9 +3489,13 @@ def delete_consultations(ids):
         ids = [int(x) for x in ids if str(x).strip() != '']
         if not ids:
             return True
-        qmarks = ','.join(['?'] * len(ids))
         cur = conn.cursor()
-        cur.execute(f"DELETE FROM consultations WHERE id IN ({qmarks})", ids)
+        # [성능] id 목록을 JSON 1개로 바인딩(SQL 문장 고정), json_each 미지원이면 자리표시자 방식
+        try:
+            cur.execute(f"DELETE FROM consultations WHERE id {_JSON_EACH_IN}", (json.dumps(ids),))
+        except sqlite3.OperationalError:
+            qmarks = ','.join(['?'] * len(ids))
+            cur.execute(f"DELETE FROM consultations WHERE id IN ({qmarks})", ids)
         conn.commit()
         return True
     except Exception:
@@ -2065,37 +3507,76 @@ def delete_consultations(ids):
     finally:
         conn.close()
 
-def get_recent_activities(limit=5):
-    conn = get_connection()
-    try:
-        df = pd.read_sql("SELECT c.name, l.consult_date as date, l.consult_type as type, l.content FROM consultations l JOIN customers c ON l.customer_id=c.id ORDER BY l.consult_date DESC LIMIT ?", conn, params=(limit,))
-        df.columns = ['name', 'date', 'type', 'content']; return df
-    except: return pd.DataFrame()
-    finally: conn.close()
+def get_recent_activities(limit=5, *, as_df: bool = False):
+    """최근 상담 활동. 키: name, date, type, content"""
+    return _small_query(_RECENT_ACTIVITIES_SQL, (limit,), as_df)
+
+_MONTHLY_CONSULT_COUNT_SQL = """
+    SELECT COUNT(*) FROM consultations
+     WHERE consult_date >= ? AND consult_date < ?
+       AND strftime('%Y-%m', consult_date) = ?
+"""
 
 def get_monthly_consultation_count():
     conn = get_connection()
     try:
-        m = datetime.now().strftime('%Y-%m')
-        cur = conn.cursor(); cur.execute("SELECT COUNT(*) FROM consultations WHERE strftime('%Y-%m', consult_date)=?", (m,))
+        now = datetime.now()
+        m = now.strftime('%Y-%m')
+        nxt = (now.replace(day=1) + timedelta(days=32)).strftime('%Y-%m')
+        # [성능] 문자열 범위(이번 달 ~ 다음 달 미만)로 idx_consult_date 범위 탐색, strftime 조건은 기존 판정 유지용
+        cur = conn.cursor(); cur.execute(_MONTHLY_CONSULT_COUNT_SQL, (m, nxt, m))
         return cur.fetchone()[0]
     except: return 0
     finally: conn.close()
 
+# [성능] 자식 테이블(contracts/consultations/tasks)이 모두 ON DELETE CASCADE FK이고 foreign_keys=ON이면
+# customers 1건 DELETE로 끝낸다. FK 없이 만들어진 구버전 DB는 기존 테이블별 DELETE로 처리
+_CUSTOMER_CASCADE_CHECK_SQL = """
+    SELECT (SELECT foreign_keys FROM pragma_foreign_keys)
+         + (SELECT COUNT(DISTINCT t.name)
+              FROM (SELECT 'contracts' AS name UNION ALL SELECT 'consultations' UNION ALL SELECT 'tasks') t,
+                   pragma_foreign_key_list(t.name) fk
+             WHERE fk."table" = 'customers' AND fk."from" = 'customer_id' AND fk.on_delete = 'CASCADE')
+"""
+
+
 def delete_customer(cid):
     conn = get_connection()
     try:
-        for t in ["contracts", "consultations", "tasks", "customers"]:
+        try:
+            cascade = conn.execute(_CUSTOMER_CASCADE_CHECK_SQL).fetchone()[0] == 4
+        except Exception:
+            cascade = False
+        tables = ["customers"] if cascade else ["contracts", "consultations", "tasks", "customers"]
+        for t in tables:
             col = 'id' if t=='customers' else 'customer_id'
             conn.execute(f"DELETE FROM {t} WHERE {col}=?", (cid,))
         conn.commit()
     except: pass
-    finally: conn.close()
+    finally:
+        conn.close()
+        clear_recent_contracts()
 
 # ---------------------------------------------------------
 # [Auto-added] Dashboard helpers (anniversaries / tasks txn)
 # ---------------------------------------------------------
 
+_BRIEF_MAP_SQL = """
+    SELECT customer_id, company, policy_no FROM (
+        SELECT customer_id,
+               COALESCE(company,'') AS company,
+               COALESCE(policy_no,'') AS policy_no,
+               ROW_NUMBER() OVER (
+                   PARTITION BY customer_id ORDER BY COALESCE(start_date,'') DESC, id DESC
+               ) AS rn
+          FROM contracts
+         WHERE customer_id {ids_in}
+           AND COALESCE(company,'') <> ''
+    )
+     WHERE rn = 1
+"""
+
+
 def get_contract_brief_map(customer_ids: list[int]):
     """고객별 대표 계약(보험사/증권번호) 1개를 뽑아오는 간단 맵
     반환: {customer_id: (company, policy_no)}
@@ -2103,30 +3584,23 @@ def get_contract_brief_map(customer_ids: list[int]):
     if not customer_ids:
         return {}
 
+    # [성능] 고객별 1건만 SQL에서 고름(ROW_NUMBER) → 고객 수만큼만 읽고 Python 중복 제거 루프 없음
+    ids = list(customer_ids)
     conn = get_connection()
     try:
-        # IN 절 파라미터
-        ph = ",".join(["?"] * len(customer_ids))
-        sql = f"""
-            SELECT customer_id,
-                   COALESCE(company,'') AS company,
-                   COALESCE(policy_no,'') AS policy_no,
-                   COALESCE(start_date,'') AS start_date,
-                   id
-              FROM contracts
-             WHERE customer_id IN ({ph})
-               AND COALESCE(company,'') <> ''
-             ORDER BY customer_id ASC, start_date DESC, id DESC
-        """
         cur = conn.cursor()
-        cur.execute(sql, tuple(customer_ids))
-        rows = cur.fetchall()
-
+        # [성능] id 목록은 JSON 1개로 바인딩(json_each) → id 개수와 무관하게 같은 SQL(문장 캐시 재사용)
+        try:
+            cur.execute(_BRIEF_MAP_SQL.format(ids_in=_JSON_EACH_IN), (json.dumps(ids),))
+            return {int(cid): (comp, pol) for cid, comp, pol in cur.fetchall()}
+        except Exception:
+            pass
+        # json_each 미지원 등 → 기존 자리표시자 묶음 조회
         out = {}
-        for cid, comp, pol, _, _id in rows:
-            cid = int(cid)
-            if cid not in out:
-                out[cid] = (comp, pol)
+        for i in range(0, len(ids), _SQL_IN_CHUNK):
+            chunk = ids[i:i + _SQL_IN_CHUNK]
+            cur.execute(_BRIEF_MAP_SQL.format(ids_in=f"IN ({','.join('?' * len(chunk))})"), tuple(chunk))
+            out.update({int(cid): (comp, pol) for cid, comp, pol in cur.fetchall()})
         return out
     except Exception:
         return {}
@@ -2134,16 +3608,51 @@ def get_contract_brief_map(customer_ids: list[int]):
         conn.close()
 
 
+_ANNIV_READ_CHUNK = 5000
+
+
+def _anniv_monthday_window(now: date, days_ahead: int) -> list[str] | None:
+    """오늘~D+days_ahead 사이에 올 수 있는 기념일의 'MM-DD' 목록(1년 이상이면 None=전체).
+
+    - 평년에는 2/29 개시 계약의 기념일이 2/28로 보정되므로, 2/28이 범위에 있으면 '02-29'도 포함
+    """
+    if int(days_ahead) >= 365:
+        return None
+    out = set()
+    for i in range(int(days_ahead) + 1):
+        md = (now + timedelta(days=i)).strftime("%m-%d")
+        out.add(md)
+        if md == "02-28":
+            out.add("02-29")
+    return sorted(out)
+
+
 def get_upcoming_policy_anniversaries(days_ahead: int = 7):
     """청약(계약) 기념일(개시일 기준) D-day 리스트
     반환: list[dict] (대시보드에서 사용)
     dict keys:
       customer_id, name, company, policy_no, start_date, next_anniv, years, d_day
+
+    [성능] 전체 계약을 읽어 Python에서 거르지 않고, SQL에서 기념일 범위 밖 계약을 먼저 제외
+    - 'YYYY-MM-DD…' 형식은 월-일(substr)로 범위 판정, 그 외 형식은 기존 파싱 규칙에 맡기기 위해 그대로 통과
+    - 결과는 chunksize 단위로 읽어 처리(전체 DataFrame을 한 번에 만들지 않음)
     """
-    conn = get_connection()
-    try:
-        df = pd.read_sql(
-            """
+    now = datetime.now().date()
+    scope = f"anniv:{now.isoformat()}:{int(days_ahead)}"
+    cached = _dash_cache_get(scope)
+    if cached is not None:
+        return cached
+
+    md_window = _anniv_monthday_window(now, days_ahead)
+    where_md = ""
+    params: list = []
+    if md_window is not None:
+        where_md = f"""
+               AND (con.start_date NOT GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]*'
+                    OR substr(con.start_date, 6, 5) IN ({','.join('?' * len(md_window))}))"""
+        params = md_window
+
+    sql = f"""
             SELECT con.customer_id,
                    c.name,
                    COALESCE(con.company,'') AS company,
@@ -2152,15 +3661,15 @@ def get_upcoming_policy_anniversaries(days_ahead: int = 7):
                    COALESCE(con.status,'') AS status
               FROM contracts con
               JOIN customers c ON con.customer_id = c.id
-             WHERE COALESCE(con.start_date,'') <> ''
-            """,
-            conn,
-        )
+             WHERE COALESCE(con.start_date,'') <> ''{where_md}
+            """
+
+    conn = get_connection()
+    out = []
+    try:
+        for df in pd.read_sql(sql, conn, params=params, chunksize=_ANNIV_READ_CHUNK):
+            out.extend(_anniv_rows(df, now, days_ahead))
     except Exception:
-        try:
-            conn.close()
-        except Exception:
-            pass
         return []
     finally:
         try:
@@ -2168,10 +3677,72 @@ def get_upcoming_policy_anniversaries(days_ahead: int = 7):
         except Exception:
             pass
 
+    _dash_cache_put(scope, out)
+    return out
+
+
+def _anniv_rows(df: pd.DataFrame, now: date, days_ahead: int) -> list[dict]:
+    # [성능] 날짜 파싱/기념일 계산을 열 단위(벡터)로 처리, 실패하는 청크만 행 단위 경로로 후퇴
+    try:
+        return _anniv_rows_vectorized(df, now, days_ahead)
+    except Exception:
+        return _anniv_rows_loop(df, now, days_ahead)
+
+
+def _anniv_next_date(year: int, sd: pd.Series) -> pd.Series:
+    # year년의 (월, 일) 날짜, 없는 날짜(2/29 등)는 그 달 28일로 보정
+    ymd = pd.DataFrame({"year": year, "month": sd.dt.month, "day": sd.dt.day}, index=sd.index)
+    cand = pd.to_datetime(ymd, errors="coerce")
+    fix = cand.isna()
+    if fix.any():
+        cand[fix] = pd.to_datetime(ymd[fix].assign(day=28))
+    return cand
+
+
+def _anniv_rows_vectorized(df: pd.DataFrame, now: date, days_ahead: int) -> list[dict]:
     if df.empty:
         return []
+    start_raw = df["start_date"].fillna("").astype(str).str.strip()
+    # 행마다 pd.to_datetime(문자열)을 부르던 것과 같게: 원소별 형식 추론(format="mixed")
+    sd = pd.to_datetime(start_raw.where(start_raw != ""), errors="coerce", format="mixed")
+    if getattr(sd.dt, "tz", None) is not None:
+        sd = sd.dt.tz_localize(None)
+    sd = sd[sd.notna()].dt.normalize()
+    if sd.empty:
+        return []
 
-    now = datetime.now().date()
+    now_ts = pd.Timestamp(now)
+    cand = _anniv_next_date(now.year, sd)
+    passed = cand < now_ts
+    if passed.any():
+        cand[passed] = _anniv_next_date(now.year + 1, sd[passed])
+
+    d_day = (cand - now_ts).dt.days
+    keep = (d_day >= 0) & (d_day <= int(days_ahead))
+    if not keep.any():
+        return []
+
+    idx = keep[keep].index
+    sub = df.loc[idx]
+    return [
+        {
+            "customer_id": int(cid or 0),
+            "name": str(nm or ""),
+            "company": str(co or ""),
+            "policy_no": str(pn or ""),
+            "start_date": s.date().isoformat(),
+            "next_anniv": c.date().isoformat(),
+            "years": int(c.year - s.year),
+            "d_day": int(dd),
+        }
+        for cid, nm, co, pn, s, c, dd in zip(
+            sub["customer_id"], sub["name"], sub["company"], sub["policy_no"],
+            sd[idx], cand[idx], d_day[idx],
+        )
+    ]
+
+
+def _anniv_rows_loop(df: pd.DataFrame, now: date, days_ahead: int) -> list[dict]:
     out = []
     for _, r in df.iterrows():
         start_raw = str(r.get("start_date") or "").strip()
@@ -2220,6 +3791,31 @@ def get_upcoming_policy_anniversaries(days_ahead: int = 7):
     return out
 
 
+# [성능] 상담 INSERT + last_contact UPDATE + (선택)일정 INSERT를 BEGIN IMMEDIATE 트랜잭션 1개로
+# - 시작부터 쓰기 잠금을 잡아 도중 잠금 승격 대기/실패 없음, 커밋(fsync)은 호출부에서 1회
+# - SQLite 3.35+: 일정 INSERT ... RETURNING id로 새 id를 같은 문장에서 받음
+_TASK_INSERT_RETURNING_SQL = (
+    _TASK_INSERT_SQL + " RETURNING id" if sqlite3.sqlite_version_info >= (3, 35, 0) else None
+)
+
+
+def _save_consultation_with_task(conn, customer_id, consult_type, content, consult_date, task_title, task_due) -> int | None:
+    """상담/일정 저장 본체(커밋은 호출부). 일정을 넣었으면 task id 반환."""
+    if not conn.in_transaction:
+        conn.execute("BEGIN IMMEDIATE")
+    cur = conn.cursor()
+    cur.execute(_CONSULT_INSERT_SQL, (int(customer_id), consult_type, content, consult_date))
+    cur.execute(_CUSTOMER_LAST_CONTACT_SQL, (consult_date, int(customer_id)))
+
+    if not (task_title and task_due):
+        return None
+    if _TASK_INSERT_RETURNING_SQL:
+        cur.execute(_TASK_INSERT_RETURNING_SQL, (int(customer_id), task_title, task_due))
+        return int(cur.fetchone()[0])
+    cur.execute(_TASK_INSERT_SQL, (int(customer_id), task_title, task_due))
+    return int(cur.lastrowid)
+
+
 def add_consultation_with_optional_task(*, customer_id: int, consult_type: str, content: str, consult_date: str,
                                        task_title: str | None = None, task_due: str | None = None) -> bool:
     """상담이력 + (선택)다음일정 한 번에 저장(트랜잭션)
@@ -2227,19 +3823,7 @@ def add_consultation_with_optional_task(*, customer_id: int, consult_type: str,
     """
     conn = get_connection()
     try:
-        cur = conn.cursor()
-        cur.execute(
-            "INSERT INTO consultations (customer_id, consult_type, content, consult_date) VALUES (?,?,?,?)",
-            (int(customer_id), consult_type, content, consult_date),
-        )
-        cur.execute("UPDATE customers SET last_contact=? WHERE id=?", (consult_date, int(customer_id)))
-
-        if task_title and task_due:
-            cur.execute(
-                "INSERT INTO tasks (customer_id, type, due_date) VALUES (?,?,?)",
-                (int(customer_id), task_title, task_due),
-            )
-
+        _save_consultation_with_task(conn, customer_id, consult_type, content, consult_date, task_title, task_due)
         conn.commit()
         return True
     except Exception:
@@ -2258,24 +3842,12 @@ def add_consultation_with_optional_task_v2(*, customer_id: int, consult_type: st
 
     return:
       {"ok": bool, "task_id": int|None, "gcal_ok": bool|None, "gcal_event_id": str|None}
+    - 캘린더 이벤트는 비동기로 생성되므로 gcal_ok/gcal_event_id는 None(진행 상태는 tasks.gcal_sync_status)
     """
     conn = get_connection()
     task_id = None
     try:
-        cur = conn.cursor()
-        cur.execute(
-            "INSERT INTO consultations (customer_id, consult_type, content, consult_date) VALUES (?,?,?,?)",
-            (int(customer_id), consult_type, content, consult_date),
-        )
-        cur.execute("UPDATE customers SET last_contact=? WHERE id=?", (consult_date, int(customer_id)))
-
-        if task_title and task_due:
-            cur.execute(
-                "INSERT INTO tasks (customer_id, type, due_date) VALUES (?,?,?)",
-                (int(customer_id), task_title, task_due),
-            )
-            task_id = int(cur.lastrowid)
-
+        task_id = _save_consultation_with_task(conn, customer_id, consult_type, content, consult_date, task_title, task_due)
         conn.commit()
     except Exception:
         try:
@@ -2292,7 +3864,7 @@ def add_consultation_with_optional_task_v2(*, customer_id: int, consult_type: st
 
     # --- 구글 캘린더 연동(설정 ON + 인증 완료일 때만) ---
     try:
-        cfg = utils.load_app_config()
+        cfg = _app_config()
     except Exception:
         cfg = {}
 
@@ -2303,50 +3875,35 @@ def add_consultation_with_optional_task_v2(*, customer_id: int, consult_type: st
     cal_id = cfg.get("gcal_calendar_id") or "primary"
     tz = cfg.get("gcal_timezone") or "Asia/Seoul"
 
-    try:
-        import gcal_sync
-        start_dt, end_dt = gcal_sync.parse_due_datetime(str(task_due), tz=tz)
-        # 설명에 상담 타입/날짜를 붙여두면 검색/관리 편함
-        desc = f"[KFIT 상담일지] {consult_type} / {consult_date}\n\n{content[:800]}"
-        ev_id, html_link = gcal_sync.create_event(
-            calendar_id=str(cal_id),
-            summary=str(task_title),
-            start_dt=start_dt,
-            end_dt=end_dt,
-            description=desc,
-            timezone=str(tz),
-            interactive=False,
-        )
-        _set_task_gcal_info(task_id, calendar_id=str(cal_id), event_id=str(ev_id), html_link=str(html_link), sync_status="CREATED")
-        return {"ok": True, "task_id": task_id, "gcal_ok": True, "gcal_event_id": str(ev_id)}
-    except Exception:
-        # OAuth 미완료/라이브러리 미설치 등
-        _set_task_gcal_sync(task_id, sync_status="CREATE_FAIL")
-        return {"ok": True, "task_id": task_id, "gcal_ok": False, "gcal_event_id": None}
+    # [성능] 이벤트 생성은 백그라운드 작업자에 맡김(gcal_ok=None, 결과는 gcal_sync_status: CREATED/CREATE_FAIL)
+    # 설명에 상담 타입/날짜를 붙여두면 검색/관리 편함
+    desc = f"[KFIT 상담일지] {consult_type} / {consult_date}\n\n{content[:800]}"
+    _enqueue_gcal_job("create", task_id, str(cal_id), {
+        "summary": str(task_title),
+        "due": str(task_due),
+        "tz": str(tz),
+        "description": desc,
+    })
+    return {"ok": True, "task_id": task_id, "gcal_ok": None, "gcal_event_id": None}
 
 
 
-def get_open_tasks(customer_id: int):
+def get_open_tasks(customer_id: int, *, as_df: bool = False):
     """고객의 미완료 다음 일정 목록"""
-    conn = get_connection()
     try:
-        return pd.read_sql(
-            "SELECT id, type, status, due_date, gcal_event_id, gcal_html_link, gcal_calendar_id, gcal_sync_status FROM tasks WHERE customer_id=? AND status='미완료' ORDER BY due_date ASC",
-            conn,
-            params=(int(customer_id),),
-        )
+        params = (int(customer_id),)
     except Exception:
-        return pd.DataFrame()
-    finally:
-        conn.close()
+        return pd.DataFrame() if as_df else []
+    return _small_query(_OPEN_TASKS_SQL, params, as_df)
 
 # [queries.py] 추가 및 수정 부분
 def get_customer_detail(cid: int):
     """[추가] 특정 고객의 상세 정보 조회 (수정 팝업용)"""
     conn = get_connection()
     try:
-        conn.row_factory = sqlite3.Row # 딕셔너리 형태로 접근 가능하게 설정
         cur = conn.cursor()
+        # [성능] 이름 접근은 이 커서에만 적용(풀 연결의 row_factory를 바꾸고 반납 시 되돌리지 않음)
+        cur.row_factory = sqlite3.Row # 딕셔너리 형태로 접근 가능하게 설정
         cur.execute("SELECT * FROM customers WHERE id = ?", (cid,))
         row = cur.fetchone()
         return dict(row) if row else None
@@ -2416,6 +3973,10 @@ import database as _kfit_db  # 로컬 모듈 (순환 참조 회피: 함수 재
 def get_connection():  # noqa: F811  (의도적 재정의)
     """Always delegate to the hardened connection factory."""
     return _kfit_db.get_connection()
+
+def db():
+    """스레드 로컬 공유 연결 컨텍스트(database.db 위임)."""
+    return _kfit_db.db()
 # [체크리스트]
 # - UI 유지/존치: ✅ 유지됨 (Queries/API 확장)
 # - 신규: hold_store/decision/approval/audit CRUD + 후보 추천 + create_customer_direct(중복 허용)
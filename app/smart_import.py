@@ -7,19 +7,33 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional, Tuple
 import io
+import os
 import re
+import time
+import zlib
+import pickle
 import hashlib
+from functools import lru_cache
 import pandas as pd
 
 import database
 import queries
 
+# --- Precompiled Patterns ---
+# [성능] 행 단위 정규화 헬퍼의 패턴을 모듈 로드 시 1회만 컴파일
+_RE_CORP_SUFFIX = re.compile(r"\b(CORP|CORPORATION|LTD|LIMITED|INC)\b", re.I)
+_RE_BRACKETS = re.compile(r"[\(\)\[\]\{\}]")
+_RE_WS = re.compile(r"\s+")
+_RE_NON_DIGITS = re.compile(r"\D+")
+
 
 # ---------------------------------------------------------
 # [데이터(db포함) 오류] 계약자(개인/법인) 분기 헬퍼
 # - Smart ETL이 계약자 우선으로 'row['name']'을 채우는 구조이므로,
 #   법인 계약자는 CRM 관리 주체가 아니며, 피보험자를 고객으로 귀속시키는 정책을 적용한다.
+# - [성능] 업로드 행마다 같은 계약자명이 반복되므로 판정/정규화 결과 캐시(순수 함수)
 # ---------------------------------------------------------
+@lru_cache(maxsize=4096)
 def _is_corporate_name(name: str) -> bool:
     n = (name or "").strip()
     if not n:
@@ -31,11 +45,12 @@ def _is_corporate_name(name: str) -> bool:
     ]
     if any(k in n for k in corp_kws):
         return True
-    if re.search(r"\b(CORP|CORPORATION|LTD|LIMITED|INC)\b", n, flags=re.I):
+    if _RE_CORP_SUFFIX.search(n):
         return True
     return False
 
 
+@lru_cache(maxsize=4096)
 def _norm_org_name(name: str) -> str:
     n = (name or "").strip()
     if not n:
@@ -43,14 +58,22 @@ def _norm_org_name(name: str) -> str:
     n2 = n.replace(" ", "")
     for k in ["(주)", "㈜", "주식회사", "유한회사", "재단법인", "사단법인"]:
         n2 = n2.replace(k, "")
-    n2 = re.sub(r"[\(\)\[\]\{\}]", "", n2)
+    n2 = _RE_BRACKETS.sub("", n2)
     return n2
 
 
 
-def read_upload_file(file_bytes: bytes, filename: str) -> pd.DataFrame:
-    """업로드 파일을 DataFrame으로 로드 (csv/xlsx)."""
-    bio = io.BytesIO(file_bytes)
+def read_upload_file(file_bytes: Any, filename: str) -> pd.DataFrame:
+    """업로드 파일을 DataFrame으로 로드 (csv/xlsx).
+
+    - bytes 또는 파일 객체(Streamlit UploadedFile 등) 모두 허용
+    - 파일 객체는 bytes로 복사하지 않고 처음 위치로 되돌려 그대로 읽음
+    """
+    if hasattr(file_bytes, "read"):
+        bio = file_bytes
+        bio.seek(0)
+    else:
+        bio = io.BytesIO(file_bytes)
     lower = (filename or "").lower()
     if lower.endswith(".csv"):
         # utf-8-sig 우선, 실패 시 기본
@@ -66,11 +89,92 @@ def sha256_hex(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
+def file_fingerprint(data: Any, chunk_size: int = 1 << 20) -> str:
+    """업로드 파일 동일성 판별 키 (CRC32 + 크기, hex).
+
+    - 재업로드 차단/보류 묶음 식별용 키이며 무결성(보안) 용도가 아니므로 SHA-256 대신 CRC32 사용
+    - 크기를 함께 붙여 충돌 가능성을 낮춤 (예: "1a2b3c4d-5f00")
+    - 파일 객체는 chunk 단위로 읽어 전체 bytes 복사 없이 계산 후 위치를 처음으로 되돌림
+    """
+    if not hasattr(data, "read"):
+        return f"{zlib.crc32(data) & 0xFFFFFFFF:08x}-{len(data):x}"
+
+    crc, size = 0, 0
+    data.seek(0)
+    for chunk in iter(lambda: data.read(chunk_size), b""):
+        crc = zlib.crc32(chunk, crc)
+        size += len(chunk)
+    data.seek(0)
+    return f"{crc & 0xFFFFFFFF:08x}-{size:x}"
+
+
+# ---------------------------------------------------------
+# [성능] 분석 결과(rows) 디스크 보관
+# - rows(행 + 후보고객)는 수십 MB까지 커질 수 있어 session_state에 통째로 두지 않고
+#   file_hash 단위 파일로 1회 저장 → 화면에서는 경로만 들고 필요 시 로드
+# - 행 안의 dict/list(financial, customer_candidates 등)를 그대로 보존해야 하므로 pickle 사용
+# - 파일명에 세션 키를 포함: 같은 파일을 여러 세션이 분석해도 서로의 파일을 덮어쓰거나 지우지 않음
+# - 고객 이름/연락처/생년월일이 들어 있으므로 이탈 세션의 오래된 파일은 저장 시 함께 정리
+# ---------------------------------------------------------
+ANALYSIS_CACHE_DIR = os.path.join(database.USER_DATA_DIR, "cache")
+ANALYSIS_CACHE_MAX_AGE_SEC = 24 * 3600
+
+
+def save_analysis_rows(file_hash: str, rows: List[Dict[str, Any]], session_key: str = "") -> str:
+    """분석 rows를 캐시 파일로 저장하고 경로 반환 (임시파일 → 교체로 원자적 저장)."""
+    os.makedirs(ANALYSIS_CACHE_DIR, exist_ok=True)
+    purge_stale_analysis_rows()
+    name = f"analysis_{session_key}_{file_hash}.pkl" if session_key else f"analysis_{file_hash}.pkl"
+    path = os.path.join(ANALYSIS_CACHE_DIR, name)
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump(list(rows or []), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+    return path
+
+
+def load_analysis_rows(path: str) -> List[Dict[str, Any]]:
+    """save_analysis_rows로 저장한 rows 로드 (파일이 없으면 FileNotFoundError: 0건으로 진행하지 않도록)."""
+    if not path or not os.path.exists(path):
+        raise FileNotFoundError(f"분석 결과 파일 없음: {path}")
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def purge_stale_analysis_rows(max_age_sec: float = ANALYSIS_CACHE_MAX_AGE_SEC) -> int:
+    """max_age_sec보다 오래된 분석 캐시 파일(.pkl/.tmp) 삭제, 삭제 건수 반환 (실패해도 무시)."""
+    removed = 0
+    cutoff = time.time() - max_age_sec
+    try:
+        entries = list(os.scandir(ANALYSIS_CACHE_DIR))
+    except OSError:
+        return 0
+    for e in entries:
+        if not (e.name.startswith("analysis_") and (e.name.endswith(".pkl") or e.name.endswith(".pkl.tmp"))):
+            continue
+        try:
+            if e.stat().st_mtime < cutoff:
+                os.remove(e.path)
+                removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+def discard_analysis_rows(path: Optional[str]) -> None:
+    """캐시 파일 정리 (실패해도 무시)."""
+    try:
+        if path and os.path.exists(path):
+            os.remove(path)
+    except Exception:
+        pass
+
+
 def normalize_name(name: Any) -> str:
     """이름 공백 제거(기존 로직과 일치)"""
     if name is None:
         return ""
-    return re.sub(r"\s+", "", str(name)).strip()
+    return _RE_WS.sub("", str(name)).strip()
 
 
 def _as_str(x: Any) -> str:
@@ -80,7 +184,7 @@ def _as_str(x: Any) -> str:
 
 
 def _phone_last4_from_raw(phone_raw: Any) -> str:
-    s = re.sub(r"\D+", "", _as_str(phone_raw))
+    s = _RE_NON_DIGITS.sub("", _as_str(phone_raw))
     return s[-4:] if len(s) >= 4 else ""
 
 
@@ -304,24 +408,31 @@ def analyze_processed_df(df_processed: pd.DataFrame) -> Dict[str, Any]:
     conn = database.get_connection()
     cur = conn.cursor()
 
-    for seq, (_, row) in enumerate(df_processed.iterrows(), start=1):
-        name_raw = row.get("name")
-        phone_raw = row.get("phone")
-        birth_date = _as_str(row.get("birth_date"))
-        gender = _as_str(row.get("gender"))
-        region = _as_str(row.get("region"))
-        address = _as_str(row.get("address"))
-        email = _as_str(row.get("email"))
-        memo = _as_str(row.get("memo"))
-        custom_data = row.get("custom_data") or ""
-        match_key = _as_str(row.get("match_key"))
+    # [성능] iterrows(행마다 Series 생성) 대신 일반 tuple로 순회하고 컬럼→위치 맵으로 접근
+    cols = {c: i for i, c in enumerate(df_processed.columns)}
+
+    def _get(t, col):
+        i = cols.get(col)
+        return t[i] if i is not None else None
+
+    for seq, row in enumerate(df_processed.itertuples(index=False, name=None), start=1):
+        name_raw = _get(row, "name")
+        phone_raw = _get(row, "phone")
+        birth_date = _as_str(_get(row, "birth_date"))
+        gender = _as_str(_get(row, "gender"))
+        region = _as_str(_get(row, "region"))
+        address = _as_str(_get(row, "address"))
+        email = _as_str(_get(row, "email"))
+        memo = _as_str(_get(row, "memo"))
+        custom_data = _get(row, "custom_data") or ""
+        match_key = _as_str(_get(row, "match_key"))
 
         name = normalize_name(name_raw)
         phone = _as_str(phone_raw)
         phone_norm = queries.normalize_phone(phone) if phone else ""
         last4 = _phone_last4_from_raw(phone)
 
-        fin = row.get("financial")
+        fin = _get(row, "financial")
         fin = fin if isinstance(fin, dict) else None
 
         # ---------------------------------------------------------
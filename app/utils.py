@@ -17,6 +17,13 @@ import json
 from datetime import datetime
 import os
 
+# --- Precompiled Patterns ---
+# [성능] 행/헤더 단위로 반복 호출되는 정규화 헬퍼의 패턴을 모듈 로드 시 1회만 컴파일
+_RE_CORP_SUFFIX = re.compile(r"\b(CORP|CORPORATION|LTD|LIMITED|INC)\b", re.I)
+_RE_BRACKETS = re.compile(r"[\(\)\[\]\{\}]")
+_RE_HEADER_STRIP = re.compile(r'[^가-힣a-zA-Z0-9]')
+_RE_NON_DIGIT = re.compile(r'[^0-9]')
+
 
 # ---------------------------------------------------------
 # [데이터(db포함) 오류] 계약자(개인/법인) 분기 지원 유틸
@@ -41,7 +48,7 @@ def is_corporate_name(name: str) -> bool:
     if any(k in n for k in corp_kws):
         return True
     # 괄호 안에 (주) 같은 표기/영문 Corp/Ltd 등도 법인으로 본다
-    if re.search(r"\b(CORP|CORPORATION|LTD|LIMITED|INC)\b", n, flags=re.I):
+    if _RE_CORP_SUFFIX.search(n):
         return True
     return False
 
@@ -59,7 +66,7 @@ def normalize_org_name(name: str) -> str:
     for k in ["(주)", "㈜", "주식회사", "유한회사", "재단법인", "사단법인"]:
         n2 = n2.replace(k, "")
     # 괄호/대괄호 등 제거
-    n2 = re.sub(r"[\(\)\[\]\{\}]", "", n2)
+    n2 = _RE_BRACKETS.sub("", n2)
     return n2
 
 
@@ -261,7 +268,7 @@ class KFITSmartETL:
 
     def _clean_text(self, text):
         """[전처리] 특수문자 제거 및 소문자 변환으로 매칭 정확도 향상"""
-        return re.sub(r'[^가-힣a-zA-Z0-9]', '', str(text)).lower()
+        return _RE_HEADER_STRIP.sub('', str(text)).lower()
 
     def _normalize_header(self, columns):
         """
@@ -321,7 +328,7 @@ class KFITSmartETL:
         원본 주민번호는 반환하지 않음으로써 DB 저장 자체를 원천 차단함.
         """
         if pd.isna(rrn): return None, None
-        nums = re.sub(r'[^0-9]', '', str(rrn))
+        nums = _RE_NON_DIGIT.sub('', str(rrn))
         if len(nums) < 7: return None, None # 7자리(생년월일+성별코드)만 있어도 처리 가능
         try:
             front = nums[:6]; g_code = int(nums[6])
@@ -337,10 +344,43 @@ class KFITSmartETL:
     def _clean_phone(self, val):
         """전화번호 포맷 통일 (010-XXXX-XXXX)"""
         if pd.isna(val): return None
-        s = re.sub(r'[^0-9]', '', str(val))
+        s = _RE_NON_DIGIT.sub('', str(val))
         if len(s) == 11 and s.startswith('010'): return f"{s[:3]}-{s[3:7]}-{s[7:]}"
         return str(val)
 
+    # ---------------------------------------------------------
+    # [성능] 컬럼 단위 정규화 커널
+    # - _clean_phone / _parse_rrn 을 행마다 호출하면 셀 단위 re.sub + 파이썬 분기가 반복됨
+    # - pandas 문자열 커널(str.*)로 컬럼 전체를 1회 변환하고, 행 루프는 위치 인덱스로 꺼내 쓴다
+    # - 결과는 스칼라 버전과 동일(NaN → None, 010 11자리만 하이픈 포맷, 그 외 원문 유지)
+    # ---------------------------------------------------------
+    def _clean_phone_col(self, ser):
+        """전화번호 컬럼 일괄 포맷 (스칼라 _clean_phone과 동일 규칙)"""
+        if ser is None:
+            return None
+        raw = ser.astype(str)
+        digits = raw.str.replace(r'[^0-9]', '', regex=True)
+        is_mobile = digits.str.len().eq(11) & digits.str.startswith('010')
+        fmt = digits.str[:3] + '-' + digits.str[3:7] + '-' + digits.str[7:]
+        out = raw.where(~is_mobile, fmt).astype(object)
+        out[ser.isna().to_numpy()] = None
+        return out.tolist()
+
+    def _parse_rrn_col(self, ser):
+        """주민번호 컬럼 일괄 파싱 → (birth 리스트, gender 리스트) (스칼라 _parse_rrn과 동일 규칙)"""
+        if ser is None:
+            return None, None
+        nums = ser.astype(str).str.replace(r'[^0-9]', '', regex=True)
+        g_code = nums.str[6]
+        y_pre = g_code.map({'1': '19', '2': '19', '5': '19', '6': '19', '3': '20', '4': '20', '7': '20', '8': '20'})
+        valid = ser.notna() & nums.str.len().ge(7) & y_pre.notna()
+        birth = (y_pre + nums.str[:2] + '-' + nums.str[2:4] + '-' + nums.str[4:6]).astype(object)
+        gender = g_code.map({'1': '남', '3': '남', '5': '남', '7': '남', '2': '여', '4': '여', '6': '여', '8': '여'}).astype(object)
+        mask = (~valid).to_numpy()
+        birth[mask] = None
+        gender[mask] = None
+        return birth.tolist(), gender.tolist()
+
     def process(self, df):
         """
         [ETL 실행 메인 프로세스]
@@ -360,37 +400,59 @@ class KFITSmartETL:
 
         processed_data = []
 
-        for _, row in df_renamed.iterrows():
+        # [성능] 연락처/주민번호 정규화는 컬럼 단위로 1회 선계산(행 루프에서는 위치로 조회)
+        def _col(c):
+            return df_renamed[c] if c in df_renamed.columns else None
+        phone_src = _col('contractor_phone')
+        if phone_src is None:
+            phone_src = _col('common_phone')
+        elif _col('common_phone') is not None:
+            phone_src = phone_src.where(phone_src.notna(), _col('common_phone'))
+        phone_clean = self._clean_phone_col(phone_src)
+        rrn_birth, rrn_gender = self._parse_rrn_col(_col('rrn'))
+        i_phone_clean = self._clean_phone_col(_col('insured_phone'))
+        i_rrn_birth, i_rrn_gender = self._parse_rrn_col(_col('insured_rrn'))
+
+        # [성능] iterrows(행마다 Series 생성) 대신 일반 tuple로 순회하고 컬럼→위치 맵으로 접근
+        cols = {c: i for i, c in enumerate(df_renamed.columns)}
+
+        def _get(t, c):
+            i = cols.get(c)
+            return t[i] if i is not None else None
+
+        std_keys = set(self.identity_map.keys()) | set(self.financial_map.keys())
+
+        for pos, row in enumerate(df_renamed.itertuples(index=False, name=None)):
             row_data = {}; contract_json = {}; custom_json = {}
 
             # 1. 고객 식별자 추출 (계약자 우선 정책)
-            final_name = row.get('contractor_name') if pd.notna(row.get('contractor_name')) else row.get('common_name')
+            final_name = _get(row, 'contractor_name') if pd.notna(_get(row, 'contractor_name')) else _get(row, 'common_name')
             if pd.isna(final_name): continue # 이름 없으면 유효하지 않은 데이터
             row_data['name'] = final_name
 
             # 2. 연락처 정제
-            final_phone = row.get('contractor_phone') if pd.notna(row.get('contractor_phone')) else row.get('common_phone')
-            row_data['phone'] = self._clean_phone(final_phone)
+            row_data['phone'] = phone_clean[pos] if phone_clean is not None else None
 
             # 3. 민감정보(주민번호) 안전 변환
-            b_rrn, g_rrn = self._parse_rrn(row.get('rrn'))
-            row_data['birth_date'] = b_rrn if b_rrn else row.get('birth_date')
-            row_data['gender'] = g_rrn if g_rrn else row.get('gender')
+            b_rrn = rrn_birth[pos] if rrn_birth is not None else None
+            g_rrn = rrn_gender[pos] if rrn_gender is not None else None
+            row_data['birth_date'] = b_rrn if b_rrn else _get(row, 'birth_date')
+            row_data['gender'] = g_rrn if g_rrn else _get(row, 'gender')
 
             # 4. 기타 인적사항 매핑
             for col in ['region', 'email']:
-                if col in df_renamed.columns: row_data[col] = row[col]
+                if col in cols: row_data[col] = row[cols[col]]
 
             # 5. 계약 정보 및 피보험자 상세 추출 (별도 JSON 객체로 분리)
-            i_name = row.get('insured_name')
-            i_phone = row.get('insured_phone')
-            i_rrn = row.get('insured_rrn')
+            i_name = _get(row, 'insured_name')
+            i_phone = _get(row, 'insured_phone')
 
             if pd.notna(i_name):
                 contract_json['insured_name'] = str(i_name)
-                if pd.notna(i_phone): contract_json['insured_phone'] = self._clean_phone(i_phone)
+                if pd.notna(i_phone): contract_json['insured_phone'] = i_phone_clean[pos]
                 # 피보험자 주민번호도 안전하게 생일/성별로만 변환
-                ib, ig = self._parse_rrn(i_rrn)
+                ib = i_rrn_birth[pos] if i_rrn_birth is not None else None
+                ig = i_rrn_gender[pos] if i_rrn_gender is not None else None
                 if ib: contract_json['insured_birth'] = ib
                 if ig: contract_json['insured_gender'] = ig
                 
@@ -401,14 +463,13 @@ class KFITSmartETL:
 
             # 금융 데이터 매핑
             for key in ['company', 'product_name', 'policy_no', 'premium', 'status', 'start_date', 'end_date']:
-                if key in df_renamed.columns and pd.notna(row[key]):
-                    contract_json[key] = str(row[key])
+                if key in cols and pd.notna(row[cols[key]]):
+                    contract_json[key] = str(row[cols[key]])
 
             # 6. 미매핑 데이터 처리 (비정형 데이터 보존)
-            std_keys = list(self.identity_map.keys()) + list(self.financial_map.keys())
-            for col in df_renamed.columns:
-                if col not in std_keys and pd.notna(row[col]):
-                    custom_json[col] = str(row[col])
+            for col, v in zip(df_renamed.columns, row):
+                if col not in std_keys and pd.notna(v):
+                    custom_json[col] = str(v)
 
             # 7. 최종 데이터 조립
             if custom_json: row_data['custom_data'] = json.dumps(custom_json, ensure_ascii=False)
@@ -0,0 +1,26 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# app 모듈은 import 시점에 ~/KFIT_Data 경로를 정하므로, import 전에 임시 HOME으로 격리
+os.environ["HOME"] = tempfile.mkdtemp(prefix="kfit_test_home_")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+import database  # noqa: E402
+import queries  # noqa: E402
+
+
+@pytest.fixture
+def fresh_db():
+    """테스트마다 빈 DB에서 시작 (연결 풀/프로세스 캐시 포함 초기화)"""
+    database.close_connection_pool()
+    for suffix in ("", "-wal", "-shm"):
+        path = database.DB_PATH + suffix
+        if os.path.exists(path):
+            os.remove(path)
+    database.init_db()
+    queries.clear_recent_contracts()
+    yield database
+    database.close_connection_pool()
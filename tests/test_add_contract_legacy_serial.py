@@ -0,0 +1,28 @@
+import numpy as np
+
+import database
+import queries
+
+
+def _old_import(cid):
+    """이전 정규화로 들어간 계약 재현: 숫자 serial 시작일이 '1970-01-01'로 저장·해시된 행"""
+    queries.add_contract(cid, "A생명", "종신", None, 50000, "정상", "1970-01-01", None, insured_name="홍길동")
+    queries.clear_recent_contracts()
+
+
+def test_reupload_numeric_serial_repairs_old_row(fresh_db):
+    _, _, cid = queries.upsert_customer_identity(name="홍길동", phone="010-1234-5678")
+    _old_import(cid)
+
+    for serial in (43831, np.int64(43831), 43831.0):
+        res = queries.add_contract(cid, "A생명", "종신", None, 50000, "정상", serial, None, insured_name="홍길동")
+        assert res in ("update", "same")
+
+    with database.db() as conn:
+        rows = conn.execute("SELECT start_date FROM contracts WHERE customer_id = ?", (cid,)).fetchall()
+    assert [r[0] for r in rows] == ["2020-01-01"]
+
+    # 복구된 행은 이후 문자열 날짜 업로드와도 같은 계약으로 매칭
+    queries.clear_recent_contracts()
+    assert queries.add_contract(cid, "A생명", "종신", None, 50000, "정상", "2020-01-01", None,
+                                insured_name="홍길동") == "same"
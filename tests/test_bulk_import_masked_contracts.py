@@ -0,0 +1,41 @@
+import pandas as pd
+
+import database
+import queries
+
+
+def test_masked_import_commits_in_batches(fresh_db, monkeypatch):
+    """마스킹 계약 일괄 반영은 행마다가 아니라 _CONTRACT_COMMIT_EVERY 행마다 커밋되어야 함"""
+    n = 120
+    for i in range(n):
+        queries.upsert_customer_identity(name=f"홍길{i:03d}", phone=f"010-{2000 + i:04d}-{3000 + i:04d}")
+
+    commits = []
+    in_tx = []
+    orig_commit = database._KfitPooledConnection.commit
+    orig_savepoint = queries._add_contract_savepoint
+
+    def counting_commit(self):
+        commits.append(1)
+        return orig_commit(self)
+
+    def checking_savepoint(cur, **kwargs):
+        in_tx.append(cur.connection.in_transaction)
+        res = orig_savepoint(cur, **kwargs)
+        in_tx.append(cur.connection.in_transaction)
+        return res
+
+    monkeypatch.setattr(database._KfitPooledConnection, "commit", counting_commit)
+    monkeypatch.setattr(queries, "_add_contract_savepoint", checking_savepoint)
+    monkeypatch.setattr(queries, "_CONTRACT_COMMIT_EVERY", 50)
+
+    df = pd.DataFrame([
+        {"이름": f"홍길{i:03d}", "연락처": f"010-****-{3000 + i:04d}",
+         "보험사": "A", "상품명": "p", "증권번호": f"M{i}", "보험료": "1,000", "계약일": "2022-01-01"}
+        for i in range(n)
+    ])
+    ok, _msg, stats = queries.bulk_import_masked_contracts(df)
+    assert ok
+    assert stats["new_cont"] == n
+    assert in_tx and all(in_tx)
+    assert len(commits) <= n // 50 + 1
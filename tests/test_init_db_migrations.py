@@ -0,0 +1,50 @@
+import sqlite3
+
+import database
+import queries
+
+
+def _raw(sql, params=()):
+    conn = sqlite3.connect(database.DB_PATH)
+    try:
+        rows = conn.execute(sql, params).fetchall()
+        conn.commit()
+        return rows
+    finally:
+        conn.close()
+
+
+def _seed_contract():
+    _, _, cid = queries.upsert_customer_identity(name="홍길동", phone="010-1234-5678")
+    queries.add_contract(cid, "A생명", "종신", "P-1", 50000, "정상", "2020-01-01", None, insured_name="홍길동")
+    database.close_connection_pool()
+
+
+def test_sha1_rehash_runs_once(fresh_db):
+    _seed_contract()
+    _raw("UPDATE contracts SET key_hash = ?, stable_hash = ?, content_hash = ?", ("a" * 40, "b" * 40, "c" * 40))
+    _raw("PRAGMA user_version = 0")
+
+    database.init_db()
+    (kh, sh, ch), = _raw("SELECT key_hash, stable_hash, content_hash FROM contracts")
+    assert all(isinstance(v, bytes) and len(v) == 16 for v in (kh, sh, ch))
+    assert _raw("PRAGMA user_version")[0][0] == database._CONTRACT_HASH_SCHEMA_VERSION
+
+    # 마이그레이션 완료 후 남은(충돌 등으로 못 옮긴) 40자 값은 매 init_db마다 다시 손대지 않음
+    _raw("UPDATE contracts SET key_hash = ?", ("a" * 40,))
+    database.init_db()
+    assert _raw("SELECT key_hash FROM contracts")[0][0] == "a" * 40
+
+
+def test_hex_to_blob_runs_once(fresh_db):
+    _seed_contract()
+    _raw("UPDATE contracts SET key_hash = lower(hex(key_hash)), stable_hash = lower(hex(stable_hash)), "
+         "content_hash = lower(hex(content_hash))")
+    database.init_db()
+    # 이미 user_version 단계를 지난 DB는 hex 값을 다시 스캔/변환하지 않음
+    assert _raw("SELECT typeof(key_hash) FROM contracts")[0][0] == "text"
+
+    _raw("PRAGMA user_version = 0")
+    database.init_db()
+    assert _raw("SELECT typeof(key_hash), typeof(stable_hash), typeof(content_hash) FROM contracts")[0] == \
+        ("blob", "blob", "blob")
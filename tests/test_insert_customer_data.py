@@ -0,0 +1,54 @@
+import pandas as pd
+
+import database
+import queries
+
+
+def _rows(n):
+    return pd.DataFrame([
+        {
+            "name": f"고객{i}",
+            "phone": f"010-{1000 + i // 100:04d}-{i % 10000:04d}",
+            "birth_date": "1980-01-01",
+            "financial": {"company": "A", "product_name": "p", "policy_no": f"P{i}", "premium": 1000,
+                          "status": "정상", "start_date": "2020-01-01"},
+        }
+        for i in range(n)
+    ])
+
+
+def test_contract_stage_commits_in_batches(fresh_db, monkeypatch):
+    """계약 단계는 행마다가 아니라 _CONTRACT_COMMIT_EVERY 행마다 커밋되어야 함"""
+    commits = []
+    in_tx = []
+    orig_commit = database._KfitPooledConnection.commit
+    orig_savepoint = queries._add_contract_savepoint
+
+    def counting_commit(self):
+        commits.append(1)
+        return orig_commit(self)
+
+    def checking_savepoint(cur, **kwargs):
+        in_tx.append(cur.connection.in_transaction)
+        res = orig_savepoint(cur, **kwargs)
+        # RELEASE가 트랜잭션을 끝내(=커밋) 버리면 안 됨
+        in_tx.append(cur.connection.in_transaction)
+        return res
+
+    monkeypatch.setattr(database._KfitPooledConnection, "commit", counting_commit)
+    monkeypatch.setattr(queries, "_add_contract_savepoint", checking_savepoint)
+    monkeypatch.setattr(queries, "_CONTRACT_COMMIT_EVERY", 50)
+
+    n = 120
+    ok, _msg, stats = queries.insert_customer_data(_rows(n))
+    assert ok
+    assert stats["new_cont"] == n
+    assert in_tx and all(in_tx)
+    # 고객 단계 1회 + 계약 단계 50/100행 배치 2회 + 마지막 1회
+    assert len(commits) <= 1 + n // 50 + 1
+
+    conn = database.get_connection()
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM contracts").fetchone()[0] == n
+    finally:
+        conn.close()
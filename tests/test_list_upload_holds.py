@@ -0,0 +1,23 @@
+import json
+
+import database
+import queries
+
+
+def test_normalized_matches_stored_payload(fresh_db):
+    rows = [
+        {"seq": 1, "row_status": "보류", "name": "홍 길동", "phone": "010-1234-5678", "birth_date": "1980-01-01",
+         "customer_reason": "동명이인"},
+        {"seq": 2, "row_status": "보류", "name": "김철수", "phone": "", "birth_date": "", "customer_reason": "연락처 없음"},
+    ]
+    assert queries.sync_upload_holds("f" * 16, "a.xlsx", rows) == 2
+
+    holds = queries.list_upload_holds(statuses=["ALL"])
+    with database.db() as conn:
+        stored = dict(conn.execute("SELECT id, normalized_json FROM upload_holds").fetchall())
+    assert len(holds) == 2
+    for h in holds:
+        # 목록의 normalized는 저장된 normalized_json 전체(get_upload_hold/이전 목록 조회와 같은 dict)
+        assert h["normalized"] == json.loads(stored[h["id"]])
+        assert set(h["normalized"]) == {"name_norm", "phone_norm", "birth_date"}
+    assert {h["display_name"] for h in holds} == {"홍 길동", "김철수"}